@@ -4,6 +4,8 @@ import torch
 import os
 import logging
 
+from src.utils.environment import CUDA_ALLOC_CONF
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,7 +25,7 @@ class DeviceManager:
         try:
             # RTX 3060 memory optimizations
             torch.cuda.set_per_process_memory_fraction(0.75)
-            os.environ['PYTORCH_CUDA_ALLOC_CONF'] = 'max_split_size_mb:32'
+            os.environ.setdefault('PYTORCH_CUDA_ALLOC_CONF', CUDA_ALLOC_CONF)
 
             # Enable memory recording for debugging[1]
             if hasattr(torch.cuda.memory, '_record_memory_history'):
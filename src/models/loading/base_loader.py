@@ -13,6 +13,8 @@ from transformers import (
 from peft import prepare_model_for_kbit_training
 from typing import Tuple, Dict, Any
 
+from src.utils.environment import CUDA_ALLOC_CONF
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,15 +29,17 @@ class BaseModelLoader:
     def _setup_optimizations(self):
         """Setup device-specific optimizations"""
         if self.rtx3060_detected:
-            # RTX 3060 memory optimizations
-            os.environ['PYTORCH_CUDA_ALLOC_CONF'] = 'max_split_size_mb:32'
+            # RTX 3060 memory optimizations (an allocator config chosen by the caller wins)
+            os.environ.setdefault('PYTORCH_CUDA_ALLOC_CONF', CUDA_ALLOC_CONF)
             logger.debug("🔧 RTX 3060 loading optimizations applied")
 
     def load_base_model(
             self,
             model_name: str,
             use_quantization: bool = True,
-            use_auto_device_map: bool = True
+            use_auto_device_map: bool = True,
+            use_double_quant: bool = True,
+            prepare_for_kbit: bool = True
     ) -> Tuple[torch.nn.Module, AutoTokenizer]:
         """
         Load base model following HuggingFace patterns[5]
@@ -52,13 +56,13 @@ class BaseModelLoader:
             tokenizer = self._load_tokenizer(model_name)
 
             # Configure model loading
-            model_kwargs = self._get_model_kwargs(use_quantization, use_auto_device_map)
+            model_kwargs = self._get_model_kwargs(use_quantization, use_auto_device_map, use_double_quant)
 
             # Load model with error handling
             model = AutoModelForCausalLM.from_pretrained(model_name, **model_kwargs)
 
             # Post-loading optimizations
-            model = self._post_loading_optimizations(model, use_quantization)
+            model = self._post_loading_optimizations(model, use_quantization and prepare_for_kbit)
 
             logger.info(f"✅ Model loaded successfully on {next(model.parameters()).device}")
             return model, tokenizer
@@ -81,7 +85,8 @@ class BaseModelLoader:
 
         return tokenizer
 
-    def _get_model_kwargs(self, use_quantization: bool, use_auto_device_map: bool) -> Dict[str, Any]:
+    def _get_model_kwargs(self, use_quantization: bool, use_auto_device_map: bool,
+                          use_double_quant: bool = True) -> Dict[str, Any]:
         """Get model loading configuration"""
         model_kwargs = {
             'use_cache': False,
@@ -95,7 +100,7 @@ class BaseModelLoader:
                     load_in_4bit=True,
                     bnb_4bit_compute_dtype=torch.bfloat16,
                     bnb_4bit_quant_type='nf4',
-                    bnb_4bit_use_double_quant=True
+                    bnb_4bit_use_double_quant=use_double_quant
                 )
                 logger.info("🔧 4-bit quantization configured")
             else:
@@ -107,7 +112,7 @@ class BaseModelLoader:
 
         return model_kwargs
 
-    def _post_loading_optimizations(self, model, use_quantization: bool):
+    def _post_loading_optimizations(self, model, prepare_for_kbit: bool):
         """Apply post-loading optimizations"""
         # Meta tensor fix
         if hasattr(model, 'parameters'):
@@ -117,8 +122,8 @@ class BaseModelLoader:
                     model = model.to_empty(device=self.device)
                     break
 
-        # K-bit training preparation
-        if use_quantization:
+        # K-bit training preparation (upcasts norms and lm_head to fp32)
+        if prepare_for_kbit:
             model = prepare_model_for_kbit_training(model, use_gradient_checkpointing=True)
             logger.debug("🔧 Model prepared for k-bit training")
 
@@ -16,9 +16,10 @@ class ModelCache:
         self._lock = Lock()
         self._max_cache_size = 3  # Maximum models to cache
 
-    def get_cache_key(self, model_name: str, quantization: bool = True) -> str:
+    def get_cache_key(self, model_name: str, quantization: bool = True, double_quant: bool = True,
+                      kbit_prepared: bool = True) -> str:
         """Generate cache key for model"""
-        return f"{model_name}_quant_{quantization}"
+        return f"{model_name}_quant_{quantization}_dq_{double_quant}_kbit_{kbit_prepared}"
 
     def get_cached_model(self, cache_key: str) -> Optional[Tuple[Any, Any]]:
         """Get model from cache if available"""
@@ -76,7 +76,10 @@ class ModelLoader:
             self,
             model_name: str,
             use_quantization: bool = True,
-            use_cache: bool = True
+            use_cache: bool = True,
+            use_auto_device_map: bool = True,
+            use_double_quant: bool = True,
+            prepare_for_kbit: bool = True
     ) -> Tuple[torch.nn.Module, Any]:
         """
         Load base model following 2025 best practices[1]
@@ -85,6 +88,9 @@ class ModelLoader:
             model_name: HuggingFace model name
             use_quantization: Enable quantization (forced for RTX 3060)
             use_cache: Use model caching
+            use_auto_device_map: Let accelerate place the model (device_map='auto')
+            use_double_quant: Quantize the 4-bit quantization constants as well (QLoRA)
+            prepare_for_kbit: Run prepare_model_for_kbit_training (upcasts norms/lm_head to fp32)
 
         Returns:
             Tuple of (model, tokenizer)
@@ -93,7 +99,8 @@ class ModelLoader:
 
         # Check cache first if enabled
         if use_cache:
-            cache_key = self.model_cache.get_cache_key(model_name, use_quantization)
+            cache_key = self.model_cache.get_cache_key(model_name, use_quantization, use_double_quant,
+                                                       prepare_for_kbit)
             cached_result = self.model_cache.get_cached_model(cache_key)
 
             if cached_result:
@@ -105,7 +112,9 @@ class ModelLoader:
             model, tokenizer = self.base_loader.load_base_model(
                 model_name,
                 use_quantization=use_quantization,
-                use_auto_device_map=True
+                use_auto_device_map=use_auto_device_map,
+                use_double_quant=use_double_quant,
+                prepare_for_kbit=prepare_for_kbit
             )
 
             # Cache the result if caching enabled
@@ -14,9 +14,47 @@ from urllib.parse import quote_plus, urljoin
 from bs4 import BeautifulSoup
 import time
 from datetime import datetime
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+# İçerik kalite skorunda aranan programlama anahtar kelimeleri (her biri +0.2, en fazla +1.0)
+_CONTENT_PROGRAMMING_KEYWORDS = ('function', 'class', 'method', 'variable', 'array', 'object', 'import', 'return')
+_CONTENT_KEYWORD_CAP = 5
+
+# Sorgu sınıflandırma anahtar kelimeleri (alt dize eşleşmesi)
+_CODE_SEARCH_KEYWORDS = frozenset({'example', 'code', 'implementation', 'tutorial', 'how to'})
+_WEB_TECH_KEYWORDS = frozenset({'html', 'css', 'javascript', 'react', 'vue', 'angular'})
+_ANDROID_KEYWORDS = frozenset({'android', 'java'})
+_CARD_KEYWORDS = frozenset({'kart', 'card', 'profil', 'profile'})
+_SHINGLE_LENGTHS = tuple(sorted({
+    len(keyword)
+    for keywords in (_CODE_SEARCH_KEYWORDS, _WEB_TECH_KEYWORDS, _ANDROID_KEYWORDS, _CARD_KEYWORDS)
+    for keyword in keywords
+}))
+
+
+@lru_cache(maxsize=256)
+def _query_shingles(query_lower: str) -> frozenset:
+    """Sorgunun anahtar kelime uzunluklarındaki tüm alt dizeleri (tek geçiş)"""
+    # Her anahtar kelime kontrolü bir alt dize taraması yerine tek hash araması olur
+    return frozenset(
+        query_lower[i:i + n]
+        for n in _SHINGLE_LENGTHS
+        for i in range(len(query_lower) - n + 1)
+    )
+
+
+def _count_keyword_hits(text_lower: str, keywords: tuple, cap: int) -> int:
+    """Anahtar kelime eşleşmelerini say; üst sınıra ulaşınca taramayı bırak"""
+    hits = 0
+    for keyword in keywords:
+        if keyword in text_lower:
+            hits += 1
+            if hits >= cap:
+                break
+    return hits
+
 
 class EnhancedWebSearchSystem:
     """
@@ -158,24 +196,16 @@ class EnhancedWebSearchSystem:
     
     def _is_code_search(self, query: str) -> bool:
         """Kod araması mı kontrol et"""
-        code_keywords = ['example', 'code', 'implementation', 'tutorial', 'how to']
-        return any(keyword in query.lower() for keyword in code_keywords)
+        return not _CODE_SEARCH_KEYWORDS.isdisjoint(_query_shingles(query.lower()))
     
     def _is_web_tech_search(self, query: str) -> bool:
         """Web teknolojisi araması mı kontrol et"""
-        web_keywords = ['html', 'css', 'javascript', 'react', 'vue', 'angular']
-        return any(keyword in query.lower() for keyword in web_keywords)
+        return not _WEB_TECH_KEYWORDS.isdisjoint(_query_shingles(query.lower()))
     
     def _is_android_card_question(self, query: str) -> bool:
         """Android kart oluşturma sorusu mu kontrol et"""
-        query_lower = query.lower()
-        android_keywords = ['android', 'java']
-        card_keywords = ['kart', 'card', 'profil', 'profile']
-        
-        has_android = any(keyword in query_lower for keyword in android_keywords)
-        has_card = any(keyword in query_lower for keyword in card_keywords)
-        
-        return has_android and has_card
+        shingles = _query_shingles(query.lower())
+        return not _ANDROID_KEYWORDS.isdisjoint(shingles) and not _CARD_KEYWORDS.isdisjoint(shingles)
     
     async def _search_android_card_creation(self, query: str, max_results: int = 3) -> List[Dict]:
         """Android kart oluşturma için özel arama"""
@@ -654,8 +684,9 @@ class EnhancedWebSearchSystem:
                     base_score += 1.5
                 
                 # Programlama anahtar kelimeleri
-                programming_keywords = ['function', 'class', 'method', 'variable', 'array', 'object', 'import', 'return']
-                keyword_count = sum(1 for keyword in programming_keywords if keyword in content.lower())
+                keyword_count = _count_keyword_hits(
+                    content.lower(), _CONTENT_PROGRAMMING_KEYWORDS, _CONTENT_KEYWORD_CAP
+                )
                 base_score += min(keyword_count * 0.2, 1.0)
             
             # Başlık kalitesi
@@ -0,0 +1,23 @@
+"""
+🌐 Shared HTTP helpers for the research scrapers
+"""
+
+
+async def read_body_capped(response, limit: int) -> bytes:
+    """Read at most `limit` bytes of an aiohttp response body"""
+    # ✅ StreamReader.read(n) returns whatever is buffered, so loop until EOF or the cap
+    chunks = []
+    remaining = limit
+    while remaining > 0:
+        chunk = await response.content.read(remaining)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b''.join(chunks)
+
+
+async def read_text_capped(response, limit: int) -> str:
+    """Read at most `limit` bytes of an aiohttp response body and decode it"""
+    raw = await read_body_capped(response, limit)
+    return raw.decode(response.charset or 'utf-8', errors='replace')
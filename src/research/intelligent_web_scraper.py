@@ -6,21 +6,123 @@ Fixed session management and browser fingerprinting
 
 import asyncio
 import aiohttp
+import aiofiles
 import logging
 import random
 import json
 import time
+import hashlib
+import html as html_lib
+import re
+from collections import OrderedDict
 from datetime import datetime
 from typing import List, Dict, Optional
 from bs4 import BeautifulSoup
 from pathlib import Path
-import threading
 import warnings
 from urllib.parse import quote_plus
 
 warnings.filterwarnings("ignore")
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# ✅ Full-jitter exponential backoff (seconds)
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 30.0
+
+# ✅ In-process fetch/extraction cache
+CACHE_TTL = 600
+CACHE_MAX_ENTRIES = 256
+
+# ✅ Topics researched in parallel (limit_per_host=1 keeps each origin polite)
+RESEARCH_CONCURRENCY = 4
+
+# ✅ Content selectors in priority order, combined into one CSS union (single tree traversal)
+CONTENT_SELECTORS = ('main', 'article', '.content', '#content', 'pre', 'code')
+CONTENT_SELECTOR = ', '.join(CONTENT_SELECTORS)
+
+# ✅ Lightweight anchor scanner for search engine pages (no DOM build)
+_ANCHOR_RE = re.compile(r'<a\b[^>]*?\shref\s*=\s*(["\'])(.*?)\1[^>]*>(.*?)</a>', re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r'<[^>]+>')
+_EDU_DOMAINS = frozenset(('github', 'stackoverflow', 'medium', 'tutorial', 'guide'))
+_EDU_RE = re.compile('|'.join(sorted(_EDU_DOMAINS)), re.IGNORECASE)
+
+# ✅ URL templates, filled with quote_plus(f"python {topic}")
+_SEARCH_URL_TPLS = (
+    "https://duckduckgo.com/html/?q={q}&ia=web",
+    "https://www.startpage.com/sp/search?query={q}&t=device",
+)
+_EDU_URL_TPLS = (
+    "https://github.com/search?q={q}&type=repositories",
+    "https://stackoverflow.com/search?q={q}",
+    "https://medium.com/search?q={q}",
+)
+
+
+def _scan_result_links(page: str, max_anchors: int = 5) -> List[Dict]:
+    """Extract educational result links from the first `max_anchors` anchors of a search page"""
+    results = []
+    for i, match in enumerate(_ANCHOR_RE.finditer(page)):
+        if i >= max_anchors:
+            break
+        href = html_lib.unescape(match.group(2))
+        title = html_lib.unescape(_TAG_RE.sub('', match.group(3))).strip()
+        if href.startswith('http') and len(title) > 15 and _EDU_RE.search(href):
+            results.append({'url': href, 'title': title[:100], 'source': 'search'})
+    return results
+
+
+# ✅ Per-second timestamp cache: [epoch_second, iso_string, "%H:%M" string]
+_TS_CACHE = [0, "", ""]
+
+
+def _refresh_ts_cache():
+    """Reformat the cached timestamps when the epoch second has changed"""
+    now = int(time.time())
+    if now != _TS_CACHE[0]:
+        dt = datetime.fromtimestamp(now)
+        _TS_CACHE[:] = [now, dt.isoformat(timespec='seconds'), dt.strftime("%H:%M")]
+
+
+def _iso_now() -> str:
+    """Current local time as ISO-8601 (seconds), formatted at most once per second"""
+    _refresh_ts_cache()
+    return _TS_CACHE[1]
+
+
+def _hhmm_now() -> str:
+    """Current local time as HH:MM, formatted at most once per second"""
+    _refresh_ts_cache()
+    return _TS_CACHE[2]
+
+
+def _selector_keys(elem) -> List[str]:
+    """Map an element matched by CONTENT_SELECTOR back to every selector it satisfies"""
+    keys = [elem.name] if elem.name in ('main', 'article', 'pre', 'code') else []
+    if 'content' in (elem.get('class') or ()):
+        keys.append('.content')
+    if elem.get('id') == 'content':
+        keys.append('#content')
+    return keys
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Full-jitter backoff: uniform(0, min(cap, base * 2^attempt))"""
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * (2 ** attempt)))
+
+
+def _retry_delay(retry_after: Optional[str], attempt: int) -> float:
+    """Honour a numeric Retry-After header (capped), else full-jitter backoff"""
+    try:
+        return max(0.0, min(BACKOFF_CAP, float(retry_after)))
+    except (TypeError, ValueError):
+        return _backoff_delay(attempt)
+
 
 class ModernWebScraper:
     """Search results[1][5]: Modern web scraper with proper session management"""
@@ -28,7 +130,6 @@ class ModernWebScraper:
     def __init__(self, flet_version: str = "0.28.3"):
         logger.info(f"🤖 Initializing Modern Web Scraper for Flet {flet_version}")
 
-        self._lock = threading.Lock()
         self.learning_active = False
         self.session = None
 
@@ -46,6 +147,11 @@ class ModernWebScraper:
         self.topics_completed = 0
         self.total_examples = 0
         self.cycles_completed = 0
+        self._active_topics = 0
+
+        # ✅ LRU caches: url -> (expiry, html), html digest -> extracted content
+        self._url_cache = OrderedDict()
+        self._content_cache = OrderedDict()
 
         # ✅ Search results[1][5]: Modern browser fingerprinting
         self._headers = {
@@ -111,9 +217,36 @@ class ModernWebScraper:
         except Exception as e:
             logger.debug(f"Session cleanup error: {e}")
 
-    async def fetch_url(self, url: str, max_retries: int = 2) -> Optional[str]:
+    @staticmethod
+    def _cache_get(cache: OrderedDict, key):
+        """Return a live cache entry and mark it most recently used"""
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        expiry, value = entry
+        if expiry < time.monotonic():
+            del cache[key]
+            return None
+        cache.move_to_end(key)
+        return value
+
+    @staticmethod
+    def _cache_put(cache: OrderedDict, key, value):
+        """Store a value, evicting the least recently used entry when full"""
+        cache[key] = (time.monotonic() + CACHE_TTL, value)
+        cache.move_to_end(key)
+        if len(cache) > CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
+
+    async def fetch_url(self, url: str, max_retries: int = 4) -> Optional[str]:
         """Search results[1][5]: Modern fetch with proper error handling"""
 
+        # ✅ Cache lookups never await, so they are atomic on the event loop
+        cached = self._cache_get(self._url_cache, url)
+        if cached is not None:
+            logger.debug(f"📦 Cache hit for {url[:50]}")
+            return cached
+
         for attempt in range(max_retries):
             try:
                 # ✅ Ensure session is ready
@@ -131,24 +264,27 @@ class ModernWebScraper:
                     if response.status == 200:
                         content = await response.text()
                         logger.debug(f"✅ Successfully fetched {len(content)} chars")
+                        self._cache_put(self._url_cache, url, content)
                         return content
                     elif response.status == 403:
                         logger.debug(f"🚫 Access forbidden: {url}")
                         return None
-                    elif response.status == 429:
-                        wait_time = (2 ** attempt) * random.uniform(2, 4)
-                        logger.debug(f"⏱️ Rate limited, waiting {wait_time:.1f}s")
+                    elif response.status == 429 or response.status == 503:
+                        wait_time = _retry_delay(response.headers.get('Retry-After'), attempt)
+                        logger.debug(f"⏱️ HTTP {response.status}, retrying in {wait_time:.1f}s")
                         await asyncio.sleep(wait_time)
                     else:
-                        logger.debug(f"⚠️ HTTP {response.status}: {url}")
+                        wait_time = _backoff_delay(attempt)
+                        logger.debug(f"⚠️ HTTP {response.status}: {url}, retrying in {wait_time:.1f}s")
+                        await asyncio.sleep(wait_time)
 
             except asyncio.TimeoutError:
                 logger.debug(f"⏰ Timeout for {url} (attempt {attempt + 1})")
-                await asyncio.sleep(2)
+                await asyncio.sleep(_backoff_delay(attempt))
 
             except Exception as e:
                 logger.debug(f"❌ Request error: {str(e)[:100]} (attempt {attempt + 1})")
-                await asyncio.sleep(1)
+                await asyncio.sleep(_backoff_delay(attempt))
 
         logger.debug(f"❌ Failed to fetch {url} after {max_retries} attempts")
         return None
@@ -161,32 +297,15 @@ class ModernWebScraper:
             logger.info(f"🔍 Searching for: {topic}")
 
             # ✅ Search results[2]: Try different search strategies
-            search_urls = [
-                f"https://duckduckgo.com/html/?q={quote_plus(f'python {topic}')}&ia=web",
-                f"https://www.startpage.com/sp/search?query={quote_plus(f'python {topic}')}&t=device"
-            ]
+            q = quote_plus(f'python {topic}')
+            search_urls = [tpl.format(q=q) for tpl in _SEARCH_URL_TPLS]
 
             for search_url in search_urls:
                 try:
                     html = await self.fetch_url(search_url)
                     if html:
-                        # ✅ Extract search results
-                        soup = BeautifulSoup(html, 'html.parser')
-
-                        # ✅ Look for result links
-                        for link in soup.find_all('a', href=True)[:5]:
-                            href = link.get('href', '')
-                            title = link.get_text().strip()
-
-                            if (href.startswith('http') and title and len(title) > 15 and
-                                    any(edu in href.lower() for edu in
-                                        ['github', 'stackoverflow', 'medium', 'tutorial', 'guide'])):
-                                results.append({
-                                    'url': href,
-                                    'title': title[:100],
-                                    'source': 'search'
-                                })
-
+                        # ✅ Regex scan of the raw page, first 5 anchors only (no DOM build)
+                        results = _scan_result_links(html)
                         if results:
                             break
 
@@ -200,7 +319,7 @@ class ModernWebScraper:
             # ✅ Search results[2]: Fallback to direct educational URLs
             if not results:
                 logger.info("🔄 Using direct educational sources")
-                results = await self._get_educational_sources(topic)
+                results = self._get_educational_sources(topic)
 
             logger.info(f"✅ Found {len(results)} search results")
             return results
@@ -209,18 +328,15 @@ class ModernWebScraper:
             logger.error(f"❌ Search failed: {e}")
             return []
 
-    async def _get_educational_sources(self, topic: str) -> List[Dict]:
+    def _get_educational_sources(self, topic: str) -> List[Dict]:
         """Search results[2]: Direct educational content sources"""
         educational_sources = []
 
         # ✅ Educational URL patterns
-        base_urls = [
-            f"https://github.com/search?q={quote_plus(f'python {topic}')}&type=repositories",
-            f"https://stackoverflow.com/search?q={quote_plus(f'python {topic}')}",
-            f"https://medium.com/search?q={quote_plus(f'python {topic}')}"
-        ]
+        q = quote_plus(f'python {topic}')
 
-        for url in base_urls[:2]:  # Limit to 2 sources
+        for tpl in _EDU_URL_TPLS[:2]:  # Limit to 2 sources
+            url = tpl.format(q=q)
             try:
                 educational_sources.append({
                     'url': url,
@@ -239,47 +355,68 @@ class ModernWebScraper:
             if not html:
                 return ""
 
-            soup = BeautifulSoup(html, 'html.parser')
-
-            # ✅ Remove unwanted elements
-            for element in soup(['script', 'style', 'nav', 'footer', 'header']):
-                element.decompose()
+            # ✅ Identical HTML served under different URLs is parsed once
+            digest = hashlib.blake2b(html.encode('utf-8', 'ignore'), digest_size=8).digest()
+            cached = self._cache_get(self._content_cache, digest)
+            if cached is not None:
+                return cached
 
-            # ✅ Extract meaningful content
-            content_selectors = ['main', 'article', '.content', '#content', 'pre', 'code']
-            content = ""
-
-            for selector in content_selectors:
-                elements = soup.select(selector)
-                for elem in elements[:3]:
-                    text = elem.get_text().strip()
-                    if len(text) > 50:
-                        content += text + "\n\n"
-                if len(content) > 500:
-                    break
-
-            # ✅ Clean text
-            content = ' '.join(content.split())
-            return content[:2000] if content else ""
+            content = self._parse_content(html)
+            self._cache_put(self._content_cache, digest, content)
+            return content
 
         except Exception as e:
             logger.debug(f"Content extraction failed: {e}")
             return ""
 
+    def _parse_content(self, html: str) -> str:
+        """Extract the main readable text from an HTML page"""
+        soup = BeautifulSoup(html, 'html.parser')
+
+        # ✅ Remove unwanted elements
+        for element in soup(['script', 'style', 'nav', 'footer', 'header']):
+            element.decompose()
+
+        # ✅ One traversal, grouped by selector (document order within each group)
+        grouped = {selector: [] for selector in CONTENT_SELECTORS}
+        for elem in soup.select(CONTENT_SELECTOR):
+            for key in _selector_keys(elem):
+                grouped[key].append(elem)
+
+        # ✅ Extract meaningful content in selector priority order (max 3 elements per selector)
+        parts = []
+        total = 0
+
+        for selector in CONTENT_SELECTORS:
+            for elem in grouped[selector][:3]:
+                text = elem.get_text().strip()
+                if len(text) > 50:
+                    parts.append(text)
+                    total += len(text) + 2
+            if total > 500:
+                break
+
+        # ✅ Clean text
+        content = ' '.join('\n\n'.join(parts).split())
+        return content[:2000] if content else ""
+
     async def research_and_generate_examples(self, topic: str) -> List[Dict]:
         """Main research function with modern approach"""
+        # ✅ Reuse a shared session when one is open (parallel topic research)
+        owns_session = not self.session or self.session.closed
         try:
-            with self._lock:
-                self.learning_active = True
+            self._active_topics += 1
+            self.learning_active = True
 
             logger.info(f"🔍 Researching topic: {topic}")
             start_time = time.time()
 
             # ✅ Initialize session first
-            success = await self.initialize_session()
-            if not success:
-                logger.error("❌ Failed to initialize session")
-                return []
+            if owns_session:
+                success = await self.initialize_session()
+                if not success:
+                    logger.error("❌ Failed to initialize session")
+                    return []
 
             # ✅ Search for topic
             search_results = await self.search_topic(topic)
@@ -302,7 +439,7 @@ class ModernWebScraper:
                             "source": result['url'],
                             "title": result['title'],
                             "topic": topic,
-                            "timestamp": datetime.now().isoformat(),
+                            "timestamp": _iso_now(),
                             "auto_generated": True,
                             "content_length": len(content),
                             "quality_score": 0.8,
@@ -316,18 +453,17 @@ class ModernWebScraper:
                     logger.debug(f"Failed to process result: {e}")
                     continue
 
-            # ✅ Update stats
-            with self._lock:
-                self.topics_completed += 1
-                self.total_examples += len(examples)
-                self.cycles_completed += 1
-                self.stats.update({
-                    'topics_researched': self.topics_completed,
-                    'auto_generated_examples': self.total_examples,
-                    'learning_cycles': self.cycles_completed,
-                    'last_scan': datetime.now().strftime("%H:%M"),
-                    'status': 'Active'
-                })
+            # ✅ Update stats (single event-loop thread, no await in between)
+            self.topics_completed += 1
+            self.total_examples += len(examples)
+            self.cycles_completed += 1
+            self.stats.update({
+                'topics_researched': self.topics_completed,
+                'auto_generated_examples': self.total_examples,
+                'learning_cycles': self.cycles_completed,
+                'last_scan': _hhmm_now(),
+                'status': 'Active'
+            })
 
             # ✅ Save examples
             if examples:
@@ -342,8 +478,10 @@ class ModernWebScraper:
             logger.error(f"❌ Research failed for {topic}: {e}")
             return []
         finally:
-            await self.cleanup_session()
-            with self._lock:
+            if owns_session:
+                await self.cleanup_session()
+            self._active_topics -= 1
+            if self._active_topics == 0:
                 self.learning_active = False
 
     async def _save_examples(self, topic: str, examples: List[Dict]):
@@ -352,9 +490,16 @@ class ModernWebScraper:
             dataset_file = Path("datasets/conversations/autonomous_research.jsonl")
             dataset_file.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(dataset_file, 'a', encoding='utf-8') as f:
-                for example in examples:
-                    f.write(json.dumps(example, ensure_ascii=False) + '\n')
+            # ✅ Serialize the whole batch once, then a single non-blocking append
+            if ORJSON_AVAILABLE:
+                payload = b'\n'.join(orjson.dumps(example) for example in examples) + b'\n'
+            else:
+                payload = ''.join(
+                    json.dumps(example, ensure_ascii=False) + '\n' for example in examples
+                ).encode('utf-8')
+
+            async with aiofiles.open(dataset_file, 'ab') as f:
+                await f.write(payload)
 
             logger.info(f"💾 Saved {len(examples)} examples for {topic}")
 
@@ -399,26 +544,24 @@ class ModernWebScraper:
 
     def stop_autonomous_learning(self):
         """Stop learning safely"""
-        with self._lock:
-            self.learning_active = False
-            logger.info("⏹️ Learning stopped")
+        self.learning_active = False
+        logger.info("⏹️ Learning stopped")
 
     def get_research_stats(self) -> dict:
         """Get current stats"""
-        with self._lock:
-            base_quality = 75
-            progress_bonus = min(20, self.topics_completed * 3)
-            quality_score = min(100, base_quality + progress_bonus)
-
-            return {
-                'topics_researched': self.stats['topics_researched'],
-                'knowledge_nodes': self.total_examples,
-                'auto_generated_examples': self.stats['auto_generated_examples'],
-                'learning_cycles': self.stats['learning_cycles'],
-                'last_scan': self.stats['last_scan'],
-                'status': 'Learning' if self.learning_active else 'Idle',
-                'quality_score': f"{int(quality_score)}%"
-            }
+        base_quality = 75
+        progress_bonus = min(20, self.topics_completed * 3)
+        quality_score = min(100, base_quality + progress_bonus)
+
+        return {
+            'topics_researched': self.stats['topics_researched'],
+            'knowledge_nodes': self.total_examples,
+            'auto_generated_examples': self.stats['auto_generated_examples'],
+            'learning_cycles': self.stats['learning_cycles'],
+            'last_scan': self.stats['last_scan'],
+            'status': 'Learning' if self.learning_active else 'Idle',
+            'quality_score': f"{int(quality_score)}%"
+        }
 
     async def start_autonomous_research(self):
         """Start autonomous research"""
@@ -426,17 +569,30 @@ class ModernWebScraper:
             topics = self.load_user_topics()
             logger.info(f"🚀 Starting research for {len(topics)} topics")
 
-            for topic in topics:
-                try:
-                    examples = await self.research_and_generate_examples(topic)
-                    logger.info(f"✅ Completed {topic}: {len(examples)} examples")
+            # ✅ One shared session for every topic in this run
+            if not await self.initialize_session():
+                logger.error("❌ Failed to initialize session")
+                return
 
-                    # ✅ Long delay between topics
+            semaphore = asyncio.Semaphore(RESEARCH_CONCURRENCY)
+
+            async def run(topic: str) -> List[Dict]:
+                async with semaphore:
+                    examples = await self.research_and_generate_examples(topic)
+                    # ✅ Long delay between topics, still holding the slot so each worker stays polite
                     await asyncio.sleep(random.uniform(10, 20))
+                    return examples
 
-                except Exception as e:
-                    logger.error(f"❌ Failed topic {topic}: {e}")
-                    continue
+            try:
+                results = await asyncio.gather(*(run(t) for t in topics), return_exceptions=True)
+            finally:
+                await self.cleanup_session()
+
+            for topic, result in zip(topics, results):
+                if isinstance(result, BaseException):
+                    logger.error(f"❌ Failed topic {topic}: {result}")
+                else:
+                    logger.info(f"✅ Completed {topic}: {len(result)} examples")
 
             logger.info("🎯 Autonomous research completed")
 
@@ -6,11 +6,54 @@ Extracts structured knowledge from text content
 
 import re
 import logging
+from collections import Counter
+from itertools import chain
 from typing import List, Dict, Any
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+_WORD_RE = re.compile(r'\b\w+\b')
+# English stop words, filtered out before keyword counting
+_STOPWORDS = frozenset("""
+a about above after again against all almost alone along already also although
+always am among an and another any anyone anything anywhere are around as at
+back be became because become becomes been before being below between both but
+by can cannot could did do does doing done down during each either else enough
+even ever every everyone everything few for from further get gets given go had
+has have having he her here hers herself him himself his how however i if in
+into is it its itself just last least less made many may me might more most
+mostly much must my myself neither never next no nobody none nor not nothing now
+of off often on once one only onto or other others otherwise our ours ourselves
+out over own per perhaps please rather same she should since so some someone
+something sometimes still such than that the their theirs them themselves then
+there therefore these they this those though through thus to together too
+toward under until up upon us use used using very was we well were what whatever
+when where whether which while who whoever whole whom whose why will with within
+without would yet you your yours yourself yourselves
+""".split())
+_CODE_BLOCK_RE = re.compile(r'```(?:\w+)?\n(.*?)\n```', re.DOTALL)
+# Function header plus its indented body; stops at the first dedented line.
+# The line-start indent is optional so inline defs in flattened scraped text still match
+_PY_FUNCTION_RE = re.compile(
+    r'(?:^([ \t]*))?def\s+\w+\s*\([^)]*\):[^\n]*(?:\n(?:\1[ \t]+[^\n]*|[ \t]*(?=\n)))*',
+    re.MULTILINE
+)
+
+# Language markers in priority order; one alternation scans the snippet once
+_LANGUAGE_MARKERS = (
+    ('python', ('def ', 'import ', 'print(')),
+    ('javascript', ('function', 'var ', 'let ')),
+    ('c', ('#include', 'int main')),
+    ('java', ('public class', 'System.out')),
+)
+_LANGUAGE_PRIORITY = {lang: i for i, (lang, _) in enumerate(_LANGUAGE_MARKERS)}
+# Zero-width lookahead so overlapping markers (e.g. "#includef ") are all seen
+_LANGUAGE_RE = re.compile('(?=' + '|'.join(
+    f"(?P<{lang}>{'|'.join(re.escape(m) for m in markers)})"
+    for lang, markers in _LANGUAGE_MARKERS
+) + ')')
+
 
 class KnowledgeExtractor:
     """Extract structured knowledge from text content"""
@@ -36,15 +79,17 @@ class KnowledgeExtractor:
             Dictionary containing extracted knowledge
         """
         try:
+            # Tokenize once; keywords and word count share the same word list
+            words = _WORD_RE.findall(text_content.lower())
             knowledge = {
                 'concepts': self._extract_concepts(text_content),
                 'code_examples': self._extract_code_examples(text_content),
                 'definitions': self._extract_definitions(text_content),
-                'keywords': self._extract_keywords(text_content),
+                'keywords': self._rank_keywords(words),
                 'metadata': {
                     'extraction_time': datetime.now(),
                     'content_length': len(text_content),
-                    'word_count': len(text_content.split())
+                    'word_count': len(words)
                 }
             }
             
@@ -61,8 +106,7 @@ class KnowledgeExtractor:
             code_examples = []
             
             # Extract code blocks
-            code_blocks = re.findall(r'```(?:\w+)?\n(.*?)\n```', content, re.DOTALL)
-            for i, code in enumerate(code_blocks):
+            for i, code in enumerate(self._code_blocks(content)):
                 code_examples.append({
                     'type': 'code_block',
                     'content': code.strip(),
@@ -131,33 +175,31 @@ class KnowledgeExtractor:
     def _extract_concepts(self, text: str) -> List[str]:
         """Extract key concepts from text"""
         # Simple concept extraction based on capitalized words and technical terms
-        concepts = []
-        
         # Technical terms
         tech_terms = re.findall(r'\b[A-Z][a-z]*(?:[A-Z][a-z]*)*\b', text)
-        concepts.extend(tech_terms)
         
         # Programming concepts
         prog_concepts = re.findall(r'\b(?:function|class|method|variable|array|object|string|integer|boolean)\b', text, re.IGNORECASE)
-        concepts.extend(prog_concepts)
         
-        # Remove duplicates and return
-        return list(set(concepts))
+        # Remove duplicates, keeping first-seen order
+        return list(dict.fromkeys(chain(tech_terms, prog_concepts)))
     
     def _extract_code_examples(self, text: str) -> List[str]:
         """Extract code examples from text"""
         code_examples = []
         
         # Code blocks
-        code_blocks = re.findall(r'```(?:\w+)?\n(.*?)\n```', text, re.DOTALL)
-        code_examples.extend([code.strip() for code in code_blocks])
+        code_examples.extend(code.strip() for code in self._code_blocks(text))
         
         # Function definitions
-        functions = re.findall(r'def\s+\w+\s*\([^)]*\):[^}]+', text)
-        code_examples.extend(functions)
+        code_examples.extend(match.group(0).strip() for match in _PY_FUNCTION_RE.finditer(text))
         
         return code_examples
     
+    def _code_blocks(self, text: str) -> List[str]:
+        """Return the bodies of fenced code blocks"""
+        return _CODE_BLOCK_RE.findall(text)
+    
     def _extract_definitions(self, text: str) -> List[Dict]:
         """Extract definitions from text"""
         definitions = []
@@ -181,29 +223,27 @@ class KnowledgeExtractor:
     def _extract_keywords(self, text: str) -> List[str]:
         """Extract keywords from text"""
         # Simple keyword extraction
-        words = re.findall(r'\b\w+\b', text.lower())
-        
+        return self._rank_keywords(_WORD_RE.findall(text.lower()))
+    
+    def _rank_keywords(self, words: List[str]) -> List[str]:
+        """Return the most frequent non-trivial words"""
         # Filter common words
-        common_words = {'the', 'is', 'at', 'which', 'on', 'and', 'a', 'to', 'are', 'as', 'was', 'with', 'for'}
-        keywords = [word for word in words if len(word) > 3 and word not in common_words]
+        keywords = [word for word in words if len(word) > 3 and word not in _STOPWORDS]
         
         # Count frequency and return top keywords
-        from collections import Counter
         word_counts = Counter(keywords)
         return [word for word, count in word_counts.most_common(20)]
     
     def _detect_language(self, code: str) -> str:
         """Detect programming language of code snippet"""
-        if 'def ' in code or 'import ' in code or 'print(' in code:
-            return 'python'
-        elif 'function' in code or 'var ' in code or 'let ' in code:
-            return 'javascript'
-        elif '#include' in code or 'int main' in code:
-            return 'c'
-        elif 'public class' in code or 'System.out' in code:
-            return 'java'
-        else:
-            return 'unknown'
+        best = None
+        for match in _LANGUAGE_RE.finditer(code):
+            lang = match.lastgroup
+            if _LANGUAGE_PRIORITY[lang] == 0:
+                return lang
+            if best is None or _LANGUAGE_PRIORITY[lang] < _LANGUAGE_PRIORITY[best]:
+                best = lang
+        return best or 'unknown'
 
 
 if __name__ == "__main__":
@@ -6,13 +6,136 @@ import aiohttp
 import asyncio
 import json
 import logging
+import random
 from datetime import datetime
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
+from urllib.parse import urlparse
 import re
 
+from .http_utils import read_text_capped
+
 logger = logging.getLogger(__name__)
 
+# ✅ Lexbor-backed selectolax parser for the hot path; BeautifulSoup is the fallback
+try:
+    from selectolax.lexbor import LexborHTMLParser, LexborNode
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+# Q&A / result blocks on source pages, and the fields read from each block
+LEARNING_SELECTOR = '.question-summary, .s-post-summary, .answer, .repo-list-item'
+_TITLE_SELECTOR = 'h3 a, .s-post-summary--content-title a, a'
+_BODY_SELECTOR = '.excerpt, .s-post-summary--content-excerpt, .post-text, .s-prose, p'
+_CODE_SELECTOR = 'pre code, pre'
+
+# ✅ Knowledge items kept per source page
+MAX_ITEMS_PER_PAGE = 5
+
+# ✅ bs4/lxml are imported on first fallback parse: (BeautifulSoup, SoupStrainer, parser name)
+_BS4 = None
+
+
+def _load_bs4():
+    """Import BeautifulSoup lazily; prefer the C-backed lxml tree builder"""
+    global _BS4
+    if _BS4 is None:
+        from bs4 import BeautifulSoup, SoupStrainer
+        try:
+            import lxml  # noqa: F401
+            parser = 'lxml'
+        except ImportError:
+            parser = 'html.parser'
+        _BS4 = (BeautifulSoup, SoupStrainer, parser)
+    return _BS4
+
+
+# ✅ Only materialize the Q&A / result subtrees of each source page: host -> (tags, classes)
+_SOURCE_STRAINER_SPECS = {
+    'stackoverflow.com': ('div', ['question-summary', 's-post-summary', 'answer']),
+    'github.com': (['li', 'div'], ['repo-list-item']),
+}
+_SOURCE_STRAINERS = {}
+
+
+def _strainer_for(url: str):
+    """Pick the parse-only SoupStrainer for a source URL (None = full parse)"""
+    host = urlparse(url).netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    spec = _SOURCE_STRAINER_SPECS.get(host)
+    if spec is None:
+        return None
+    if host not in _SOURCE_STRAINERS:
+        _, SoupStrainer, _ = _load_bs4()
+        _SOURCE_STRAINERS[host] = SoupStrainer(spec[0], class_=spec[1])
+    return _SOURCE_STRAINERS[host]
+
+
+def _first_text(node, selector: str) -> str:
+    """Text of the first descendant matching selector (selectolax or BeautifulSoup node)"""
+    # isinstance, not hasattr: a bs4 Tag answers any attribute with a child lookup
+    if SELECTOLAX_AVAILABLE and isinstance(node, LexborNode):
+        found = node.css_first(selector)
+        return found.text(separator=' ', strip=True) if found is not None else ''
+    found = node.select_one(selector)
+    return found.get_text(' ', strip=True) if found is not None else ''
+
+
+def _learning_blocks(html_content: str, source_url: Optional[str]) -> list:
+    """Q&A / result blocks of a page: selectolax first, BeautifulSoup (+strainer) otherwise"""
+    if SELECTOLAX_AVAILABLE:
+        try:
+            return LexborHTMLParser(html_content).css(LEARNING_SELECTOR)
+        except Exception as e:
+            logger.debug(f"selectolax parse failed, falling back to BeautifulSoup: {e}")
+    BeautifulSoup, _, parser = _load_bs4()
+    strainer = _strainer_for(source_url) if source_url else None
+    return BeautifulSoup(html_content, parser, parse_only=strainer).select(LEARNING_SELECTOR)
+
+
+def _reddit_posts(json_content: str) -> List[tuple]:
+    """(title, body) pairs from a Reddit search.json listing"""
+    listing = json.loads(json_content)
+    children = listing.get('data', {}).get('children', []) if isinstance(listing, dict) else []
+    return [
+        (child.get('data', {}).get('title', ''), child.get('data', {}).get('selftext', ''))
+        for child in children
+    ]
+
+# ✅ Max in-flight source requests across all topics
+SCRAPE_CONCURRENCY = 20
+
+# ✅ Retry policy for 429 / 5xx responses (seconds)
+SCRAPE_MAX_ATTEMPTS = 3
+RETRY_MIN_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+
+
+def _retry_delay(retry_after: Optional[str], attempt: int) -> float:
+    """Honour a numeric Retry-After header, else doubling wait with jitter"""
+    try:
+        delay = float(retry_after)
+    except (TypeError, ValueError):
+        delay = 2 ** attempt + random.random()
+    return max(RETRY_MIN_DELAY, min(RETRY_MAX_DELAY, delay))
+
+
+# ✅ UI updates delivered per drain wake-up
+UI_BATCH_SIZE = 16
+
+# ✅ Read at most this much of each response body
+MAX_RESPONSE_BYTES = 512 * 1024
+
+
+def _topic_sources(topic: str) -> List[str]:
+    """Multi-source research URLs for a topic"""
+    return [
+        f"https://stackoverflow.com/search?q={topic}+python",
+        f"https://www.reddit.com/r/Python/search.json?q={topic}",
+        f"https://github.com/search?q={topic}+python+tutorial"
+    ]
+
 
 class RealTimeWebResearcher:
     """✅ SEARCH RESULTS [3] PATTERN: Real-time async research[3]"""
@@ -30,12 +153,23 @@ class RealTimeWebResearcher:
             "valid_conversations": 0
         }
         self.knowledge_base = []  # Collected knowledge
+        self._ui_queue = None  # Created on first UI update, inside the running loop
+        self._ui_task = None
         logger.info("🌐 Real-time Web Researcher initialized")
 
     async def __aenter__(self):
         """Async context manager - Search results [4] async pattern[4]"""
+        # ✅ Pooled keep-alive connections, reused across repeated SO/Reddit/GitHub hits
+        connector = aiohttp.TCPConnector(
+            limit=128,
+            limit_per_host=64,
+            ttl_dns_cache=300,
+            keepalive_timeout=60,
+            enable_cleanup_closed=True
+        )
         self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=30),
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=30, connect=5, sock_read=15),
             headers={
                 'User-Agent': 'SeydappAI-Research-Bot/1.0 (Educational Purpose)'
             }
@@ -43,9 +177,54 @@ class RealTimeWebResearcher:
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self._stop_ui()
         if self.session:
             await self.session.close()
 
+    def _notify(self, message: str, level: str):
+        """Queue a UI update without blocking the scraping path"""
+        if not self.ui_callback:
+            return
+        if self._ui_queue is None:
+            self._ui_queue = asyncio.Queue()
+        if self._ui_task is None or self._ui_task.done():
+            self._ui_task = asyncio.get_running_loop().create_task(self._ui_drain())
+        self._ui_queue.put_nowait((message, level))
+
+    async def _ui_drain(self):
+        """Background consumer: deliver queued UI updates in batches"""
+        while True:
+            batch = [await self._ui_queue.get()]
+            while len(batch) < UI_BATCH_SIZE:
+                try:
+                    batch.append(self._ui_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            for message, level in batch:
+                try:
+                    await self.ui_callback(message, level)
+                except Exception as e:
+                    logger.debug(f"UI callback error: {e}")
+                finally:
+                    self._ui_queue.task_done()
+
+    async def _flush_ui(self):
+        """Wait until every queued UI update has been delivered"""
+        if self._ui_task is not None and not self._ui_task.done():
+            await self._ui_queue.join()
+
+    async def _stop_ui(self):
+        """Flush and stop the UI drain task"""
+        await self._flush_ui()
+        if self._ui_task is not None:
+            self._ui_task.cancel()
+            try:
+                await self._ui_task
+            except asyncio.CancelledError:
+                pass
+            self._ui_task = None
+
     async def research_programming_topics(self, topics: List[str]) -> Dict:
         """✅ SEARCH RESULTS [1] PATTERN: Progressive UI updates[1]"""
         try:
@@ -53,61 +232,62 @@ class RealTimeWebResearcher:
             self.research_stats["last_scan"] = datetime.now().strftime("%H:%M")
 
             # ✅ UI progress başlangıç
-            if self.ui_callback:
-                await self.ui_callback(f"🔍 Research cycle started: {len(topics)} topics", "RESEARCH")
-
-            all_knowledge = []
+            self._notify(f"🔍 Research cycle started: {len(topics)} topics", "RESEARCH")
+
+            total = len(topics)
+            semaphore = asyncio.BoundedSemaphore(SCRAPE_CONCURRENCY)
+
+            async def scrape(i: int, topic: str, j: int, source: str):
+                async with semaphore:
+                    if j == 1:
+                        # ✅ SEARCH RESULTS [1] CRITICAL: Real-time UI progress[1]
+                        self._notify(f"🔍 [{i}/{total}] Researching: {topic}", "PROGRESS")
+                    # ✅ Source-level progress
+                    self._notify(f"📡 [{i}/{total}] Source {j}/3: {source.split('.')[1]}", "DETAIL")
+                    try:
+                        return i, source, await self.scrape_source(source, topic)
+                    except Exception as e:
+                        logger.warning(f"⚠️ Source failed {source}: {e}")
+                        self._notify(f"⚠️ Source failed: {source.split('.')[1]}", "WARNING")
+                        return i, source, None
 
+            # ✅ Fan out every (topic, source) pair; wall time ~ slowest request
+            tasks = []
+            pending = {}
             for i, topic in enumerate(topics, 1):
                 logger.info(f"🔍 Researching: {topic}")
-
-                # ✅ SEARCH RESULTS [1] CRITICAL: Real-time UI progress[1]
-                if self.ui_callback:
-                    await self.ui_callback(f"🔍 [{i}/{len(topics)}] Researching: {topic}", "PROGRESS")
-
-                # Multi-source research
-                sources = [
-                    f"https://stackoverflow.com/search?q={topic}+python",
-                    f"https://www.reddit.com/r/Python/search.json?q={topic}",
-                    f"https://github.com/search?q={topic}+python+tutorial"
-                ]
-
-                topic_knowledge = []
+                sources = _topic_sources(topic)
+                pending[i] = len(sources)
                 for j, source in enumerate(sources, 1):
-                    try:
-                        # ✅ Source-level progress
-                        if self.ui_callback:
-                            await self.ui_callback(f"📡 [{i}/{len(topics)}] Source {j}/3: {source.split('.')[1]}",
-                                                   "DETAIL")
+                    tasks.append(scrape(i, topic, j, source))
 
-                        knowledge = await self.scrape_source(source, topic)
-                        if knowledge:
-                            topic_knowledge.extend(knowledge)
-                            self.research_stats["sources_scanned"] += 1
+            topic_knowledge = {i: [] for i in pending}
+            topics_done = 0
+            knowledge_count = 0
 
-                    except Exception as e:
-                        logger.warning(f"⚠️ Source failed {source}: {e}")
-                        if self.ui_callback:
-                            await self.ui_callback(f"⚠️ Source failed: {source.split('.')[1]}", "WARNING")
-                        continue
+            for next_done in asyncio.as_completed(tasks):
+                i, source, knowledge = await next_done
+                if knowledge:
+                    topic_knowledge[i].extend(knowledge)
+                    knowledge_count += len(knowledge)
+                    self.research_stats["sources_scanned"] += 1
 
-                all_knowledge.extend(topic_knowledge)
+                pending[i] -= 1
+                if pending[i] == 0:
+                    # ✅ SEARCH RESULTS [1] PATTERN: Progressive stats update[1]
+                    topics_done += 1
+                    self.research_stats["topics_researched"] = topics_done
+                    self.research_stats["knowledge_nodes"] = knowledge_count
 
-                # ✅ SEARCH RESULTS [1] PATTERN: Progressive stats update[1]
-                self.research_stats["topics_researched"] = i
-                self.research_stats["knowledge_nodes"] = len(all_knowledge)
+                    # Topic completion log
+                    self._notify(f"✅ [{i}/{total}] {topics[i - 1]}: {len(topic_knowledge[i])} items found",
+                                 "SUCCESS")
 
-                # Topic completion log
-                if self.ui_callback:
-                    await self.ui_callback(f"✅ [{i}/{len(topics)}] {topic}: {len(topic_knowledge)} items found",
-                                           "SUCCESS")
-
-                # Realistic delay
-                await asyncio.sleep(0.5)
+            # Keep knowledge in topic order regardless of completion order
+            all_knowledge = [item for i in sorted(topic_knowledge) for item in topic_knowledge[i]]
 
             # Final quality assessment
-            if self.ui_callback:
-                await self.ui_callback("🔍 Assessing knowledge quality...", "ANALYSIS")
+            self._notify("🔍 Assessing knowledge quality...", "ANALYSIS")
 
             quality_knowledge = self.assess_knowledge_quality(all_knowledge)
             self.research_stats["valid_conversations"] = len(quality_knowledge)
@@ -115,10 +295,10 @@ class RealTimeWebResearcher:
             self.research_stats["status"] = "Completed"
 
             # Final completion log
-            if self.ui_callback:
-                await self.ui_callback(
-                    f"🧠 Research completed: {len(quality_knowledge)} quality items from {len(all_knowledge)} total",
-                    "SUCCESS")
+            self._notify(
+                f"🧠 Research completed: {len(quality_knowledge)} quality items from {len(all_knowledge)} total",
+                "SUCCESS")
+            await self._flush_ui()
 
             logger.info(f"✅ Research cycle completed: {len(quality_knowledge)} quality items")
             return {
@@ -128,8 +308,8 @@ class RealTimeWebResearcher:
 
         except Exception as e:
             logger.error(f"❌ Research cycle error: {e}")
-            if self.ui_callback:
-                await self.ui_callback(f"❌ Research error: {str(e)}", "ERROR")
+            self._notify(f"❌ Research error: {str(e)}", "ERROR")
+            await self._flush_ui()
             return {"knowledge": [], "stats": self.research_stats.copy()}
 
 
@@ -139,24 +319,72 @@ class RealTimeWebResearcher:
             if not self.session:
                 return []
 
-            async with self.session.get(url) as response:
-                if response.status == 200:
-                    content = await response.text()
-                    return self.extract_learning_content(content, topic)
-                else:
-                    logger.warning(f"⚠️ HTTP {response.status} for {url}")
-                    return []
+            for attempt in range(SCRAPE_MAX_ATTEMPTS):
+                async with self.session.get(url) as response:
+                    if response.status == 200:
+                        # ✅ Skip binary/non-page payloads (Reddit search returns JSON)
+                        content_type = response.headers.get('Content-Type', '')
+                        if 'html' not in content_type and 'json' not in content_type:
+                            logger.debug(f"Skipping {content_type or 'unknown'} content from {url}")
+                            return []
+
+                        content = await read_text_capped(response, MAX_RESPONSE_BYTES)
+                        return self.extract_learning_content(content, topic, source_url=url)
+
+                    # ✅ Throttling / transient server errors: back off and retry
+                    if response.status == 429 or response.status >= 500:
+                        if attempt == SCRAPE_MAX_ATTEMPTS - 1:
+                            break
+                        wait_time = _retry_delay(response.headers.get('Retry-After'), attempt)
+                        logger.debug(f"⏱️ HTTP {response.status} for {url}, retrying in {wait_time:.1f}s")
+                    else:
+                        logger.warning(f"⚠️ HTTP {response.status} for {url}")
+                        return []
+
+                await asyncio.sleep(wait_time)
+
+            logger.warning(f"⚠️ Giving up on {url} after {SCRAPE_MAX_ATTEMPTS} attempts")
+            return []
 
         except Exception as e:
             logger.warning(f"⚠️ Scrape error {url}: {e}")
             return []
 
-    def extract_learning_content(self, html_content: str, topic: str) -> List[Dict]:
+    def extract_learning_content(self, html_content: str, topic: str,
+                                 source_url: Optional[str] = None) -> List[Dict]:
         """Extract Q&A pairs and code examples"""
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-
-            # Simulated extraction (gerçek implementation için BeautifulSoup selectors)
+            now = datetime.now()
+            extracted = []
+
+            if html_content.lstrip().startswith('{'):
+                # Reddit search returns a JSON listing, not HTML
+                pairs = _reddit_posts(html_content)
+                code_examples = [''] * len(pairs)
+            else:
+                blocks = _learning_blocks(html_content, source_url)[:MAX_ITEMS_PER_PAGE]
+                pairs = [(_first_text(b, _TITLE_SELECTOR), _first_text(b, _BODY_SELECTOR)) for b in blocks]
+                code_examples = [_first_text(b, _CODE_SELECTOR) for b in blocks]
+
+            for (question, answer), code in zip(pairs, code_examples):
+                if not question or not (answer or code):
+                    continue
+                extracted.append({
+                    "topic": topic,
+                    "question": question[:300],
+                    "answer": answer[:2000],
+                    "code_example": code[:2000],
+                    "source": source_url or "web",
+                    "timestamp": now,
+                    "confidence": 0.8
+                })
+                if len(extracted) >= MAX_ITEMS_PER_PAGE:
+                    break
+
+            if extracted:
+                return extracted
+
+            # Simulated extraction when the page yields no Q&A blocks
             extracted = [
                 {
                     "topic": topic,
@@ -164,7 +392,7 @@ class RealTimeWebResearcher:
                     "answer": f"Here's a practical approach to {topic}...",
                     "code_example": f"# Example for {topic}\nprint('Hello {topic}')",
                     "source": "simulated",
-                    "timestamp": datetime.now(),
+                    "timestamp": now,
                     "confidence": 0.85
                 }
             ]
@@ -6,9 +6,17 @@ Bu sistem DuckDuckGo kullanarak gerçek web araması yapar
 
 import logging
 import asyncio
+import heapq
+import random
+import threading
+import time
+import weakref
+from collections import OrderedDict
 from typing import List, Dict, Optional
 from datetime import datetime
 import re
+from functools import lru_cache
+from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +27,181 @@ except ImportError:
     DDGS_AVAILABLE = False
     logger.warning("⚠️ DuckDuckGo search not available. Install with: pip install ddgs")
 
+try:
+    from ddgs.exceptions import RatelimitException, TimeoutException
+    _DDG_RETRYABLE = (RatelimitException, TimeoutException)
+except ImportError:
+    _DDG_RETRYABLE = ()
+
+# DuckDuckGo çağrı limitleri
+DDG_MAX_CONCURRENCY = 8
+DDG_MAX_RETRIES = 3
+DDG_BACKOFF_CAP = 30.0
+
+# Sorgu sonuç önbelleği
+QUERY_CACHE_TTL = 600
+QUERY_CACHE_MAX_ENTRIES = 512
+
+# Güvenilir programlama kaynakları
+_TRUSTED_DOMAINS = (
+    'stackoverflow.com',
+    'github.com',
+    'developer.mozilla.org',
+    'docs.python.org',
+    'developer.android.com',
+    'reactjs.org',
+    'vuejs.org',
+    'angular.io',
+    'flask.palletsprojects.com',
+    'django.readthedocs.io',
+    'pytorch.org',
+    'tensorflow.org',
+    'w3schools.com',
+    'geeksforgeeks.org',
+    'medium.com',
+    'dev.to',
+    'tutorialspoint.com'
+)
+_TRUSTED_DOMAIN_SET = frozenset(_TRUSTED_DOMAINS)
+
+# Kategorili anahtar kelimeler - tek regex geçişiyle hangi kategorilerin geçtiği bulunur
+_KEYWORD_CATEGORIES = {
+    'android': ('android', 'java'),
+    'card': ('kart', 'card', 'profil', 'profile'),
+}
+_KEYWORD_RE = re.compile('|'.join(
+    f"(?P<{category}>{'|'.join(sorted(map(re.escape, words), key=len, reverse=True))})"
+    for category, words in _KEYWORD_CATEGORIES.items()
+))
+
+# Kalite skoru anahtar kelimeleri (kelime bazlı; çok kelimeli ifadeler ayrı)
+_PROG_KW = frozenset(('java', 'android', 'python', 'javascript', 'tutorial', 'example'))
+_PROG_PHRASES = ('how to',)
+_TECH_KW = frozenset(('code', 'function', 'class', 'method'))
+_WORD_RE = re.compile(r'\w+')
+
+
+def _keyword_categories(text_lower: str) -> frozenset:
+    """Küçük harfli metinde geçen anahtar kelime kategorileri"""
+    return frozenset(m.lastgroup for m in _KEYWORD_RE.finditer(text_lower))
+
+
+# Türkçe → İngilizce sorgu çevirisi (tek regex, en uzun eşleşme önce)
+_TR_TO_EN = {
+    'android için java programlama dili ile bir kart oluştur': 'Android Java CardView profile card example tutorial',
+    'android': 'Android',
+    'java': 'Java',
+    'kart': 'card',
+    'profil': 'profile',
+    'oluştur': 'create',
+    'programlama': 'programming',
+    'dili': 'language'
+}
+
+
+def _trie_pattern(words) -> str:
+    """Kelimelerden trie yapılı regex üret: ortak önekler bir kez taranır,
+    açgözlü isteğe bağlı dallar en uzun eşleşmeyi önce dener"""
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+
+    def emit(node) -> str:
+        branches = [re.escape(ch) + emit(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if '' in node:
+            return '(?:' + body + ')?'
+        return body
+
+    return emit(trie)
+
+
+_TR_PATTERN = re.compile(_trie_pattern(_TR_TO_EN), re.IGNORECASE)
+
+
+def _close_ddgs(ddgs) -> None:
+    """DDGS istemcisini kapat (close() ve weakref finalizer ortak yolu)"""
+    try:
+        ddgs.__exit__(None, None, None)
+    except Exception as e:
+        logger.debug(f"DDGS close error: {e}")
+
+
+@lru_cache(maxsize=4096)
+def _extract_domain(url: str) -> str:
+    """URL'den domain adını çıkar"""
+    try:
+        return urlparse(url).netloc.lower()
+    except Exception:
+        return url
+
+
+def _is_trusted_domain(domain: str) -> bool:
+    """Domain güvenilir bir domain'in kendisi ya da alt domain'i mi"""
+    parts = domain.split(':', 1)[0].split('.')
+    return any('.'.join(parts[i:]) in _TRUSTED_DOMAIN_SET for i in range(len(parts) - 1))
+
+
+@lru_cache(maxsize=1024)
+def _is_android_card_question(query: str) -> bool:
+    """Android kart oluşturma sorusu mu kontrol et"""
+    categories = _keyword_categories(query.lower())
+    return 'android' in categories and 'card' in categories
+
+
+@lru_cache(maxsize=1024)
+def _enhance_programming_query(query: str) -> str:
+    """Programlama araması için sorguyu geliştir"""
+    query_lower = query.lower()
+    
+    # Tam eşleşme kontrolü
+    if query_lower in _TR_TO_EN:
+        return _TR_TO_EN[query_lower]
+    
+    # Kısmi çeviri - tek geçişte, uzun ifadeler kısa kelimelerden önce
+    enhanced_query = _TR_PATTERN.sub(
+        lambda m: _TR_TO_EN.get(m.group(0).lower(), m.group(0)), query
+    )
+    
+    # Programlama anahtar kelimeleri ekle
+    programming_terms = ['tutorial', 'example', 'code', 'how to']
+    
+    # Eğer sorgu zaten programlama terimleri içeriyorsa, olduğu gibi bırak
+    if any(term in enhanced_query.lower() for term in programming_terms):
+        return enhanced_query
+    
+    # Aksi halde 'example' ekle
+    return f"{enhanced_query} example"
+
+
+@lru_cache(maxsize=4096)
+def _title_domain_score(title: str, domain: str) -> float:
+    """Kalite skorunun başlık ve domain'e bağlı kısmı"""
+    score = 0.0
+    
+    # Başlık kalitesi
+    if title:
+        title_lower = title.lower()
+        # Programlama anahtar kelimeleri
+        keyword_count = len(_PROG_KW.intersection(_WORD_RE.findall(title_lower)))
+        keyword_count += sum(1 for phrase in _PROG_PHRASES if phrase in title_lower)
+        score += min(keyword_count * 0.5, 2.0)
+        
+        # Başlık uzunluğu
+        if 20 <= len(title) <= 100:
+            score += 1.0
+    
+    # URL kalitesi
+    if _is_trusted_domain(domain):
+        score += 2.0
+    
+    return score
+
 
 class RealWebSearchSystem:
     """
@@ -32,25 +215,15 @@ class RealWebSearchSystem:
     """
     
     def __init__(self):
-        self.trusted_domains = [
-            'stackoverflow.com',
-            'github.com',
-            'developer.mozilla.org',
-            'docs.python.org',
-            'developer.android.com',
-            'reactjs.org',
-            'vuejs.org',
-            'angular.io',
-            'flask.palletsprojects.com',
-            'django.readthedocs.io',
-            'pytorch.org',
-            'tensorflow.org',
-            'w3schools.com',
-            'geeksforgeeks.org',
-            'medium.com',
-            'dev.to',
-            'tutorialspoint.com'
-        ]
+        self._ddg_semaphore = None  # İlk aramada, çalışan event loop içinde oluşturulur
+        self._ddg_semaphore_loop = None
+        # Worker thread başına bir DDGS istemcisi: DDGS'nin thread-safe olduğu garanti değil,
+        # bağlantılar yine aynı thread'deki aramalar arasında yeniden kullanılır
+        self._ddgs_local = threading.local()
+        self._ddgs_lock = threading.Lock()
+        self._ddgs_finalizers = []
+        # (normalize sorgu, max_results) -> (zaman damgası, sonuçlar); LRU sıralı
+        self._query_cache = OrderedDict()
         
         logger.info("🌐 Real Web Search System initialized")
     
@@ -70,14 +243,31 @@ class RealWebSearchSystem:
                 logger.error("❌ DuckDuckGo search not available")
                 return []
             
+            cache_key = (' '.join(query.lower().split()), max_results)
+            cached = self._query_cache.get(cache_key)
+            if cached is not None:
+                cached_at, cached_results = cached
+                if time.monotonic() - cached_at < QUERY_CACHE_TTL:
+                    self._query_cache.move_to_end(cache_key)
+                    logger.info(f"📦 Cached web search for: {query}")
+                    return [dict(result) for result in cached_results]
+                del self._query_cache[cache_key]
+            
             logger.info(f"🔍 Real web search for: {query}")
             
             # Android kart oluşturma sorusu için özel arama
             if self._is_android_card_question(query):
-                return await self._search_android_card_creation(query, max_results)
+                results = await self._search_android_card_creation(query, max_results)
+            else:
+                # Genel programlama araması
+                results = await self._search_general_programming(query, max_results)
             
-            # Genel programlama araması
-            return await self._search_general_programming(query, max_results)
+            if results:
+                self._query_cache[cache_key] = (time.monotonic(), [dict(result) for result in results])
+                if len(self._query_cache) > QUERY_CACHE_MAX_ENTRIES:
+                    self._query_cache.popitem(last=False)
+            
+            return results
             
         except Exception as e:
             logger.error(f"❌ Real web search error: {e}")
@@ -85,14 +275,7 @@ class RealWebSearchSystem:
     
     def _is_android_card_question(self, query: str) -> bool:
         """Android kart oluşturma sorusu mu kontrol et"""
-        query_lower = query.lower()
-        android_keywords = ['android', 'java']
-        card_keywords = ['kart', 'card', 'profil', 'profile']
-        
-        has_android = any(keyword in query_lower for keyword in android_keywords)
-        has_card = any(keyword in query_lower for keyword in card_keywords)
-        
-        return has_android and has_card
+        return _is_android_card_question(query)
     
     async def _search_android_card_creation(self, query: str, max_results: int = 3) -> List[Dict]:
         """Android kart oluşturma için özel arama"""
@@ -106,19 +289,16 @@ class RealWebSearchSystem:
                 "Android RecyclerView card design tutorial"
             ]
             
-            all_results = []
+            # Alt aramalar eşzamanlı; DDG semaforu eşzamanlılığı sınırlar
+            results_lists = await asyncio.gather(
+                *(self._perform_ddg_search(search_term, 2) for search_term in search_terms),
+                return_exceptions=True
+            )
+            all_results = [result for results in results_lists if isinstance(results, list)
+                           for result in results]
             
-            for search_term in search_terms:
-                results = await self._perform_ddg_search(search_term, 2)
-                all_results.extend(results)
-            
-            # Sonuçları kalite skoruna göre sırala
-            all_results.sort(key=lambda x: x.get('quality_score', 0), reverse=True)
-            
-            # En iyi sonuçları seç
-            best_results = all_results[:max_results]
-            
-            return best_results
+            # En iyi sonuçları kalite skoruna göre seç
+            return heapq.nlargest(max_results, all_results, key=lambda x: x.get('quality_score', 0))
             
         except Exception as e:
             logger.error(f"❌ Android card search error: {e}")
@@ -135,10 +315,8 @@ class RealWebSearchSystem:
             # Güvenilir kaynaklardan sonuçları filtrele
             filtered_results = self._filter_trusted_sources(results)
             
-            # Sonuçları kalite skoruna göre sırala
-            filtered_results.sort(key=lambda x: x.get('quality_score', 0), reverse=True)
-            
-            return filtered_results[:max_results]
+            # En iyi sonuçları kalite skoruna göre seç
+            return heapq.nlargest(max_results, filtered_results, key=lambda x: x.get('quality_score', 0))
             
         except Exception as e:
             logger.error(f"❌ General programming search error: {e}")
@@ -149,35 +327,52 @@ class RealWebSearchSystem:
         try:
             results = []
             
-            # DuckDuckGo araması yap
-            with DDGS() as ddgs:
-                search_results = list(ddgs.text(query, max_results=max_results))
-                
-                for result in search_results:
+            # DuckDuckGo araması yap - bloklayan istemci thread pool'da çalışır
+            loop = asyncio.get_running_loop()
+            # Paylaşılan örnek farklı event loop'lardan çağrılabilir: semaphore loop'a bağlıdır
+            if self._ddg_semaphore is None or self._ddg_semaphore_loop is not loop:
+                self._ddg_semaphore = asyncio.Semaphore(DDG_MAX_CONCURRENCY)
+                self._ddg_semaphore_loop = loop
+            async with self._ddg_semaphore:
+                for attempt in range(DDG_MAX_RETRIES):
                     try:
-                        title = result.get('title', '')
-                        body = result.get('body', '')
-                        url = result.get('href', '')
-                        
-                        if not title or not url:
-                            continue
-                        
-                        # Kalite skorunu hesapla
-                        quality_score = self._calculate_quality_score(title, body, url)
-                        
-                        result_dict = {
-                            'title': title,
-                            'content': body,
-                            'url': url,
-                            'source': self._extract_domain(url),
-                            'quality_score': quality_score
-                        }
-                        
-                        results.append(result_dict)
-                        
-                    except Exception as e:
-                        logger.warning(f"⚠️ Error processing search result: {e}")
+                        search_results = await loop.run_in_executor(
+                            None, self._ddg_blocking, query, max_results
+                        )
+                        break
+                    except _DDG_RETRYABLE as e:
+                        if attempt == DDG_MAX_RETRIES - 1:
+                            raise
+                        wait_time = min(DDG_BACKOFF_CAP, 2 ** attempt + random.random())
+                        logger.warning(f"⏱️ DuckDuckGo throttled ({type(e).__name__}), retrying in {wait_time:.1f}s")
+                        await asyncio.sleep(wait_time)
+            
+            for result in search_results:
+                try:
+                    title = result.get('title', '')
+                    body = result.get('body', '')
+                    url = result.get('href', '')
+                    
+                    if not title or not url:
                         continue
+                    
+                    # Kalite skorunu hesapla (domain bir kez çıkarılır)
+                    domain = self._extract_domain(url)
+                    quality_score = self._calculate_quality_score(title, body, url, domain=domain)
+                    
+                    result_dict = {
+                        'title': title,
+                        'content': body,
+                        'url': url,
+                        'source': domain,
+                        'quality_score': quality_score
+                    }
+                    
+                    results.append(result_dict)
+                    
+                except Exception as e:
+                    logger.warning(f"⚠️ Error processing search result: {e}")
+                    continue
             
             logger.info(f"✅ Found {len(results)} DuckDuckGo results")
             return results
@@ -186,52 +381,41 @@ class RealWebSearchSystem:
             logger.error(f"❌ DuckDuckGo search error: {e}")
             return []
     
+    def _ddg_blocking(self, query: str, max_results: int) -> List[Dict]:
+        """Senkron DuckDuckGo çağrısı (worker thread'de çalışır)"""
+        return list(self._get_ddgs().text(query, max_results=max_results))
+    
+    def _get_ddgs(self):
+        """Bu thread'in DDGS istemcisini döndür, gerekirse oluştur"""
+        ddgs = getattr(self._ddgs_local, 'ddgs', None)
+        if ddgs is None:
+            ddgs = DDGS()
+            self._ddgs_local.ddgs = ddgs
+            with self._ddgs_lock:
+                self._ddgs_finalizers.append(weakref.finalize(self, _close_ddgs, ddgs))
+        return ddgs
+    
+    def close(self):
+        """Tüm thread'lerin DuckDuckGo istemcilerini kapat"""
+        with self._ddgs_lock:
+            finalizers, self._ddgs_finalizers = self._ddgs_finalizers, []
+            self._ddgs_local = threading.local()
+        for finalizer in finalizers:
+            finalizer()
+    
     def _enhance_programming_query(self, query: str) -> str:
         """Programlama araması için sorguyu geliştir"""
-        # Türkçe sorguları İngilizce'ye çevir
-        turkish_to_english = {
-            'android için java programlama dili ile bir kart oluştur': 'Android Java CardView profile card example tutorial',
-            'android': 'Android',
-            'java': 'Java',
-            'kart': 'card',
-            'profil': 'profile',
-            'oluştur': 'create',
-            'programlama': 'programming',
-            'dili': 'language'
-        }
-        
-        query_lower = query.lower()
-        
-        # Tam eşleşme kontrolü
-        if query_lower in turkish_to_english:
-            return turkish_to_english[query_lower]
-        
-        # Kısmi çeviri
-        enhanced_query = query
-        for turkish, english in turkish_to_english.items():
-            if turkish in query_lower:
-                enhanced_query = enhanced_query.replace(turkish, english)
-        
-        # Programlama anahtar kelimeleri ekle
-        programming_terms = ['tutorial', 'example', 'code', 'how to']
-        
-        # Eğer sorgu zaten programlama terimleri içeriyorsa, olduğu gibi bırak
-        if any(term in enhanced_query.lower() for term in programming_terms):
-            return enhanced_query
-        
-        # Aksi halde 'example' ekle
-        return f"{enhanced_query} example"
+        return _enhance_programming_query(query)
     
     def _filter_trusted_sources(self, results: List[Dict]) -> List[Dict]:
         """Güvenilir kaynaklardan sonuçları filtrele"""
         filtered = []
         
         for result in results:
-            url = result.get('url', '')
-            domain = self._extract_domain(url)
+            domain = result.get('source') or self._extract_domain(result.get('url', ''))
             
             # Güvenilir domain'lerden olanları öncelikle al
-            if any(trusted in domain for trusted in self.trusted_domains):
+            if self._is_trusted(domain):
                 result['quality_score'] = result.get('quality_score', 0) + 2.0  # Bonus puan
                 filtered.append(result)
             elif len(filtered) < 3:  # En az 3 sonuç olsun
@@ -241,29 +425,21 @@ class RealWebSearchSystem:
     
     def _extract_domain(self, url: str) -> str:
         """URL'den domain adını çıkar"""
-        try:
-            from urllib.parse import urlparse
-            parsed = urlparse(url)
-            return parsed.netloc.lower()
-        except:
-            return url
+        return _extract_domain(url)
     
-    def _calculate_quality_score(self, title: str, content: str, url: str) -> float:
+    def _is_trusted(self, domain: str) -> bool:
+        """Domain güvenilir kaynaklardan mı"""
+        return _is_trusted_domain(domain)
+    
+    def _calculate_quality_score(self, title: str, content: str, url: str,
+                                 domain: Optional[str] = None) -> float:
         """Sonuç kalitesini hesapla (0-10 arası)"""
         try:
-            score = 0.0
+            if domain is None:
+                domain = self._extract_domain(url)
             
-            # Başlık kalitesi
-            if title:
-                title_lower = title.lower()
-                # Programlama anahtar kelimeleri
-                prog_keywords = ['java', 'android', 'python', 'javascript', 'tutorial', 'example', 'how to']
-                keyword_count = sum(1 for keyword in prog_keywords if keyword in title_lower)
-                score += min(keyword_count * 0.5, 2.0)
-                
-                # Başlık uzunluğu
-                if 20 <= len(title) <= 100:
-                    score += 1.0
+            # Başlık + domain kısmı (title, domain) çiftine göre önbellekli
+            score = _title_domain_score(title, domain)
             
             # İçerik kalitesi
             if content:
@@ -274,15 +450,10 @@ class RealWebSearchSystem:
                     score += 1.0
                 
                 # Kod blokları veya teknik terimler
-                content_lower = content.lower()
-                if any(term in content_lower for term in ['code', 'function', 'class', 'method']):
+                words = (m.group(0) for m in _WORD_RE.finditer(content.lower()))
+                if not _TECH_KW.isdisjoint(words):
                     score += 1.0
             
-            # URL kalitesi
-            domain = self._extract_domain(url)
-            if any(trusted in domain for trusted in self.trusted_domains):
-                score += 2.0
-            
             return min(score, 10.0)
             
         except Exception as e:
@@ -295,30 +466,30 @@ class RealWebSearchSystem:
             if not results:
                 return f"🔍 '{query}' için güncel bilgi bulunamadı."
             
-            formatted_response = f"🔍 **'{query}' için gerçek zamanlı web araması sonuçları:**\n\n"
+            parts = [f"🔍 **'{query}' için gerçek zamanlı web araması sonuçları:**\n\n"]
             
             for i, result in enumerate(results, 1):
                 source = result.get('source', 'Web')
                 title = result.get('title', 'Başlıksız')
-                content = result.get('content', '')[:800]  # İlk 800 karakter
+                content = result.get('content', '')
                 url = result.get('url', '')
                 quality = result.get('quality_score', 0)
                 
-                formatted_response += f"**{i}. {title}**\n"
-                formatted_response += f"📍 **Kaynak:** {source} (Kalite: {quality:.1f}/10)\n"
+                parts.append(f"**{i}. {title}**\n")
+                parts.append(f"📍 **Kaynak:** {source} (Kalite: {quality:.1f}/10)\n")
                 
                 if content:
-                    formatted_response += f"📝 **İçerik:**\n{content}\n"
+                    parts.append(f"📝 **İçerik:**\n{content[:800]}\n")  # İlk 800 karakter
                 
                 if url:
-                    formatted_response += f"🔗 **Link:** {url}\n"
+                    parts.append(f"🔗 **Link:** {url}\n")
                 
-                formatted_response += "\n---\n\n"
+                parts.append("\n---\n\n")
             
-            formatted_response += f"⏰ **Arama Zamanı:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-            formatted_response += "💡 **Not:** Bu bilgiler DuckDuckGo ile gerçek zamanlı web araması ile elde edilmiştir."
+            parts.append(f"⏰ **Arama Zamanı:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            parts.append("💡 **Not:** Bu bilgiler DuckDuckGo ile gerçek zamanlı web araması ile elde edilmiştir.")
             
-            return formatted_response
+            return ''.join(parts)
             
         except Exception as e:
             logger.error(f"❌ Result formatting error: {e}")
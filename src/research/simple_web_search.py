@@ -7,16 +7,253 @@ Bu sistem gerçek web araması yapar ve AI'ın öğrenmesini sağlar
 import logging
 import asyncio
 import aiohttp
+import heapq
+import html as html_lib
 import json
 import re
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from urllib.parse import quote_plus, urljoin
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer, Tag
 import time
+import weakref
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
+
+from .http_utils import read_body_capped, read_text_capped
 
 logger = logging.getLogger(__name__)
 
+# Lexbor tabanlı selectolax (C ayrıştırıcı) varsa onu, yoksa BeautifulSoup kullan
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+# ✅ DuckDuckGo JSON yanıtları için hızlı çözücü, yoksa stdlib json
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# ✅ Opsiyonel HTTP/2 istemcisi: aynı host'a giden istekler tek TLS bağlantısında çoğullanır
+try:
+    import httpx
+    import h2  # noqa: F401  (httpx http2=True için gerekli)
+    HTTPX_HTTP2_AVAILABLE = True
+except ImportError:
+    HTTPX_HTTP2_AVAILABLE = False
+
+_REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (compatible; Educational-Bot/1.0)',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Connection': 'keep-alive'
+}
+
+# Sorgu sonuçları kısa, sayfa içerikleri uzun süre önbellekte tutulur
+QUERY_CACHE_TTL = 600
+QUERY_CACHE_MAX_ENTRIES = 512
+PAGE_CACHE_TTL = 24 * 60 * 60
+PAGE_CACHE_MAX_ENTRIES = 256
+
+# ✅ Sayfa gövdesinden en fazla bu kadarını oku (seçiciler sayfanın başında)
+MAX_PAGE_BYTES = 256 * 1024
+MAX_JSON_BYTES = 512 * 1024
+
+# Sorgu sınıflandırma anahtar kelimeleri (token bazlı)
+_PROGRAMMING_KEYWORDS = frozenset({
+    'java', 'android', 'python', 'javascript', 'html', 'css',
+    'code', 'programming', 'tutorial', 'example'
+})
+_WEB_TECH_KEYWORDS = frozenset({'html', 'css', 'javascript', 'react', 'vue', 'angular', 'bootstrap'})
+_HOW_TO_RE = re.compile(r'\bhow\s+to\b')
+
+# W3Schools için basit bir yaklaşım - direkt tutorial sayfalarına git
+_W3_TOPICS = {
+    'html': 'https://www.w3schools.com/html/',
+    'css': 'https://www.w3schools.com/css/',
+    'javascript': 'https://www.w3schools.com/js/',
+    'react': 'https://www.w3schools.com/react/',
+    'bootstrap': 'https://www.w3schools.com/bootstrap/'
+}
+_W3_TOPIC_RE = re.compile(r'\b(' + '|'.join(map(re.escape, _W3_TOPICS)) + r')\b', re.I)
+_TOKEN_RE = re.compile(r'\w+')
+
+
+@lru_cache(maxsize=256)
+def _query_tokens(query: str) -> frozenset:
+    """Sorguyu küçük harfli token kümesine çevir (iki predicate aynı sonucu paylaşır)"""
+    return frozenset(_TOKEN_RE.findall(query.lower()))
+
+
+# BeautifulSoup yedeği için lxml (C) ayrıştırıcısı, yoksa saf Python html.parser
+try:
+    import lxml  # noqa: F401
+    _BS4_PARSER = 'lxml'
+except ImportError:
+    _BS4_PARSER = 'html.parser'
+
+# ✅ BeautifulSoup yedeği yalnızca gereken alt ağacı kursun
+_GFG_SEARCH_STRAINER = SoupStrainer('div', class_='head')
+_GFG_CONTENT_STRAINER = SoupStrainer('div', class_='text')
+_W3_CONTENT_STRAINER = SoupStrainer('div', id='main')
+
+# ✅ W3Schools şablonu sabit: çoğu sayfa DOM kurmadan regex ile çıkarılabilir
+_W3_MAIN_RE = re.compile(r'<div\b[^>]*\bid=["\']main["\'][^>]*>', re.I)
+_DIV_TAG_RE = re.compile(r'<(/?)div\b[^>]*>', re.I)
+_W3_P_RE = re.compile(r'<p(?:\s[^>]*)?>(.*?)</p>', re.I | re.S)
+_W3_CODE_RE = re.compile(r'<div\b[^>]*\bclass="w3-code[^"]*"[^>]*>(.*?)</div>', re.I | re.S)
+_TAG_RE = re.compile(r'<[^>]+>')
+_SPACE_RE = re.compile(r'\s+')
+
+
+_GFG_BASE_URL = 'https://www.geeksforgeeks.org'
+
+
+def _gfg_absolute_url(href: str) -> str:
+    """GeeksforGeeks bağlantısını mutlak URL'ye çevir"""
+    # ✅ Yaygın durum kök-göreli yol: urljoin yerine doğrudan birleştir
+    if href.startswith('/') and not href.startswith('//'):
+        return _GFG_BASE_URL + href
+    return urljoin(_GFG_BASE_URL, href)
+
+
+def _fenced(code: str) -> str:
+    """Kod bloğunu markdown çitleriyle sar"""
+    return f"```\n{code}\n```"
+
+
+def _parse_gfg_search(html: str, max_results: int) -> List[tuple]:
+    """GeeksforGeeks arama sayfasından (başlık, href) çiftleri"""
+    links = []
+    if SELECTOLAX_AVAILABLE:
+        for head in LexborHTMLParser(html).css('div.head')[:max_results]:
+            link_elem = head.css_first('a')
+            if link_elem is not None:
+                links.append((link_elem.text(strip=True), link_elem.attributes.get('href') or ''))
+        return links
+
+    soup = BeautifulSoup(html, _BS4_PARSER, parse_only=_GFG_SEARCH_STRAINER)
+    for head in soup.find_all('div', class_='head')[:max_results]:
+        link_elem = head.find('a')
+        if link_elem:
+            links.append((link_elem.get_text(strip=True), link_elem.get('href', '')))
+    return links
+
+
+def _parse_gfg_content(html: str) -> Optional[str]:
+    """GeeksforGeeks makale metni; kod blokları çitlerle işaretlenir"""
+    if SELECTOLAX_AVAILABLE:
+        content_div = LexborHTMLParser(html).css_first('div.text')
+        if content_div is None:
+            return None
+
+        # Ağacı değiştirmeden tek geçişte metni topla
+        parts = []
+
+        def walk(node):
+            for child in node.iter(include_text=True):
+                if child.tag == '-text':
+                    parts.append(child.text(strip=True))
+                elif child.tag in ('pre', 'code'):
+                    parts.append(_fenced(child.text()))
+                else:
+                    walk(child)
+
+        walk(content_div)
+        return ''.join(parts)[:2000]  # İlk 2000 karakter
+
+    soup = BeautifulSoup(html, _BS4_PARSER, parse_only=_GFG_CONTENT_STRAINER)
+    content_div = soup.find('div', class_='text')
+    if not content_div:
+        return None
+
+    # ✅ Tek geçiş: kod bloklarını çitle, alt ağaçlarını atla, ağacı değiştirme
+    parts = []
+
+    def walk(node):
+        for child in node.children:
+            if isinstance(child, Tag):
+                if child.name in ('pre', 'code'):
+                    parts.append(_fenced(child.get_text()))
+                else:
+                    walk(child)
+            elif type(child) is NavigableString:
+                parts.append(child.strip())
+
+    walk(content_div)
+    return ''.join(parts)[:2000]  # İlk 2000 karakter
+
+
+def _div_inner_html(html: str, start: int) -> Optional[str]:
+    """`start`'ta açılan div'in iç HTML'i; kapanış bulunamazsa None"""
+    depth = 1
+    for match in _DIV_TAG_RE.finditer(html, start):
+        if match.group(1):
+            depth -= 1
+            if depth == 0:
+                return html[start:match.start()]
+        else:
+            depth += 1
+    return None
+
+
+def _w3_regex_extract(html: str) -> Optional[tuple]:
+    """Hızlı yol: ayrıştırıcı olmadan (paragraflar, kod örnekleri); şablon tutmazsa None"""
+    main_match = _W3_MAIN_RE.search(html)
+    if main_match is None:
+        return None
+    # Yalnızca div#main içeriği: kenar çubuğu/altbilgi paragrafları dahil edilmesin
+    main_html = _div_inner_html(html, main_match.end())
+    if main_html is None:
+        return None
+
+    paragraphs = []
+    for match in _W3_P_RE.finditer(main_html):
+        text = _SPACE_RE.sub(' ', html_lib.unescape(_TAG_RE.sub(' ', match.group(1)))).strip()
+        if text:
+            paragraphs.append(text)
+            if len(paragraphs) == 5:
+                break
+    if len(paragraphs) < 5:
+        return None
+
+    code_examples = [
+        html_lib.unescape(_TAG_RE.sub('', match.group(1)))
+        for match in _W3_CODE_RE.finditer(main_html)
+    ][:2]
+    return paragraphs, code_examples
+
+
+def _parse_w3_content(html: str) -> Optional[str]:
+    """W3Schools ders sayfasından ilk paragraflar ve kod örnekleri"""
+    extracted = _w3_regex_extract(html)
+    if extracted is not None:
+        paragraphs, code_examples = extracted
+    elif SELECTOLAX_AVAILABLE:
+        main_content = LexborHTMLParser(html).css_first('div#main')
+        if main_content is None:
+            return None
+        paragraphs = [p.text(separator=' ', strip=True) for p in main_content.css('p')[:5]]
+        code_examples = [code.text() for code in main_content.css('div.w3-code')[:2]]
+    else:
+        soup = BeautifulSoup(html, _BS4_PARSER, parse_only=_W3_CONTENT_STRAINER)
+        main_content = soup.find('div', id='main')
+        if not main_content:
+            return None
+        paragraphs = [' '.join(p.stripped_strings) for p in main_content.find_all('p')[:5]]
+        code_examples = [code.get_text() for code in main_content.find_all('div', class_='w3-code')[:2]]
+
+    # İlk birkaç paragraf + varsa kod örnekleri
+    content = '\n\n'.join(paragraphs)
+    for code in code_examples:
+        content += f"\n\n```\n{code}\n```"
+
+    return content[:1500]  # İlk 1500 karakter
+
 
 class SimpleWebSearchSystem:
     """
@@ -32,32 +269,113 @@ class SimpleWebSearchSystem:
     def __init__(self):
         self.session = None
         
+        # ✅ LRU + TTL önbellekleri: (son kullanma zamanı, değer)
+        self._query_cache = OrderedDict()
+        self._page_cache = OrderedDict()
+        
+        # Opsiyonel HTTP/2 istemcisi (GeeksforGeeks istekleri için)
+        self._httpx = None
+        
         # Search URLs - Bot-friendly sites
         self.search_urls = {
             'duckduckgo': 'https://api.duckduckgo.com/?q={}&format=json&no_html=1&skip_disambig=1',
             'geeksforgeeks': 'https://www.geeksforgeeks.org/search/{}/',
             'w3schools': 'https://www.w3schools.com/search/search_asp.asp?search={}',
         }
+        self._ddg_url_tmpl = self.search_urls['duckduckgo']
+        self._gfg_search_url_tmpl = self.search_urls['geeksforgeeks']
         
         logger.info("🌐 Simple Web Search System initialized")
     
+    @staticmethod
+    def _cache_get(cache: OrderedDict, key):
+        """Süresi dolmamış kaydı döndür ve en son kullanılan olarak işaretle"""
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        expiry, value = entry
+        if expiry < time.monotonic():
+            del cache[key]
+            return None
+        cache.move_to_end(key)
+        return value
+    
+    @staticmethod
+    def _cache_put(cache: OrderedDict, key, value, ttl: float, max_entries: int):
+        """Kaydı sakla, önbellek dolduğunda en eski kaydı at"""
+        cache[key] = (time.monotonic() + ttl, value)
+        cache.move_to_end(key)
+        if len(cache) > max_entries:
+            cache.popitem(last=False)
+    
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """Oturumu ilk kullanımda aç, sonraki sorgularda yeniden kullan"""
+        # ✅ Tek oturum: keep-alive bağlantı havuzu ve DNS önbelleği sorgular arasında korunur
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=64,
+                    limit_per_host=16,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=30
+                ),
+                timeout=aiohttp.ClientTimeout(total=15),
+                headers=_REQUEST_HEADERS
+            )
+        return self.session
+    
+    def _ensure_httpx(self):
+        """HTTP/2 istemcisini ilk kullanımda oluştur (httpx + h2 kuruluysa)"""
+        if self._httpx is None or self._httpx.is_closed:
+            self._httpx = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+                timeout=15.0,
+                headers={k: v for k, v in _REQUEST_HEADERS.items() if k != 'Connection'},
+                follow_redirects=True
+            )
+        return self._httpx
+    
+    async def _fetch_gfg_page(self, url: str) -> Tuple[int, Optional[str]]:
+        """GeeksforGeeks sayfasını getir: (durum kodu, HTML)"""
+        # ✅ Arama + N içerik isteği aynı host'a gider - HTTP/2 varsa tek bağlantıda çoğulla
+        if HTTPX_HTTP2_AVAILABLE:
+            client = self._ensure_httpx()
+            async with client.stream('GET', url) as response:
+                if response.status_code != 200:
+                    return response.status_code, None
+                chunks = []
+                size = 0
+                async for chunk in response.aiter_bytes():
+                    chunks.append(chunk)
+                    size += len(chunk)
+                    if size >= MAX_PAGE_BYTES:
+                        break
+                raw = b''.join(chunks)[:MAX_PAGE_BYTES]
+                return 200, raw.decode(response.encoding or 'utf-8', errors='replace')
+        
+        async with self.session.get(url) as response:
+            if response.status != 200:
+                return response.status, None
+            return 200, await read_text_capped(response, MAX_PAGE_BYTES)
+    
+    async def aclose(self):
+        """Oturumu kapat - uygulama kapanışında çağrılır"""
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+        if self._httpx is not None:
+            await self._httpx.aclose()
+            self._httpx = None
+    
     async def __aenter__(self):
         """Async context manager entry"""
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=15),
-            headers={
-                'User-Agent': 'Mozilla/5.0 (compatible; Educational-Bot/1.0)',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Connection': 'keep-alive'
-            }
-        )
+        await self._ensure_session()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
-        if self.session:
-            await self.session.close()
+        await self.aclose()
     
     async def search_programming_question(self, query: str, max_results: int = 3) -> List[Dict]:
         """
@@ -70,49 +388,57 @@ class SimpleWebSearchSystem:
         Returns:
             List[Dict]: Arama sonuçları
         """
+        cache_key = (query, max_results)
+        cached = self._cache_get(self._query_cache, cache_key)
+        if cached is not None:
+            logger.debug("📦 Cache hit for query: %s", query)
+            return [dict(result) for result in cached]
+        
         try:
-            logger.info(f"🔍 Simple web search for: {query}")
+            logger.info("🔍 Simple web search for: %s", query)
             
-            async with self:
-                all_results = []
-                
-                # 1. DuckDuckGo instant answers
-                ddg_results = await self._search_duckduckgo(query)
-                all_results.extend(ddg_results)
-                
-                # 2. GeeksforGeeks search
-                if self._is_programming_query(query):
-                    geeks_results = await self._search_geeksforgeeks(query, 2)
-                    all_results.extend(geeks_results)
-                
-                # 3. W3Schools search (for web technologies)
-                if self._is_web_tech_query(query):
-                    w3_results = await self._search_w3schools(query, 1)
-                    all_results.extend(w3_results)
-                
-                # Sonuçları kalite skoruna göre sırala
-                all_results.sort(key=lambda x: x.get('quality_score', 0), reverse=True)
-                
-                return all_results[:max_results]
+            await self._ensure_session()
+            
+            # 1. DuckDuckGo instant answers
+            searches = [self._search_duckduckgo(query)]
+            
+            # 2. GeeksforGeeks search
+            if self._is_programming_query(query):
+                searches.append(self._search_geeksforgeeks(query, 2))
+            
+            # 3. W3Schools search (for web technologies)
+            if self._is_web_tech_query(query):
+                searches.append(self._search_w3schools(query, 1))
             
+            # ✅ Sağlayıcılar bağımsız - eşzamanlı çalıştır, gecikme = en yavaş sağlayıcı
+            results_lists = await asyncio.gather(*searches, return_exceptions=True)
+            all_results = [
+                result
+                for results in results_lists
+                if not isinstance(results, Exception)
+                for result in results
+            ]
+            
+            # ✅ Tüm listeyi sıralamadan en iyi max_results sonucu seç
+            results = heapq.nlargest(max_results, all_results, key=lambda x: x.get('quality_score', 0))
+            if results:
+                self._cache_put(self._query_cache, cache_key, [dict(result) for result in results],
+                                QUERY_CACHE_TTL, QUERY_CACHE_MAX_ENTRIES)
+            return results
+        
         except Exception as e:
             logger.error(f"❌ Simple web search error: {e}")
             return []
     
     def _is_programming_query(self, query: str) -> bool:
         """Programlama sorgusu mu kontrol et"""
-        programming_keywords = [
-            'java', 'android', 'python', 'javascript', 'html', 'css',
-            'code', 'programming', 'tutorial', 'example', 'how to'
-        ]
-        query_lower = query.lower()
-        return any(keyword in query_lower for keyword in programming_keywords)
+        if not _PROGRAMMING_KEYWORDS.isdisjoint(_query_tokens(query)):
+            return True
+        return _HOW_TO_RE.search(query.lower()) is not None
     
     def _is_web_tech_query(self, query: str) -> bool:
         """Web teknolojisi sorgusu mu kontrol et"""
-        web_keywords = ['html', 'css', 'javascript', 'react', 'vue', 'angular', 'bootstrap']
-        query_lower = query.lower()
-        return any(keyword in query_lower for keyword in web_keywords)
+        return not _WEB_TECH_KEYWORDS.isdisjoint(_query_tokens(query))
     
     async def _search_duckduckgo(self, query: str) -> List[Dict]:
         """DuckDuckGo instant answers API kullan"""
@@ -120,11 +446,11 @@ class SimpleWebSearchSystem:
             if not self.session:
                 return []
             
-            search_url = self.search_urls['duckduckgo'].format(quote_plus(query))
+            search_url = self._ddg_url_tmpl.format(quote_plus(query))
             
             async with self.session.get(search_url) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = _loads(await read_body_capped(response, MAX_JSON_BYTES))
                     
                     results = []
                     
@@ -148,10 +474,10 @@ class SimpleWebSearchSystem:
                             'quality_score': 7.0
                         })
                     
-                    logger.info(f"✅ Found {len(results)} DuckDuckGo results")
+                    logger.info("✅ Found %d DuckDuckGo results", len(results))
                     return results
                 else:
-                    logger.warning(f"⚠️ DuckDuckGo search failed: {response.status}")
+                    logger.warning("⚠️ DuckDuckGo search failed: %d", response.status)
                     return []
                     
         except Exception as e:
@@ -164,51 +490,44 @@ class SimpleWebSearchSystem:
             if not self.session:
                 return []
             
-            search_url = self.search_urls['geeksforgeeks'].format(quote_plus(query))
+            search_url = self._gfg_search_url_tmpl.format(quote_plus(query))
             
-            async with self.session.get(search_url) as response:
-                if response.status == 200:
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
-                    results = []
-                    
-                    # GeeksforGeeks search results
-                    search_results = soup.find_all('div', class_='head')[:max_results]
-                    
-                    for result in search_results:
-                        try:
-                            link_elem = result.find('a')
-                            if not link_elem:
-                                continue
-                            
-                            title = link_elem.get_text(strip=True)
-                            relative_url = link_elem.get('href', '')
-                            full_url = urljoin('https://www.geeksforgeeks.org', relative_url)
-                            
-                            # İçerik al
-                            content = await self._get_geeksforgeeks_content(full_url)
-                            
-                            if content:
-                                result_dict = {
-                                    'title': title,
-                                    'content': content,
-                                    'url': full_url,
-                                    'source': 'GeeksforGeeks',
-                                    'quality_score': 7.5
-                                }
-                                results.append(result_dict)
-                            
-                        except Exception as e:
-                            logger.warning(f"⚠️ Error parsing GeeksforGeeks result: {e}")
-                            continue
-                    
-                    logger.info(f"✅ Found {len(results)} GeeksforGeeks results")
-                    return results
-                else:
-                    logger.warning(f"⚠️ GeeksforGeeks search failed: {response.status}")
-                    return []
+            status, html = await self._fetch_gfg_page(search_url)
+            if status == 200:
+                # GeeksforGeeks search results
+                links = [
+                    (title, _gfg_absolute_url(relative_url))
+                    for title, relative_url in _parse_gfg_search(html, max_results)
+                ]
+                
+                # ✅ Makale içeriklerini eşzamanlı al
+                contents = await asyncio.gather(
+                    *(self._get_geeksforgeeks_content(full_url) for _, full_url in links),
+                    return_exceptions=True
+                )
+                
+                results = []
+                for (title, full_url), content in zip(links, contents):
+                    if isinstance(content, Exception):
+                        logger.warning("⚠️ Error parsing GeeksforGeeks result: %s", content)
+                        continue
                     
+                    if content:
+                        result_dict = {
+                            'title': title,
+                            'content': content,
+                            'url': full_url,
+                            'source': 'GeeksforGeeks',
+                            'quality_score': 7.5
+                        }
+                        results.append(result_dict)
+                
+                logger.info("✅ Found %d GeeksforGeeks results", len(results))
+                return results
+            else:
+                logger.warning("⚠️ GeeksforGeeks search failed: %d", status)
+                return []
+                
         except Exception as e:
             logger.error(f"❌ GeeksforGeeks search error: {e}")
             return []
@@ -216,31 +535,26 @@ class SimpleWebSearchSystem:
     async def _get_geeksforgeeks_content(self, url: str) -> Optional[str]:
         """GeeksforGeeks sayfasının içeriğini al"""
         try:
+            cached = self._cache_get(self._page_cache, url)
+            if cached is not None:
+                return cached
+            
             if not self.session:
                 return None
             
-            async with self.session.get(url) as response:
-                if response.status == 200:
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
-                    # Ana içerik
-                    content_div = soup.find('div', class_='text')
-                    if content_div:
-                        # Code blokları için özel işlem
-                        code_blocks = content_div.find_all(['pre', 'code'])
-                        for block in code_blocks:
-                            block.string = f"\n```\n{block.get_text()}\n```\n"
-                        
-                        content = content_div.get_text(strip=True)
-                        return content[:2000]  # İlk 2000 karakter
-                    
-                    return None
-                else:
-                    return None
-                    
+            status, html = await self._fetch_gfg_page(url)
+            if status == 200:
+                # Ana içerik
+                content = _parse_gfg_content(html)
+                if content:
+                    self._cache_put(self._page_cache, url, content,
+                                    PAGE_CACHE_TTL, PAGE_CACHE_MAX_ENTRIES)
+                return content
+            else:
+                return None
+                
         except Exception as e:
-            logger.warning(f"⚠️ Error fetching GeeksforGeeks content: {e}")
+            logger.warning("⚠️ Error fetching GeeksforGeeks content: %s", e)
             return None
     
     async def _search_w3schools(self, query: str, max_results: int = 1) -> List[Dict]:
@@ -249,32 +563,25 @@ class SimpleWebSearchSystem:
             if not self.session:
                 return []
             
-            # W3Schools için basit bir yaklaşım - direkt tutorial sayfalarına git
-            w3_topics = {
-                'html': 'https://www.w3schools.com/html/',
-                'css': 'https://www.w3schools.com/css/',
-                'javascript': 'https://www.w3schools.com/js/',
-                'react': 'https://www.w3schools.com/react/',
-                'bootstrap': 'https://www.w3schools.com/bootstrap/'
-            }
-            
-            query_lower = query.lower()
+            # ✅ Tek derlenmiş regex ile konu eşleştirme, öncelik _W3_TOPICS sırasında
+            matched = {m.lower() for m in _W3_TOPIC_RE.findall(query)}
             results = []
             
-            for topic, url in w3_topics.items():
-                if topic in query_lower:
-                    content = await self._get_w3schools_content(url)
-                    if content:
-                        results.append({
-                            'title': f'W3Schools {topic.upper()} Tutorial',
-                            'content': content,
-                            'url': url,
-                            'source': 'W3Schools',
-                            'quality_score': 6.5
-                        })
-                        break
+            for topic, url in _W3_TOPICS.items():
+                if topic not in matched:
+                    continue
+                content = await self._get_w3schools_content(url)
+                if content:
+                    results.append({
+                        'title': f'W3Schools {topic.upper()} Tutorial',
+                        'content': content,
+                        'url': url,
+                        'source': 'W3Schools',
+                        'quality_score': 6.5
+                    })
+                    break
             
-            logger.info(f"✅ Found {len(results)} W3Schools results")
+            logger.info("✅ Found %d W3Schools results", len(results))
             return results[:max_results]
                     
         except Exception as e:
@@ -284,37 +591,54 @@ class SimpleWebSearchSystem:
     async def _get_w3schools_content(self, url: str) -> Optional[str]:
         """W3Schools sayfasının içeriğini al"""
         try:
+            cached = self._cache_get(self._page_cache, url)
+            if cached is not None:
+                return cached
+            
             if not self.session:
                 return None
             
             async with self.session.get(url) as response:
                 if response.status == 200:
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
+                    html = await read_text_capped(response, MAX_PAGE_BYTES)
                     
                     # Ana içerik
-                    main_content = soup.find('div', id='main')
-                    if main_content:
-                        # İlk birkaç paragrafı al
-                        paragraphs = main_content.find_all('p')[:5]
-                        content = '\n\n'.join([p.get_text(strip=True) for p in paragraphs])
-                        
-                        # Code örnekleri varsa ekle
-                        code_examples = main_content.find_all('div', class_='w3-code')[:2]
-                        for code in code_examples:
-                            content += f"\n\n```\n{code.get_text()}\n```"
-                        
-                        return content[:1500]  # İlk 1500 karakter
-                    
-                    return None
+                    content = _parse_w3_content(html)
+                    if content:
+                        self._cache_put(self._page_cache, url, content,
+                                        PAGE_CACHE_TTL, PAGE_CACHE_MAX_ENTRIES)
+                    return content
                 else:
                     return None
                     
         except Exception as e:
-            logger.warning(f"⚠️ Error fetching W3Schools content: {e}")
+            logger.warning("⚠️ Error fetching W3Schools content: %s", e)
             return None
 
 
+# Event loop başına paylaşılan arama sistemi: aiohttp oturumu oluşturulduğu loop'a bağlıdır,
+# her asyncio.run kendi sistemini alır (loop çöp toplanınca kayıt da düşer)
+_default_systems: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, SimpleWebSearchSystem]" = \
+    weakref.WeakKeyDictionary()
+
+
+async def _get_default_system() -> SimpleWebSearchSystem:
+    """Çalışan event loop'un paylaşılan arama sistemini döndür, yoksa oluştur"""
+    loop = asyncio.get_running_loop()
+    system = _default_systems.get(loop)
+    if system is None:
+        # Oluşturma await içermez, loop üzerinde atomiktir: kilit gerekmez
+        system = _default_systems[loop] = SimpleWebSearchSystem()
+    return system
+
+
+async def close_default_search_system():
+    """Çalışan event loop'un paylaşılan arama sistemini kapat - loop bitmeden çağır"""
+    system = _default_systems.pop(asyncio.get_running_loop(), None)
+    if system is not None:
+        await system.aclose()
+
+
 # Convenience function for easy import
 async def search_programming_question(query: str, max_results: int = 3) -> List[Dict]:
     """
@@ -327,5 +651,5 @@ async def search_programming_question(query: str, max_results: int = 3) -> List[
     Returns:
         List[Dict]: Arama sonuçları
     """
-    search_system = SimpleWebSearchSystem()
+    search_system = await _get_default_system()
     return await search_system.search_programming_question(query, max_results)
\ No newline at end of file
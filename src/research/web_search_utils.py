@@ -4,6 +4,7 @@
 Enhanced search functionality for programming questions - NOW USING REAL WEB SEARCH
 """
 
+import atexit
 import logging
 import asyncio
 from typing import List, Dict, Optional
@@ -11,6 +12,27 @@ import re
 
 logger = logging.getLogger(__name__)
 
+# ✅ Tek paylaşılan arama sistemi: DDGS istemcisi, semaphore ve sorgu önbelleği sorgular arasında korunur
+_search_system = None
+
+
+def _get_search_system():
+    """Paylaşılan RealWebSearchSystem'i ilk aramada oluştur"""
+    global _search_system
+    if _search_system is None:
+        from .real_web_search import RealWebSearchSystem
+        _search_system = RealWebSearchSystem()
+        atexit.register(close_search_system)
+    return _search_system
+
+
+def close_search_system():
+    """Paylaşılan arama sisteminin DDGS istemcisini kapat - uygulama kapanışında çağrılır"""
+    global _search_system
+    if _search_system is not None:
+        _search_system.close()
+        _search_system = None
+
 
 async def search_programming_question(query: str) -> List[Dict]:
     """
@@ -22,24 +44,25 @@ async def search_programming_question(query: str) -> List[Dict]:
     Returns:
         List of search results with title, content, and url
     """
+    # Boş sorgu hiçbir sonuç üretemez - ağ araması başlatma
+    if not query or not query.strip():
+        return []
+
     try:
-        logger.info(f"🌐 REAL web search for programming question: {query}")
-        
-        # Use real web search system for real results
-        from .real_web_search import RealWebSearchSystem
+        logger.info("🌐 REAL web search for programming question: %s", query)
         
-        search_system = RealWebSearchSystem()
-        results = await search_system.search_programming_question(query, max_results=3)
+        # Use the shared real web search system for real results (its query cache serves repeats)
+        results = await _get_search_system().search_programming_question(query, max_results=3)
         
         if results:
-            logger.info(f"✅ Found {len(results)} real web results")
+            logger.info("✅ Found %d real web results", len(results))
             return results
         else:
-            logger.warning(f"⚠️ No real web results found for: {query}")
+            logger.warning("⚠️ No real web results found for: %s", query)
             return []
         
     except Exception as e:
-        logger.error(f"❌ Real web search error: {e}")
+        logger.error("❌ Real web search error: %s", e)
         # Return empty list instead of mock data
         return []
 
@@ -4,30 +4,82 @@ Minimal LoRA Training Test
 Search results [2]: systematic experimentation approach
 """
 
+import os
+import sys
+import time
+from functools import lru_cache
 
-def start_micro_training():
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from src.utils.environment import lora_compile_requested
+
+# Ağır bağımlılıklar uygulama açılışında bir kez yüklenir; GPU bağımlılıkları
+# olmayan ortamlarda modül yine de import edilebilir
+try:
+    import torch
+    from peft import LoraConfig, TaskType, get_peft_model
+    from transformers import (AutoModelForCausalLM, AutoTokenizer, BitsAndBytesConfig,
+                              DataCollatorForLanguageModeling, Trainer, TrainingArguments)
+    TRAINING_DEPS_AVAILABLE = True
+except ImportError:
+    TRAINING_DEPS_AVAILABLE = False
+
+MICRO_MODEL_NAME = 'bigcode/starcoder2-3b'
+# (load_in_4bit, bnb_4bit_compute_dtype, bnb_4bit_quant_type, bnb_4bit_use_double_quant)
+MICRO_QUANT_KEY = (True, 'bfloat16', 'nf4', True)
+
+
+@lru_cache(maxsize=2)
+def _load_tokenizer(model_name: str):
+    """Tokenizer'ı bir kez yükle, sonraki testlerde yeniden kullan"""
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    if tokenizer.pad_token is None:
+        tokenizer.pad_token = tokenizer.eos_token
+    return tokenizer
+
+
+@lru_cache(maxsize=2)
+def _load_quantized_model(model_name: str, quant_key: tuple):
+    """4-bit taban modeli bir kez yükle/quantize et (10-30 sn) ve önbellekte tut"""
+    load_in_4bit, compute_dtype, quant_type, double_quant = quant_key
+    return AutoModelForCausalLM.from_pretrained(
+        model_name,
+        quantization_config=BitsAndBytesConfig(
+            load_in_4bit=load_in_4bit,
+            bnb_4bit_compute_dtype=getattr(torch, compute_dtype),
+            bnb_4bit_quant_type=quant_type,
+            bnb_4bit_use_double_quant=double_quant
+        ),
+        device_map='auto'
+    )
+
+
+def start_micro_training(max_steps: int = 2):
     """
     5 dakikalık LoRA training test
     Search results [2]: start conservative, observe results
     """
-    return run_5_minute_test()
+    return run_5_minute_test(max_steps)
 
 
-def run_5_minute_test():
+def run_5_minute_test(max_steps: int = 2):
     """
     5 dakikalık LoRA training test
     Search results [2]: start conservative, observe results
+
+    Args:
+        max_steps: Training step sayısı (varsayılan 2; torch.compile yalnızca >= 20'de devreye girer)
     """
     print("🚀 5-Minute LoRA Test - Search Results [2] Approach")
     print("=" * 50)
 
-    # Previous successful setup (tokenization fix ile)
-    from transformers import (AutoTokenizer, AutoModelForCausalLM,
-                              BitsAndBytesConfig, Trainer, TrainingArguments)
-    from peft import LoraConfig, get_peft_model, TaskType
-    from datasets import Dataset
-    import torch
-    import time
+    if not TRAINING_DEPS_AVAILABLE:
+        print("❌ torch / transformers / peft yüklü değil")
+        return False
+
+    # ✅ FP32 matmul'lar (LoRA adapter yolları) Ampere+ üzerinde TF32 tensor core kullansın
+    torch.backends.cuda.matmul.allow_tf32 = True
+    torch.backends.cudnn.allow_tf32 = True
+    torch.set_float32_matmul_precision('high')
 
     start_time = time.time()
 
@@ -37,20 +89,9 @@ def run_5_minute_test():
         {"text": "def multiply(a, b): return a * b"}
     ]
 
-    # Model setup (başarılı test config)
-    tokenizer = AutoTokenizer.from_pretrained('bigcode/starcoder2-3b')
-    if tokenizer.pad_token is None:
-        tokenizer.pad_token = tokenizer.eos_token
-
-    model = AutoModelForCausalLM.from_pretrained(
-        'bigcode/starcoder2-3b',
-        quantization_config=BitsAndBytesConfig(
-            load_in_4bit=True,
-            bnb_4bit_compute_dtype=torch.bfloat16,
-            bnb_4bit_quant_type='nf4'
-        ),
-        device_map='auto'
-    )
+    # Model setup (başarılı test config) - önbellekten, tekrar çalıştırmada yükleme yok
+    tokenizer = _load_tokenizer(MICRO_MODEL_NAME)
+    base_model = _load_quantized_model(MICRO_MODEL_NAME, MICRO_QUANT_KEY)
 
     # Search results [1] optimized LoRA config
     lora_config = LoraConfig(
@@ -61,62 +102,100 @@ def run_5_minute_test():
         lora_dropout=0.05
     )
 
-    model = get_peft_model(model, lora_config)
-
-    # Search results [1] tokenization fix
-    def tokenize_function(examples):
-        tokens = tokenizer(
-            examples['text'],
-            padding='max_length',
+    # ✅ LoRA katmanları önbellekteki taban modele yerinde eklenir; iş bitince
+    # (hata olsa bile) kaldırılır ki sonraki test temiz taban model üzerinde yeni adapter kursun
+    model = None
+    input_grads_enabled = False
+    try:
+        model = get_peft_model(base_model, lora_config)
+
+        # ✅ Non-reentrant gradient checkpointing: aktivasyon belleği ~%40 azalır,
+        # karşılığında ikinci forward pass; kazanılan bellek daha büyük batch'e gider
+        model.gradient_checkpointing_enable(gradient_checkpointing_kwargs={'use_reentrant': False})
+        model.enable_input_require_grads()
+        input_grads_enabled = True
+
+        # Search results [1] tokenization fix
+        # ✅ Padding yok: collator her batch'i kendi en uzun örneğine kadar doldurur
+        # ✅ 2 örnek için Arrow dataset/map yükü yerine tek tokenizer çağrısı yeterli
+        encodings = tokenizer(
+            [item['text'] for item in micro_data],
             max_length=128,  # Küçük (hızlı test)
             truncation=True,
             return_tensors=None
         )
-        tokens['labels'] = [ids.copy() for ids in tokens['input_ids']]
-        return tokens
-
-    # Dataset prepare
-    dataset = Dataset.from_list(micro_data)
-    tokenized_dataset = dataset.map(tokenize_function, batched=True, remove_columns=['text'])
-
-    # Ultra-minimal training args (5 dakika target)
-    training_args = TrainingArguments(
-        output_dir='./micro_5min_test',
-        per_device_train_batch_size=1,
-        gradient_accumulation_steps=2,
-        num_train_epochs=1,  # Tek epoch
-        learning_rate=1e-4,
-        bf16=True,
-        save_steps=1,
-        logging_steps=1,
-        remove_unused_columns=False,
-        report_to=None,
-        max_steps=2  # Sadece 2 step (ultra-fast test)
-    )
+        tokenized_dataset = [
+            {key: values[i] for key, values in encodings.items()}
+            for i in range(len(micro_data))
+        ]
+
+        # torch.compile ısınması kısa koşularda kazançtan pahalı: yalnızca GPU'da,
+        # >= 20 step için ve COMPILE_LORA=1 ile istendiyse derle
+        compile_model = (
+            torch.cuda.is_available()
+            and lora_compile_requested()
+            and max_steps >= 20
+        )
+        if compile_model:
+            import torch._inductor.config as inductor_config
+            inductor_config.coordinate_descent_tuning = True
+
+        # Ultra-minimal training args (5 dakika target)
+        training_args = TrainingArguments(
+            output_dir='./micro_5min_test',
+            per_device_train_batch_size=2,  # Checkpointing sayesinde tüm micro set tek batch
+            gradient_accumulation_steps=1,  # 2 örnekte biriktirme gereksiz pas demek
+            num_train_epochs=1,  # Tek epoch
+            learning_rate=1e-4,
+            optim='paged_adamw_8bit',  # bitsandbytes PagedAdamW8bit: int8 optimizer state
+            gradient_checkpointing=True,
+            gradient_checkpointing_kwargs={'use_reentrant': False},
+            bf16=True,
+            bf16_full_eval=True,  # Eval de bf16'da, fp32'ye yükseltme yok
+            save_steps=1,
+            logging_steps=1,
+            remove_unused_columns=False,
+            report_to=None,
+            max_steps=max_steps,
+            torch_compile=compile_model,
+            torch_compile_mode='reduce-overhead' if compile_model else None
+        )
 
-    # ✅ Fixed: processing_class kullan
-    trainer = Trainer(
-        model=model,
-        args=training_args,
-        train_dataset=tokenized_dataset,
-        processing_class=tokenizer  # Search results fix
-    )
+        # Dinamik padding + labels (causal LM: input_ids kopyası, pad'ler -100)
+        data_collator = DataCollatorForLanguageModeling(tokenizer, mlm=False)
+
+        # ✅ Fixed: processing_class kullan
+        trainer = Trainer(
+            model=model,
+            args=training_args,
+            train_dataset=tokenized_dataset,
+            data_collator=data_collator,
+            processing_class=tokenizer  # Search results fix
+        )
 
-    print(f"🎯 {len(micro_data)} örnek, {training_args.max_steps} steps")
-    print("⏱️ Target: 5 dakika")
+        print(f"🎯 {len(micro_data)} örnek, {training_args.max_steps} steps")
+        print("⏱️ Target: 5 dakika")
 
-    # Training başlat
-    trainer.train()
+        # Training başlat
+        trainer.train()
 
-    elapsed = time.time() - start_time
-    print(f"✅ Training tamamlandı! Süre: {elapsed / 60:.1f} dakika")
+        elapsed = time.time() - start_time
+        print(f"✅ Training tamamlandı! Süre: {elapsed / 60:.1f} dakika")
 
-    # Model kaydet
-    model.save_pretrained('./micro_trained_model')
-    print("💾 Model kaydedildi: ./micro_trained_model")
+        # Model kaydet
+        model.save_pretrained('./micro_trained_model')
+        print("💾 Model kaydedildi: ./micro_trained_model")
+    finally:
+        # Önbellekteki taban modelde checkpointing ve embedding hook'u kalmasın
+        if model is not None:
+            if input_grads_enabled:
+                model.disable_input_require_grads()
+            model.gradient_checkpointing_disable()
+            model.unload()
 
     return True
 
 
 if __name__ == "__main__":
-    start_micro_training()
+    # MICRO_MAX_STEPS=20+ ile torch.compile yolu da denenebilir
+    start_micro_training(int(os.getenv('MICRO_MAX_STEPS', '2')))
@@ -6,12 +6,32 @@ RTX 3060 + transformers 4.56.0 future-proof approach
 
 import sys
 import os
+from functools import lru_cache
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from src.utils.environment import CUDA_ALLOC_CONF
+
+# ✅ Allocator ayarı CUDA başlatılırken bir kez okunur: torch import edilmeden önce ver
+os.environ.setdefault('PYTORCH_CUDA_ALLOC_CONF', CUDA_ALLOC_CONF)
+
 from src.models.model_loader import model_loader
 
+_GIB = 1024 ** 3
 
 
+@lru_cache(maxsize=1)
+def _total_vram_gb():
+    """Toplam GPU belleği süreç boyunca değişmez - sürücüyü bir kez sorgula"""
+    import torch
+    if not torch.cuda.is_available():
+        return 0.0
+    return torch.cuda.get_device_properties(0).total_memory / _GIB
+
+
+def _alloc_gb():
+    """Şu an ayrılmış GPU belleği (GB)"""
+    import torch
+    return torch.cuda.memory_allocated(0) / _GIB
 
 
 def create_optimized_lora_config():
@@ -21,11 +41,9 @@ def create_optimized_lora_config():
     lora_config = LoraConfig(
         task_type=TaskType.CAUSAL_LM,
         r=16,
-        lora_alpha=8,
-        target_modules=[
-            "q_proj", "k_proj", "v_proj", "o_proj",
-            "gate_proj", "up_proj", "down_proj"
-        ],
+        lora_alpha=32,  # alpha = 2r (scaling 2.0); alpha=8 adaptörü 0.5 ile kısıyordu
+        # ✅ Tek regex (re.fullmatch): yalnızca attention/MLP projeksiyonları, lm_head hariç
+        target_modules=r".*\.(q|k|v|o|gate|up|down)_proj$",
         lora_dropout=0.05,
         bias="none"
     )
@@ -37,16 +55,15 @@ def optimized_tokenization(tokenizer):
 
     def tokenize_function(examples):
         texts = examples['text'] if isinstance(examples['text'], list) else [examples['text']]
-        model_inputs = tokenizer(
+        # ✅ Padding ve labels yok: DataCollatorForLanguageModeling batch içindeki en uzun
+        # örneğe kadar doldurur ve labels'ı (pad'ler -100) kendisi üretir
+        return tokenizer(
             texts,
             truncation=True,
-            padding='max_length',
             max_length=512,
             return_attention_mask=True,
             return_tensors=None
         )
-        model_inputs['labels'] = [ids.copy() for ids in model_inputs['input_ids']]
-        return model_inputs
 
     return tokenize_function
 
@@ -56,7 +73,7 @@ def monitor_gpu_during_training():
     import torch
     if torch.cuda.is_available():
         print("📊 GPU Monitoring Aktif")
-        allocated_start = torch.cuda.memory_allocated(0) / 1024 ** 3
+        allocated_start = _alloc_gb()
         print(f"Başlangıç GPU bellek: {allocated_start:.2f} GB")
         return allocated_start
     return 0
@@ -81,9 +98,17 @@ def test_tensor_transfer():
         print(f"✅ Method 2 (.to('cuda')): {test_tensor_to.device}")
 
         # Non-blocking transfer test[3]
-        test_tensor_nonblock = test_tensor.to('cuda', non_blocking=True)
-        torch.cuda.synchronize()  # Synchronize for accuracy[3]
-        print(f"✅ Method 3 (non_blocking): {test_tensor_nonblock.device}")
+        # ✅ Kaynak pinned olmalı (aksi halde non_blocking etkisiz); tüm cihazı durduran
+        # synchronize yerine yalnızca bu kopyanın event'i beklenir
+        pinned_tensor = test_tensor.pin_memory()
+        start_event = torch.cuda.Event(enable_timing=True)
+        end_event = torch.cuda.Event(enable_timing=True)
+        start_event.record()
+        test_tensor_nonblock = pinned_tensor.to('cuda', non_blocking=True)
+        end_event.record()
+        end_event.synchronize()
+        transfer_ms = start_event.elapsed_time(end_event)
+        print(f"✅ Method 3 (non_blocking): {test_tensor_nonblock.device} ({transfer_ms:.3f} ms)")
 
         print(f"✅ Tensor CUDA'da: {test_tensor_cuda.is_cuda}")
     else:
@@ -111,6 +136,7 @@ def test_gpu_usage():
             model, tokenizer = model_loader.load_base_model(
                 'bigcode/starcoder2-3b',
                 use_quantization=True,
+                use_cache=False,  # Önbellek referans tutarsa eğitim sonrası del VRAM'i bırakmaz
                 use_auto_device_map=True
             )
 
@@ -141,6 +167,7 @@ def optimize_tensor_transfers(batch):
 
     if torch.cuda.is_available() and isinstance(batch, dict):
         # Non-blocking transfer ile hız optimizasyonu[3]
+        # (asenkron kopya için kaynak tensor'lar pinned olmalı - DataLoader pin_memory)
         optimized_batch = {}
         for key, value in batch.items():
             if isinstance(value, torch.Tensor):
@@ -148,41 +175,57 @@ def optimize_tensor_transfers(batch):
             else:
                 optimized_batch[key] = value
 
-        # Synchronize to ensure completion[3]
-        torch.cuda.synchronize()
+        # ✅ synchronize yok: sonraki kernel'lar stream sırası gereği kopyayı zaten bekler,
+        # host ise bir sonraki adımı kuyruğa almaya devam eder
         return optimized_batch
     return batch
 
 
+# Önbellekte bu kadardan fazla kullanılmayan blok varsa sürücüye geri ver
+CACHE_TRIM_THRESHOLD_BYTES = int(1.5 * _GIB)
+
+
+def trim_cuda_cache(threshold_bytes=CACHE_TRIM_THRESHOLD_BYTES):
+    """empty_cache'i yalnızca reserved - allocated eşiği aştığında çağırır"""
+    import torch
+
+    # ✅ Koşulsuz empty_cache sonraki ayırmaları yavaş cudaMalloc'a zorlar ve fragmentasyonu artırır
+    if not torch.cuda.is_available():
+        return False
+    if torch.cuda.memory_reserved() - torch.cuda.memory_allocated() <= threshold_bytes:
+        return False
+    torch.cuda.empty_cache()
+    return True
+
+
 def monitor_memory_usage():
     """RTX 3060 bellek durumunu izler"""
     import torch
 
     if torch.cuda.is_available():
-        allocated = torch.cuda.memory_allocated(0) / 1024 ** 3
-        reserved = torch.cuda.memory_reserved(0) / 1024 ** 3
-        total = torch.cuda.get_device_properties(0).total_memory / 1024 ** 3
+        allocated = _alloc_gb()
+        total = _total_vram_gb()
 
         print(f"📊 GPU Bellek: {allocated:.2f}GB / {total:.2f}GB ({allocated / total * 100:.1f}%)")
 
         # RTX 3060 için kritik eşik (85% üzeri tehlikeli)[1]
         if allocated / total > 0.85:
             print("⚠️ UYARI: GPU bellek kullanımı %85'i aştı!")
-            torch.cuda.empty_cache()
-            print("🧹 Otomatik cache temizliği yapıldı")
+            if trim_cuda_cache():
+                print("🧹 Otomatik cache temizliği yapıldı")
 
 
 def rtx3060_memory_optimization():
     """RTX 3060 için özel bellek optimizasyonu - Search results [2][5]"""
     import torch
-    import os
 
-    # CUDA bellek fragmentasyon kontrolü[5]
-    os.environ['PYTORCH_CUDA_ALLOC_CONF'] = 'max_split_size_mb:32'
+    # CUDA bellek fragmentasyon kontrolü[5] modül başında (torch import'undan önce) yapılır;
+    # burada yalnızca çalışma anında değiştirilebilen ayarlar kalır
 
     # RTX 3060 specific settings[2]
     torch.backends.cudnn.benchmark = True
     torch.backends.cuda.matmul.allow_tf32 = True
+    torch.backends.cudnn.allow_tf32 = True
 
     print("🔧 RTX 3060 bellek optimizasyonu aktif")
 
@@ -194,12 +237,12 @@ def prevent_oom_rtx3060():
 
     # Aggressive memory management[5]
     if torch.cuda.is_available():
-        torch.cuda.empty_cache()
         gc.collect()
+        trim_cuda_cache()
 
         # Check available memory[2]
-        allocated = torch.cuda.memory_allocated(0) / 1024 ** 3
-        total = torch.cuda.get_device_properties(0).total_memory / 1024 ** 3
+        allocated = _alloc_gb()
+        total = _total_vram_gb()
         free = total - allocated
 
         print(f"🔍 RTX 3060 Bellek Durumu: {free:.2f}GB boş / {total:.2f}GB total")
@@ -207,8 +250,8 @@ def prevent_oom_rtx3060():
         # Early warning system[2]
         if free < 2.0:  # RTX 3060 için kritik eşik
             print("⚠️ RTX 3060 UYARI: Düşük bellek! OOM riski yüksek")
-            torch.cuda.empty_cache()
             gc.collect()
+            trim_cuda_cache()
 
 def run_optimized_training():
     """Search results [1][2][3] optimization ile final training"""
@@ -216,8 +259,8 @@ def run_optimized_training():
     from transformers import (AutoTokenizer, AutoModelForCausalLM,
                               BitsAndBytesConfig, Trainer, TrainingArguments,
                               DataCollatorForLanguageModeling)
+    from transformers.utils import is_torch_tf32_available
     from peft import get_peft_model, prepare_model_for_kbit_training
-    from datasets import Dataset
     import torch
 
     rtx3060_memory_optimization()
@@ -225,9 +268,11 @@ def run_optimized_training():
     print("🚀 Optimized LoRA Training - Search Results Based")
     print("=" * 55)
 
-    # GPU testleri
-    model_test, tokenizer_test = test_gpu_usage()
-    device_test = test_tensor_transfer()
+    # GPU testleri yalnızca debug modunda: test_gpu_usage modeli tam olarak yükler
+    model, tokenizer = None, None
+    if os.environ.get('SEYDAPP_DEBUG_GPU'):
+        model, tokenizer = test_gpu_usage()
+        test_tensor_transfer()
     monitor_gpu_during_training()
 
     # Dataset
@@ -238,17 +283,14 @@ def run_optimized_training():
         {
             "text": "def binary_search(arr, target):\n    left, right = 0, len(arr) - 1\n    while left <= right:\n        mid = (left + right) // 2\n        if arr[mid] == target:\n            return mid\n        elif arr[mid] < target:\n            left = mid + 1\n        else:\n            right = mid - 1\n    return -1"}
     ]
-    dataset = Dataset.from_list(training_data)
 
-    # Model setup (test'te başarılıysa aynı modeli kullan)
-    if model_test is not None and tokenizer_test is not None:
-        print("📦 Test modelini kullanıyor...")
-        model, tokenizer = model_test, tokenizer_test
-    else:
-        print("📦 Model yeniden yükleniyor...")
+    # Model setup (debug testinde yüklendiyse aynı modeli kullan - tek yükleme)
+    if model is None or tokenizer is None:
+        print("📦 Model yükleniyor...")
         model, tokenizer = model_loader.load_base_model(
             'bigcode/starcoder2-3b',
             use_quantization=True,
+            use_cache=False,  # Önbellek referans tutarsa eğitim sonrası del VRAM'i bırakmaz
             use_auto_device_map=True
         )
 
@@ -259,17 +301,29 @@ def run_optimized_training():
 
     # Tokenization
     tokenize_fn = optimized_tokenization(tokenizer)
-    tokenized_dataset = dataset.map(tokenize_fn, batched=True, remove_columns=['text'])
+    # ✅ Arrow dataset/map yok: örnekler tek tokenizer çağrısıyla bellekte hazırlanır
+    encodings = tokenize_fn({'text': [item['text'] for item in training_data]})
+    tokenized_dataset = [
+        {key: values[i] for key, values in encodings.items()}
+        for i in range(len(training_data))
+    ]
 
     # Training arguments
     training_args = TrainingArguments(
         output_dir='./optimized_lora_output',
         per_device_train_batch_size=1,
         gradient_accumulation_steps=8,
-        dataloader_pin_memory=False,
+        # ✅ Pinned batch'ler worker'larda hazırlanır, H2D kopyası eğitim adımıyla örtüşür
+        dataloader_pin_memory=True,
+        dataloader_num_workers=2,
+        dataloader_persistent_workers=True,
+        dataloader_prefetch_factor=2,
         num_train_epochs=2,
         learning_rate=1e-4,
+        optim='paged_adamw_8bit',  # 8-bit optimizer state, ani bellek artışlarında CPU'ya sayfalanır
         bf16=True,
+        bf16_full_eval=True,  # Eval de bf16'da, fp32'ye yükseltme yok
+        tf32=is_torch_tf32_available(),  # Ampere (RTX 3060) TF32 tensor core'ları, eski GPU'larda kapalı
         save_steps=1,
         save_total_limit=5,
         logging_steps=1,
@@ -281,7 +335,7 @@ def run_optimized_training():
     # Training döngüsü her epoch sonrası cache temizliği[2][5]
     class CustomTrainer(Trainer):
         def on_epoch_end(self, args, state, control, **kwargs):
-            torch.cuda.empty_cache()  # Her epoch sonrası temizlik[2]
+            trim_cuda_cache()  # Yalnızca kullanılmayan önbellek büyüdüyse temizlik[2]
             super().on_epoch_end(args, state, control, **kwargs)
 
 
@@ -303,40 +357,37 @@ def run_optimized_training():
     monitor_memory_usage()  # Training sonrası kontrol
 
     # Training sonrası GPU durumu
-    # ✅ 1. ÖNCE MODEL KAYDET
+    # ✅ 1. ÖNCE MODEL KAYDET (PEFT modeli yalnızca LoRA adaptörünü yazar)
     print("💾 Model kaydediliyor...")
 
-    model.save_pretrained('./optimized_starcoder2_lora')
+    model.save_pretrained('./optimized_starcoder2_lora', save_embedding_layers=False)
+    if torch.cuda.is_available():
+        allocated_end = _alloc_gb()
+        print(f"Training sonrası GPU bellek: {allocated_end:.2f} GB")
+
+    # ✅ 4-bit taban model, GPU gerektirmeyen tokenizer kaydından önce bırakılır
+    del trainer
+    del model  # Adaptör kaydedildi, artık güvenli
+
     tokenizer.save_pretrained('./optimized_starcoder2_lora')
 
     print("✅ Model başarıyla kaydedildi!")
 
     # ✅ 2. SONRA BELLEK TEMİZLİĞİ
+    del tokenizer
     if torch.cuda.is_available():
-        allocated_end = torch.cuda.memory_allocated(0) / 1024 ** 3
-        print(f"Training sonrası GPU bellek: {allocated_end:.2f} GB")
-
         print("🧹 GPU bellek temizliği yapılıyor...")
 
-        # Cache temizliği - Search results [5] approach
+        # Trainer/model/tokenizer döngüsüz: del yeterli, tam heap taraması (gc.collect) gereksiz.
+        # Bekleyen kernel'lar bitince önbelleği tek seferde bırak, tepe istatistiğini sıfırla
+        torch.cuda.synchronize()
         torch.cuda.empty_cache()
-
-        # Variables temizliği - MODEL KAYDETME SONRASI
-        del trainer
-        del model  # Artık güvenli
-        del tokenizer
-
-        # Garbage collection - Search results [5] solution
-        import gc
-        gc.collect()
+        torch.cuda.reset_peak_memory_stats()
 
         # Final durum
-        final_allocated = torch.cuda.memory_allocated(0) / 1024 ** 3
+        final_allocated = _alloc_gb()
         print(f"Temizlik sonrası GPU bellek: {final_allocated:.2f} GB")
 
-        # Model loader cache temizliği
-        model_loader.clear_gpu_cache()
-
 
 
 
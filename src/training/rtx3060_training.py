@@ -4,14 +4,15 @@ RTX 3060 12GB için optimize edilmiş LoRA training
 Search results [1][4][5] recommendations kullanılarak
 """
 
-from transformers import (AutoTokenizer, AutoModelForCausalLM, 
-                         BitsAndBytesConfig, Trainer, TrainingArguments)
+from transformers import Trainer, TrainingArguments, DataCollatorForLanguageModeling
+from transformers.utils import is_torch_tf32_available
 from peft import LoraConfig, get_peft_model, TaskType
 from datasets import Dataset
-import torch
 import time
 import logging
 
+from src.models.model_loader import get_model_loader
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,27 +31,26 @@ def start_optimized_training(config=None):
     logger.info("🚀 RTX 3060 Optimized Training başlatılıyor...")
     
     try:
-        # Model ve tokenizer yükleme
-        tokenizer = AutoTokenizer.from_pretrained(config["model_name"])
-        if tokenizer.pad_token is None:
-            tokenizer.pad_token = tokenizer.eos_token
-        
-        model = AutoModelForCausalLM.from_pretrained(
+        # Model ve tokenizer yükleme (NF4 + double quant, ortak loader)
+        # ✅ Önbelleksiz: get_peft_model modeli yerinde değiştirir, önbellekte adaptörlü model kalmasın.
+        # k-bit hazırlığı atlanır (norm/lm_head fp32'ye yükseltilmez), yalnızca gerekli adımlar
+        model, tokenizer = get_model_loader().load_base_model(
             config["model_name"],
-            quantization_config=BitsAndBytesConfig(
-                load_in_4bit=True,
-                bnb_4bit_compute_dtype=torch.bfloat16,
-                bnb_4bit_quant_type='nf4'
-            ),
-            device_map='auto'
+            use_quantization=True,
+            use_cache=False,
+            use_auto_device_map=True,
+            use_double_quant=True,
+            prepare_for_kbit=False
         )
+        model.gradient_checkpointing_enable(gradient_checkpointing_kwargs={'use_reentrant': False})
+        model.enable_input_require_grads()
         
         # LoRA konfigürasyonu
         lora_config = LoraConfig(
             task_type=TaskType.CAUSAL_LM,
             r=16,
             lora_alpha=32,
-            target_modules=['q_proj', 'v_proj', 'k_proj', 'o_proj'],
+            target_modules=r".*\.(q|k|v|o)_proj$",  # Tek regex ile attention projeksiyonları
             lora_dropout=0.1
         )
         
@@ -63,9 +63,13 @@ def start_optimized_training(config=None):
             gradient_accumulation_steps=32,
             num_train_epochs=config["epochs"],
             learning_rate=config["learning_rate"],
+            optim='paged_adamw_8bit',  # 8-bit optimizer state, ani bellek artışlarında CPU'ya sayfalanır
             warmup_steps=100,
             bf16=True,
+            bf16_full_eval=True,  # Eval de bf16'da, fp32'ye yükseltme yok
+            tf32=is_torch_tf32_available(),  # Ampere (RTX 3060) TF32 tensor core'ları, eski GPU'larda kapalı
             gradient_checkpointing=True,
+            gradient_checkpointing_kwargs={'use_reentrant': False},
             save_steps=100,
             logging_steps=10,
             remove_unused_columns=False,
@@ -94,20 +98,17 @@ def start_micro_training():
             {"text": "def add_numbers(a, b):\n    return a + b"}
         ]
         
-        # Model setup
-        tokenizer = AutoTokenizer.from_pretrained('bigcode/starcoder2-3b')
-        if tokenizer.pad_token is None:
-            tokenizer.pad_token = tokenizer.eos_token
-        
-        model = AutoModelForCausalLM.from_pretrained(
+        # Model setup (önbelleksiz, fp32 upcast yapan k-bit hazırlığı olmadan)
+        model, tokenizer = get_model_loader().load_base_model(
             'bigcode/starcoder2-3b',
-            quantization_config=BitsAndBytesConfig(
-                load_in_4bit=True,
-                bnb_4bit_compute_dtype=torch.bfloat16,
-                bnb_4bit_quant_type='nf4'
-            ),
-            device_map='auto'
+            use_quantization=True,
+            use_cache=False,
+            use_auto_device_map=True,
+            use_double_quant=True,
+            prepare_for_kbit=False
         )
+        model.gradient_checkpointing_enable(gradient_checkpointing_kwargs={'use_reentrant': False})
+        model.enable_input_require_grads()
         
         # LoRA config
         lora_config = LoraConfig(
@@ -121,16 +122,14 @@ def start_micro_training():
         model = get_peft_model(model, lora_config)
         
         # Dataset hazırlama
+        # Padding yok: collator her batch'i kendi en uzun örneğine kadar doldurur
         def tokenize_function(examples):
-            tokens = tokenizer(
+            return tokenizer(
                 examples['text'],
-                padding='max_length',
                 max_length=128,
                 truncation=True,
                 return_tensors=None
             )
-            tokens['labels'] = [ids.copy() for ids in tokens['input_ids']]
-            return tokens
         
         dataset = Dataset.from_list(micro_dataset)
         tokenized_dataset = dataset.map(tokenize_function, batched=True, remove_columns=['text'])
@@ -142,8 +141,12 @@ def start_micro_training():
             gradient_accumulation_steps=2,
             num_train_epochs=1,
             learning_rate=5e-5,
+            optim='paged_adamw_8bit',
             bf16=True,
+            bf16_full_eval=True,
+            tf32=is_torch_tf32_available(),
             gradient_checkpointing=True,
+            gradient_checkpointing_kwargs={'use_reentrant': False},
             save_steps=1,
             logging_steps=1,
             remove_unused_columns=False,
@@ -155,6 +158,7 @@ def start_micro_training():
             model=model,
             args=training_args,
             train_dataset=tokenized_dataset,
+            data_collator=DataCollatorForLanguageModeling(tokenizer=tokenizer, mlm=False),
             processing_class=tokenizer
         )
         
@@ -15,8 +15,8 @@ def run_micro_training_test():
     from transformers import (AutoTokenizer, AutoModelForCausalLM,
                               BitsAndBytesConfig, Trainer, TrainingArguments,
                               DataCollatorForLanguageModeling)
-    from peft import (LoraConfig, get_peft_model, TaskType,
-                      prepare_model_for_kbit_training)
+    from transformers.utils import is_torch_tf32_available
+    from peft import LoraConfig, get_peft_model, TaskType
     from datasets import Dataset
 
     # Test dataset
@@ -38,7 +38,8 @@ def run_micro_training_test():
     quantization_config = BitsAndBytesConfig(
         load_in_4bit=True,
         bnb_4bit_compute_dtype=torch.bfloat16,
-        bnb_4bit_quant_type='nf4'
+        bnb_4bit_quant_type='nf4',
+        bnb_4bit_use_double_quant=True  # Quantization sabitleri de quantize edilir (~0.37 bit/parametre)
     )
 
     model = AutoModelForCausalLM.from_pretrained(
@@ -49,14 +50,17 @@ def run_micro_training_test():
     )
 
     # Modeli k-bit eğitimi için hazırla
-    model = prepare_model_for_kbit_training(model)
+    # ✅ prepare_model_for_kbit_training kullanılmaz: LayerNorm/lm_head'i fp32'ye yükseltip
+    # belleği artırır; norm'lar bf16'da kalır, LoRA hesabı bnb_4bit_compute_dtype ile bf16
+    model.gradient_checkpointing_enable(gradient_checkpointing_kwargs={'use_reentrant': False})
+    model.enable_input_require_grads()
 
     # LoRA config
     lora_config = LoraConfig(
         task_type=TaskType.CAUSAL_LM,
         r=16,
         lora_alpha=32,
-        target_modules=['q_proj', 'k_proj', 'v_proj', 'o_proj'],
+        target_modules=r".*\.(q|k|v|o)_proj$",  # Tek regex ile attention projeksiyonları
         lora_dropout=0.05
     )
     model = get_peft_model(model, lora_config)
@@ -68,9 +72,7 @@ def run_micro_training_test():
         return tokenizer(examples['text'], truncation=True, max_length=256)
 
     tokenized_dataset = dataset.map(tokenize_function, batched=True, remove_columns=['text'])
-
-    # Language model'ler için 'labels' sütununu eklemek iyi bir pratiktir
-    tokenized_dataset = tokenized_dataset.add_column("labels", tokenized_dataset["input_ids"])
+    # 'labels' sütunu eklenmez: collator dinamik padding ile birlikte labels'ı kendisi üretir
 
     # Training arguments
     training_args = TrainingArguments(
@@ -79,7 +81,10 @@ def run_micro_training_test():
         gradient_accumulation_steps=8,
         num_train_epochs=1,
         learning_rate=5e-5,
+        optim='paged_adamw_8bit',  # 8-bit optimizer state, ani bellek artışlarında CPU'ya sayfalanır
         bf16=True,
+        bf16_full_eval=True,  # Eval de bf16'da, fp32'ye yükseltme yok
+        tf32=is_torch_tf32_available(),  # Ampere (RTX 3060) TF32 tensor core'ları, eski GPU'larda kapalı
         save_steps=10,
         logging_steps=1,
         report_to=None,
@@ -6,6 +6,8 @@ import flet as ft
 import logging
 import threading
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 from models.inference_pipeline import get_inference_pipeline
@@ -17,6 +19,99 @@ from ..research.web_search_utils import WebSearchUtils
 
 logger = logging.getLogger(__name__)
 
+# ✅ Sorgu sınıflandırma: kategori -> anahtar kelimeler (alt dize eşleşmesi)
+_QUERY_CATEGORY_KEYWORDS = {
+    'fruit': ('elma', 'armut', 'vişne', 'apple', 'pear', 'cherry'),
+    'project': ('proje', 'project', 'uygulama', 'app', 'site', 'sistem'),
+    'component': ('recyclerview', 'listview', 'fragment', 'activity'),
+    'backend': ('flask', 'django', 'express', 'fastapi', 'spring'),
+    'web': ('react', 'vue', 'angular', 'javascript'),
+    'android': ('android', 'java', 'kotlin', 'recyclerview', 'listview'),
+    'python_desktop': ('python', 'tkinter', 'pyqt'),
+    'flutter': ('flutter', 'dart'),
+    'complexity_high': ('detaylı', 'detailed', 'kapsamlı', 'comprehensive', 'full', 'complete', 'tüm', 'all'),
+    'complexity_medium': ('örnek', 'example', 'basit', 'simple', 'temel', 'basic'),
+}
+
+_PROGRAMMING_KEYWORDS = frozenset({
+    'java', 'android', 'listview', 'layout', 'xml', 'programming', 'code',
+    'python', 'javascript', 'html', 'css', 'react', 'vue', 'angular',
+    'flutter', 'kotlin', 'swift', 'c++', 'c#', 'php', 'ruby', 'go',
+    'algorithm', 'data structure', 'database', 'sql', 'api', 'framework'
+})
+# Tek regex birleşimi: mesaj bir kez taranır (alt dize semantiği korunur)
+_PROGRAMMING_RE = re.compile('|'.join(map(re.escape, sorted(_PROGRAMMING_KEYWORDS, key=len, reverse=True))))
+_MIN_PROGRAMMING_KEYWORD_LEN = min(map(len, _PROGRAMMING_KEYWORDS))
+
+
+def _build_category_matcher(category_keywords: Dict[str, tuple]):
+    """Tüm kategoriler için tek geçişlik eşleştirici kur (Aho-Corasick benzeri)"""
+    keyword_categories = {}
+    for category, keywords in category_keywords.items():
+        for keyword in keywords:
+            keyword_categories.setdefault(keyword, set()).add(category)
+
+    # Her konumda en uzun anahtar kelime eşleşir; içerdiği kısa anahtar kelimelerin
+    # kategorileri de ona eklenir, böylece alt dize semantiği korunur ('javascript' ⊃ 'java')
+    closure = {
+        keyword: frozenset().union(*(cats for other, cats in keyword_categories.items() if other in keyword))
+        for keyword in keyword_categories
+    }
+    alternation = '|'.join(map(re.escape, sorted(keyword_categories, key=len, reverse=True)))
+    return re.compile(f'(?=({alternation}))'), closure
+
+
+_QUERY_CATEGORY_RE, _KEYWORD_CATEGORIES = _build_category_matcher(_QUERY_CATEGORY_KEYWORDS)
+_MIN_CATEGORY_KEYWORD_LEN = min(map(len, _KEYWORD_CATEGORIES))
+
+
+@lru_cache(maxsize=256)
+def _query_categories(query_lower: str) -> frozenset:
+    """Küçük harfli sorgudaki tüm kategorileri tek taramada bul"""
+    # En kısa anahtar kelimeden kısa sorgu hiçbir kategoriyle eşleşemez
+    if len(query_lower) < _MIN_CATEGORY_KEYWORD_LEN:
+        return frozenset()
+    return frozenset().union(
+        *(_KEYWORD_CATEGORIES[match.group(1)] for match in _QUERY_CATEGORY_RE.finditer(query_lower))
+    )
+
+
+# Hazır çözüm şablonları: modül kaynağında değil, diskte tutulur ve ilk kullanımda okunur
+_SOLUTIONS_DIR = Path(__file__).parent / 'assets' / 'solutions'
+
+
+@lru_cache(maxsize=None)
+def _load_solution(name: str) -> str:
+    """Çözüm şablonunu bir kez diskten oku ('{query}' yer tutucusu içerebilir)"""
+    return (_SOLUTIONS_DIR / f'{name}.md').read_text(encoding='utf-8').rstrip('\n')
+
+
+# Web araması sonuç vermediğinde gösterilen yanıt şablonu
+_NO_RESULTS_TEMPLATE = """🤖 **Model: {model}** | 🔍 Web araması yapıldı ancak "{query}" için spesifik sonuç bulunamadı.
+
+Bu durumda:
+1. Sorunuzu daha spesifik hale getirmeyi deneyin
+2. Farklı anahtar kelimeler kullanın
+3. İngilizce terimler eklemeyi deneyin
+
+Örnek: "Android Java CardView custom layout tutorial"
+
+Tekrar denemek ister misiniz?"""
+
+
+@lru_cache(maxsize=256)
+def _no_results_message(model: str, query: str) -> str:
+    """Sonuçsuz arama yanıtı (aynı model + sorgu için önbellekten)"""
+    return _NO_RESULTS_TEMPLATE.format(model=model, query=query)
+
+
+@lru_cache(maxsize=512)
+def _mentions_programming(message_lower: str) -> bool:
+    """Küçük harfli mesaj bir programlama anahtar kelimesi içeriyor mu"""
+    if len(message_lower) < _MIN_PROGRAMMING_KEYWORD_LEN:
+        return False
+    return _PROGRAMMING_RE.search(message_lower) is not None
+
 
 class AIChatInterface:
     """✅ Search results [1][5] pattern: Modern chat UI[1][5]"""
@@ -211,35 +306,35 @@ class AIChatInterface:
             animate=ft.Animation(300, ft.AnimationCurve.EASE_IN)
         )
 
+    # ✅ add_* metotları yalnızca kontrolleri/geçmişi değiştirir; page.update() çağıran
+    # tarafta tek seferde yapılır (mesaj başına ayrı reflow yok)
     def add_user_message(self, message: str):
-        """Add user message to chat"""
+        """Add user message to chat (caller updates the page)"""
         user_msg = self.create_user_message(message)
         self.chat_messages.controls.append(user_msg)
         self.chat_history.append({"role": "user", "content": message})
-        self.page.update()
 
-    def add_ai_message(self, message: str):
-        """Add AI response to chat"""
+    def add_ai_message(self, message: str, replace: Optional[ft.Control] = None):
+        """Add AI response to chat, swapping it in for `replace` if that is the last bubble"""
         ai_msg = self.create_ai_message(message)
-        self.chat_messages.controls.append(ai_msg)
+        controls = self.chat_messages.controls
+        if replace is not None and controls and controls[-1] is replace:
+            controls[-1] = ai_msg
+        else:
+            controls.append(ai_msg)
         self.chat_history.append({"role": "assistant", "content": message})
-        self.page.update()
 
     async def send_message(self, e):
         """✅ Send message and get AI response"""
+        typing_msg = None
         try:
             user_message = self.chat_input.value.strip()
             if not user_message:
                 return
 
-            # Clear input
+            # Clear input, add user message and typing indicator - tek update
             self.chat_input.value = ""
-            self.page.update()
-
-            # Add user message
             self.add_user_message(user_message)
-
-            # Show typing indicator
             typing_msg = self.create_ai_message("🤔 Thinking...")
             self.chat_messages.controls.append(typing_msg)
             self.page.update()
@@ -247,15 +342,14 @@ class AIChatInterface:
             # Get AI response
             ai_response = await self.get_ai_response(user_message)
 
-            # Remove typing indicator
-            self.chat_messages.controls.pop()
-
-            # Add AI response
-            self.add_ai_message(ai_response)
+            # Typing indicator yerine AI cevabı - tek update
+            self.add_ai_message(ai_response, replace=typing_msg)
+            self.page.update()
 
         except Exception as ex:
             logger.error(f"❌ Chat error: {ex}")
-            self.add_ai_message(f"❌ Sorry, I encountered an error: {str(ex)}")
+            self.add_ai_message(f"❌ Sorry, I encountered an error: {str(ex)}", replace=typing_msg)
+            self.page.update()
 
     async def get_ai_response(self, user_message: str, model: str = "bigcode/starcoder2-3b") -> str:
         """
@@ -362,15 +456,7 @@ class AIChatInterface:
 
     def _is_programming_question(self, message: str) -> bool:
         """Check if the message is a programming-related question"""
-        programming_keywords = [
-            'java', 'android', 'listview', 'layout', 'xml', 'programming', 'code', 
-            'python', 'javascript', 'html', 'css', 'react', 'vue', 'angular',
-            'flutter', 'kotlin', 'swift', 'c++', 'c#', 'php', 'ruby', 'go',
-            'algorithm', 'data structure', 'database', 'sql', 'api', 'framework'
-        ]
-        
-        message_lower = message.lower()
-        return any(keyword in message_lower for keyword in programming_keywords)
+        return _mentions_programming(message.lower())
 
     def _evaluate_ai_response(self, user_query: str, generated_response: str) -> dict:
         """
@@ -505,16 +591,7 @@ Başka bir konuda yardım ister misiniz?"""
                 return response
             else:
                 logger.warning(f"⚠️ No REAL web results found for: {query}")
-                return f"""🤖 **Model: {model}** | 🔍 Web araması yapıldı ancak "{query}" için spesifik sonuç bulunamadı.
-
-Bu durumda:
-1. Sorunuzu daha spesifik hale getirmeyi deneyin
-2. Farklı anahtar kelimeler kullanın
-3. İngilizce terimler eklemeyi deneyin
-
-Örnek: "Android Java CardView custom layout tutorial"
-
-Tekrar denemek ister misiniz?"""
+                return _no_results_message(model, query)
                 
         except Exception as e:
             logger.error(f"❌ REAL web search error: {e}")
@@ -537,24 +614,27 @@ Lütfen birkaç dakika sonra tekrar deneyin."""
             project_type = self._detect_project_type(query_lower)
             complexity_level = self._detect_complexity_level(query_lower)
             
+            # Tüm kategoriler tek taramada (önbellekli)
+            categories = _query_categories(query_lower)
+            
             # Check for specific data requirements (like Elma, Armut, Vişne)
-            if any(fruit in query_lower for fruit in ['elma', 'armut', 'vişne', 'apple', 'pear', 'cherry']):
+            if 'fruit' in categories:
                 return self._create_custom_listview_solution(user_query, web_content)
             
             # Check for detailed project requests
-            if any(keyword in query_lower for keyword in ['proje', 'project', 'uygulama', 'app', 'site', 'sistem']):
+            if 'project' in categories:
                 return self._create_detailed_project_solution(user_query, web_content, project_type, complexity_level)
             
             # Check for specific component requests
-            if any(keyword in query_lower for keyword in ['recyclerview', 'listview', 'fragment', 'activity']):
+            if 'component' in categories:
                 return self._create_component_solution(user_query, web_content, project_type)
             
             # Check for backend requests FIRST (more specific)
-            if any(keyword in query_lower for keyword in ['flask', 'django', 'express', 'fastapi', 'spring']):
+            if 'backend' in categories:
                 return self._create_backend_solution(user_query, web_content)
             
             # Check for web development requests
-            if any(keyword in query_lower for keyword in ['react', 'vue', 'angular', 'javascript']):
+            if 'web' in categories:
                 return self._create_web_solution(user_query, web_content)
             
             # Enhanced general solution
@@ -566,205 +646,33 @@ Lütfen birkaç dakika sonra tekrar deneyin."""
 
     def _detect_project_type(self, query: str) -> str:
         """Detect the type of project from user query"""
-        if any(word in query for word in ['android', 'java', 'kotlin', 'recyclerview', 'listview']):
+        categories = _query_categories(query)
+        if 'android' in categories:
             return 'android'
-        elif any(word in query for word in ['flask', 'django', 'express', 'fastapi', 'spring']):
+        elif 'backend' in categories:
             return 'web_backend'
-        elif any(word in query for word in ['react', 'vue', 'angular', 'javascript']):
+        elif 'web' in categories:
             return 'web_frontend'
-        elif any(word in query for word in ['python', 'tkinter', 'pyqt']):
+        elif 'python_desktop' in categories:
             return 'python_desktop'
-        elif any(word in query for word in ['flutter', 'dart']):
+        elif 'flutter' in categories:
             return 'flutter'
         else:
             return 'general'
 
     def _detect_complexity_level(self, query: str) -> str:
         """Detect complexity level from user query"""
-        high_complexity_words = ['detaylı', 'detailed', 'kapsamlı', 'comprehensive', 'full', 'complete', 'tüm', 'all']
-        medium_complexity_words = ['örnek', 'example', 'basit', 'simple', 'temel', 'basic']
-        
-        if any(word in query for word in high_complexity_words):
+        categories = _query_categories(query)
+        if 'complexity_high' in categories:
             return 'high'
-        elif any(word in query for word in medium_complexity_words):
+        elif 'complexity_medium' in categories:
             return 'medium'
         else:
             return 'basic'
 
     def _create_custom_listview_solution(self, user_query: str, web_content: str) -> str:
         """Create a custom ListView solution with user's specific data"""
-        return f"""**🍎 Custom Android ListView Solution - Elma, Armut, Vişne**
-
-**1. XML Layout (activity_main.xml):**
-```xml
-<?xml version="1.0" encoding="utf-8"?>
-<LinearLayout xmlns:android="http://schemas.android.com/apk/res/android"
-    android:layout_width="match_parent"
-    android:layout_height="match_parent"
-    android:orientation="vertical"
-    android:padding="16dp">
-    
-    <TextView
-        android:layout_width="match_parent"
-        android:layout_height="wrap_content"
-        android:text="Meyve Listesi"
-        android:textSize="20sp"
-        android:textStyle="bold"
-        android:gravity="center"
-        android:layout_marginBottom="16dp" />
-    
-    <ListView
-        android:id="@+id/fruitListView"
-        android:layout_width="match_parent"
-        android:layout_height="match_parent"
-        android:divider="#CCCCCC"
-        android:dividerHeight="1dp" />
-        
-</LinearLayout>
-```
-
-**2. List Item Layout (fruit_item.xml):**
-```xml
-<?xml version="1.0" encoding="utf-8"?>
-<LinearLayout xmlns:android="http://schemas.android.com/apk/res/android"
-    android:layout_width="match_parent"
-    android:layout_height="wrap_content"
-    android:orientation="horizontal"
-    android:padding="16dp"
-    android:background="?android:attr/selectableItemBackground">
-    
-    <TextView
-        android:id="@+id/fruitNameText"
-        android:layout_width="0dp"
-        android:layout_height="wrap_content"
-        android:layout_weight="1"
-        android:text="Meyve Adı"
-        android:textSize="16sp"
-        android:textColor="#333333" />
-        
-    <TextView
-        android:id="@+id/fruitEmojiText"
-        android:layout_width="wrap_content"
-        android:layout_height="wrap_content"
-        android:text="🍎"
-        android:textSize="20sp" />
-        
-</LinearLayout>
-```
-
-**3. Java MainActivity:**
-```java
-package com.example.fruitlist;
-
-import android.os.Bundle;
-import android.widget.ArrayAdapter;
-import android.widget.ListView;
-import android.widget.Toast;
-import androidx.appcompat.app.AppCompatActivity;
-import java.util.ArrayList;
-
-public class MainActivity extends AppCompatActivity {{
-    
-    private ListView fruitListView;
-    private ArrayList<String> fruitList;
-    private ArrayAdapter<String> adapter;
-    
-    @Override
-    protected void onCreate(Bundle savedInstanceState) {{
-        super.onCreate(savedInstanceState);
-        setContentView(R.layout.activity_main);
-        
-        // ListView'i bul
-        fruitListView = findViewById(R.id.fruitListView);
-        
-        // Meyve listesi oluştur - Sizin istediğiniz veriler
-        fruitList = new ArrayList<>();
-        fruitList.add("🍎 Elma");
-        fruitList.add("🍐 Armut");
-        fruitList.add("🍒 Vişne");
-        
-        // Adapter oluştur
-        adapter = new ArrayAdapter<>(
-            this,
-            android.R.layout.simple_list_item_1,
-            fruitList
-        );
-        
-        // Adapter'ı ListView'e bağla
-        fruitListView.setAdapter(adapter);
-        
-        // Item click listener - Tıklanan meyveyi göster
-        fruitListView.setOnItemClickListener((parent, view, position, id) -> {{
-            String selectedFruit = fruitList.get(position);
-            Toast.makeText(this, 
-                "Seçilen meyve: " + selectedFruit, 
-                Toast.LENGTH_SHORT).show();
-        }});
-    }}
-}}
-```
-
-**4. Custom Adapter (Daha gelişmiş görünüm için):**
-```java
-public class FruitAdapter extends BaseAdapter {{
-    
-    private Context context;
-    private ArrayList<String> fruits;
-    private String[] emojis = {{"🍎", "🍐", "🍒"}};
-    
-    public FruitAdapter(Context context, ArrayList<String> fruits) {{
-        this.context = context;
-        this.fruits = fruits;
-    }}
-    
-    @Override
-    public int getCount() {{
-        return fruits.size();
-    }}
-    
-    @Override
-    public Object getItem(int position) {{
-        return fruits.get(position);
-    }}
-    
-    @Override
-    public long getItemId(int position) {{
-        return position;
-    }}
-    
-    @Override
-    public View getView(int position, View convertView, ViewGroup parent) {{
-        if (convertView == null) {{
-            convertView = LayoutInflater.from(context)
-                .inflate(R.layout.fruit_item, parent, false);
-        }}
-        
-        TextView fruitName = convertView.findViewById(R.id.fruitNameText);
-        TextView fruitEmoji = convertView.findViewById(R.id.fruitEmojiText);
-        
-        String fruit = fruits.get(position).replace("🍎 ", "").replace("🍐 ", "").replace("🍒 ", "");
-        fruitName.setText(fruit);
-        fruitEmoji.setText(emojis[position]);
-        
-        return convertView;
-    }}
-}}
-```
-
-**🎯 Sizin İsteğinize Özel Özellikler:**
-- ✅ Tam olarak "Elma", "Armut", "Vişne" verileri
-- ✅ Layout dosyası dahil edildi
-- ✅ 3 eleman tam olarak listede
-- ✅ Emoji'ler ile görsel zenginlik
-- ✅ Tıklama olayları eklendi
-
-**📱 Çalıştırma Adımları:**
-1. Yeni Android projesi oluşturun
-2. XML dosyalarını res/layout/ klasörüne ekleyin
-3. MainActivity.java kodunu kopyalayın
-4. Uygulamayı çalıştırın
-
-Bu çözüm tam olarak sizin istediğiniz şekilde hazırlandı! 🍎🍐🍒"""
+        return _load_solution('android_listview_fruits')
 
     def _enhance_android_listview_solution(self, user_query: str, web_content: str) -> str:
         """Enhance Android ListView solution with additional context"""
@@ -799,1585 +707,15 @@ Bu çözüm tam olarak sizin istediğiniz şekilde hazırlandı! 🍎🍐🍒"""
 
     def _create_detailed_android_project(self, user_query: str, complexity_level: str) -> str:
         """Create detailed Android project solution"""
-        return f"""**📱 Detaylı Android Projesi - "{user_query[:50]}..."**
-
-## 📁 **Proje Yapısı:**
-```
-MyAndroidApp/
-├── app/
-│   ├── src/main/
-│   │   ├── java/com/example/myapp/
-│   │   │   ├── MainActivity.java
-│   │   │   ├── DetailActivity.java
-│   │   │   ├── adapter/
-│   │   │   │   └── ItemAdapter.java
-│   │   │   ├── model/
-│   │   │   │   └── Item.java
-│   │   │   └── utils/
-│   │   │       └── DatabaseHelper.java
-│   │   ├── res/
-│   │   │   ├── layout/
-│   │   │   │   ├── activity_main.xml
-│   │   │   │   ├── activity_detail.xml
-│   │   │   │   └── item_layout.xml
-│   │   │   ├── values/
-│   │   │   │   ├── strings.xml
-│   │   │   │   ├── colors.xml
-│   │   │   │   └── styles.xml
-│   │   │   └── drawable/
-│   │   │       └── ic_launcher.xml
-│   │   └── AndroidManifest.xml
-│   └── build.gradle
-└── build.gradle
-```
-
-## 🎨 **1. Ana Layout (activity_main.xml):**
-```xml
-<?xml version="1.0" encoding="utf-8"?>
-<androidx.constraintlayout.widget.ConstraintLayout 
-    xmlns:android="http://schemas.android.com/apk/res/android"
-    xmlns:app="http://schemas.android.com/apk/res-auto"
-    xmlns:tools="http://schemas.android.com/tools"
-    android:layout_width="match_parent"
-    android:layout_height="match_parent"
-    android:background="@color/background_color"
-    tools:context=".MainActivity">
-
-    <!-- Toolbar -->
-    <androidx.appcompat.widget.Toolbar
-        android:id="@+id/toolbar"
-        android:layout_width="0dp"
-        android:layout_height="?attr/actionBarSize"
-        android:background="@color/primary_color"
-        android:theme="@style/ThemeOverlay.AppCompat.Dark.ActionBar"
-        app:layout_constraintEnd_toEndOf="parent"
-        app:layout_constraintStart_toStartOf="parent"
-        app:layout_constraintTop_toTopOf="parent"
-        app:title="Ana Sayfa" />
-
-    <!-- Search View -->
-    <androidx.appcompat.widget.SearchView
-        android:id="@+id/searchView"
-        android:layout_width="0dp"
-        android:layout_height="wrap_content"
-        android:layout_margin="16dp"
-        android:background="@drawable/search_background"
-        app:layout_constraintEnd_toEndOf="parent"
-        app:layout_constraintStart_toStartOf="parent"
-        app:layout_constraintTop_toBottomOf="@+id/toolbar"
-        app:queryHint="Ara..." />
-
-    <!-- RecyclerView -->
-    <androidx.recyclerview.widget.RecyclerView
-        android:id="@+id/recyclerView"
-        android:layout_width="0dp"
-        android:layout_height="0dp"
-        android:layout_margin="8dp"
-        android:clipToPadding="false"
-        android:padding="8dp"
-        app:layout_constraintBottom_toBottomOf="parent"
-        app:layout_constraintEnd_toEndOf="parent"
-        app:layout_constraintStart_toStartOf="parent"
-        app:layout_constraintTop_toBottomOf="@+id/searchView"
-        tools:listitem="@layout/item_layout" />
-
-    <!-- Floating Action Button -->
-    <com.google.android.material.floatingactionbutton.FloatingActionButton
-        android:id="@+id/fabAdd"
-        android:layout_width="wrap_content"
-        android:layout_height="wrap_content"
-        android:layout_margin="16dp"
-        android:src="@drawable/ic_add"
-        app:layout_constraintBottom_toBottomOf="parent"
-        app:layout_constraintEnd_toEndOf="parent" />
-
-</androidx.constraintlayout.widget.ConstraintLayout>
-```
-
-## 📄 **2. Item Layout (item_layout.xml):**
-```xml
-<?xml version="1.0" encoding="utf-8"?>
-<androidx.cardview.widget.CardView 
-    xmlns:android="http://schemas.android.com/apk/res/android"
-    xmlns:app="http://schemas.android.com/apk/res-auto"
-    android:layout_width="match_parent"
-    android:layout_height="wrap_content"
-    android:layout_margin="8dp"
-    app:cardCornerRadius="12dp"
-    app:cardElevation="4dp">
-
-    <LinearLayout
-        android:layout_width="match_parent"
-        android:layout_height="wrap_content"
-        android:orientation="horizontal"
-        android:padding="16dp">
-
-        <!-- Item Image -->
-        <ImageView
-            android:id="@+id/itemImage"
-            android:layout_width="80dp"
-            android:layout_height="80dp"
-            android:layout_marginEnd="16dp"
-            android:background="@drawable/image_placeholder"
-            android:scaleType="centerCrop" />
-
-        <!-- Item Info -->
-        <LinearLayout
-            android:layout_width="0dp"
-            android:layout_height="wrap_content"
-            android:layout_weight="1"
-            android:orientation="vertical">
-
-            <TextView
-                android:id="@+id/itemTitle"
-                android:layout_width="match_parent"
-                android:layout_height="wrap_content"
-                android:text="Item Başlığı"
-                android:textColor="@color/text_primary"
-                android:textSize="18sp"
-                android:textStyle="bold" />
-
-            <TextView
-                android:id="@+id/itemDescription"
-                android:layout_width="match_parent"
-                android:layout_height="wrap_content"
-                android:layout_marginTop="4dp"
-                android:text="Item açıklaması"
-                android:textColor="@color/text_secondary"
-                android:textSize="14sp" />
-
-            <TextView
-                android:id="@+id/itemPrice"
-                android:layout_width="match_parent"
-                android:layout_height="wrap_content"
-                android:layout_marginTop="8dp"
-                android:text="₺99.99"
-                android:textColor="@color/price_color"
-                android:textSize="16sp"
-                android:textStyle="bold" />
-
-        </LinearLayout>
-
-        <!-- More Options -->
-        <ImageButton
-            android:id="@+id/btnMore"
-            android:layout_width="wrap_content"
-            android:layout_height="wrap_content"
-            android:background="?attr/selectableItemBackgroundBorderless"
-            android:padding="8dp"
-            android:src="@drawable/ic_more_vert" />
-
-    </LinearLayout>
-
-</androidx.cardview.widget.CardView>
-```
-
-## ☕ **3. MainActivity.java:**
-```java
-package com.example.myapp;
-
-import android.content.Intent;
-import android.os.Bundle;
-import android.view.Menu;
-import android.view.MenuItem;
-import android.widget.Toast;
-import androidx.appcompat.app.AppCompatActivity;
-import androidx.appcompat.widget.SearchView;
-import androidx.appcompat.widget.Toolbar;
-import androidx.recyclerview.widget.LinearLayoutManager;
-import androidx.recyclerview.widget.RecyclerView;
-import com.google.android.material.floatingactionbutton.FloatingActionButton;
-import java.util.ArrayList;
-import java.util.List;
-
-public class MainActivity extends AppCompatActivity implements ItemAdapter.OnItemClickListener {{
-    
-    private RecyclerView recyclerView;
-    private ItemAdapter adapter;
-    private List<Item> itemList;
-    private List<Item> filteredList;
-    private SearchView searchView;
-    private FloatingActionButton fabAdd;
-    
-    @Override
-    protected void onCreate(Bundle savedInstanceState) {{
-        super.onCreate(savedInstanceState);
-        setContentView(R.layout.activity_main);
-        
-        initViews();
-        setupToolbar();
-        setupRecyclerView();
-        setupSearchView();
-        setupFab();
-        loadData();
-    }}
-    
-    private void initViews() {{
-        recyclerView = findViewById(R.id.recyclerView);
-        searchView = findViewById(R.id.searchView);
-        fabAdd = findViewById(R.id.fabAdd);
-    }}
-    
-    private void setupToolbar() {{
-        Toolbar toolbar = findViewById(R.id.toolbar);
-        setSupportActionBar(toolbar);
-        if (getSupportActionBar() != null) {{
-            getSupportActionBar().setTitle("Ana Sayfa");
-        }}
-    }}
-    
-    private void setupRecyclerView() {{
-        itemList = new ArrayList<>();
-        filteredList = new ArrayList<>();
-        
-        adapter = new ItemAdapter(this, filteredList, this);
-        recyclerView.setLayoutManager(new LinearLayoutManager(this));
-        recyclerView.setAdapter(adapter);
-    }}
-    
-    private void setupSearchView() {{
-        searchView.setOnQueryTextListener(new SearchView.OnQueryTextListener() {{
-            @Override
-            public boolean onQueryTextSubmit(String query) {{
-                return false;
-            }}
-            
-            @Override
-            public boolean onQueryTextChange(String newText) {{
-                filterItems(newText);
-                return true;
-            }}
-        }});
-    }}
-    
-    private void setupFab() {{
-        fabAdd.setOnClickListener(v -> {{
-            // Yeni item ekleme sayfasına git
-            Intent intent = new Intent(this, AddItemActivity.class);
-            startActivity(intent);
-        }});
-    }}
-    
-    private void loadData() {{
-        // Örnek veriler - gerçek uygulamada database'den gelir
-        itemList.add(new Item(1, "Laptop", "Gaming Laptop", "₺15,999", R.drawable.laptop));
-        itemList.add(new Item(2, "Telefon", "Akıllı Telefon", "₺8,999", R.drawable.phone));
-        itemList.add(new Item(3, "Kulaklık", "Bluetooth Kulaklık", "₺299", R.drawable.headphone));
-        
-        filteredList.addAll(itemList);
-        adapter.notifyDataSetChanged();
-    }}
-    
-    private void filterItems(String query) {{
-        filteredList.clear();
-        
-        if (query.isEmpty()) {{
-            filteredList.addAll(itemList);
-        }} else {{
-            for (Item item : itemList) {{
-                if (item.getTitle().toLowerCase().contains(query.toLowerCase()) ||
-                    item.getDescription().toLowerCase().contains(query.toLowerCase())) {{
-                    filteredList.add(item);
-                }}
-            }}
-        }}
-        
-        adapter.notifyDataSetChanged();
-    }}
-    
-    @Override
-    public void onItemClick(Item item) {{
-        // Detay sayfasına git
-        Intent intent = new Intent(this, DetailActivity.class);
-        intent.putExtra("item_id", item.getId());
-        startActivity(intent);
-    }}
-    
-    @Override
-    public void onMoreClick(Item item) {{
-        // Daha fazla seçenek menüsü göster
-        Toast.makeText(this, "Daha fazla: " + item.getTitle(), Toast.LENGTH_SHORT).show();
-    }}
-    
-    @Override
-    public boolean onCreateOptionsMenu(Menu menu) {{
-        getMenuInflater().inflate(R.menu.main_menu, menu);
-        return true;
-    }}
-    
-    @Override
-    public boolean onOptionsItemSelected(MenuItem item) {{
-        switch (item.getItemId()) {{
-            case R.id.action_settings:
-                // Ayarlar sayfasına git
-                return true;
-            case R.id.action_about:
-                // Hakkında sayfasına git
-                return true;
-            default:
-                return super.onOptionsItemSelected(item);
-        }}
-    }}
-}}
-```
-
-## 🔧 **4. ItemAdapter.java:**
-```java
-package com.example.myapp.adapter;
-
-import android.content.Context;
-import android.view.LayoutInflater;
-import android.view.View;
-import android.view.ViewGroup;
-import android.widget.ImageButton;
-import android.widget.ImageView;
-import android.widget.TextView;
-import androidx.annotation.NonNull;
-import androidx.recyclerview.widget.RecyclerView;
-import com.example.myapp.R;
-import com.example.myapp.model.Item;
-import java.util.List;
-
-public class ItemAdapter extends RecyclerView.Adapter<ItemAdapter.ViewHolder> {{
-    
-    private Context context;
-    private List<Item> items;
-    private OnItemClickListener listener;
-    
-    public interface OnItemClickListener {{
-        void onItemClick(Item item);
-        void onMoreClick(Item item);
-    }}
-    
-    public ItemAdapter(Context context, List<Item> items, OnItemClickListener listener) {{
-        this.context = context;
-        this.items = items;
-        this.listener = listener;
-    }}
-    
-    @NonNull
-    @Override
-    public ViewHolder onCreateViewHolder(@NonNull ViewGroup parent, int viewType) {{
-        View view = LayoutInflater.from(context).inflate(R.layout.item_layout, parent, false);
-        return new ViewHolder(view);
-    }}
-    
-    @Override
-    public void onBindViewHolder(@NonNull ViewHolder holder, int position) {{
-        Item item = items.get(position);
-        
-        holder.itemTitle.setText(item.getTitle());
-        holder.itemDescription.setText(item.getDescription());
-        holder.itemPrice.setText(item.getPrice());
-        holder.itemImage.setImageResource(item.getImageResource());
-        
-        holder.itemView.setOnClickListener(v -> {{
-            if (listener != null) {{
-                listener.onItemClick(item);
-            }}
-        }});
-        
-        holder.btnMore.setOnClickListener(v -> {{
-            if (listener != null) {{
-                listener.onMoreClick(item);
-            }}
-        }});
-    }}
-    
-    @Override
-    public int getItemCount() {{
-        return items.size();
-    }}
-    
-    public static class ViewHolder extends RecyclerView.ViewHolder {{
-        ImageView itemImage;
-        TextView itemTitle, itemDescription, itemPrice;
-        ImageButton btnMore;
-        
-        public ViewHolder(@NonNull View itemView) {{
-            super(itemView);
-            itemImage = itemView.findViewById(R.id.itemImage);
-            itemTitle = itemView.findViewById(R.id.itemTitle);
-            itemDescription = itemView.findViewById(R.id.itemDescription);
-            itemPrice = itemView.findViewById(R.id.itemPrice);
-            btnMore = itemView.findViewById(R.id.btnMore);
-        }}
-    }}
-}}
-```
-
-## 📊 **5. Item Model (Item.java):**
-```java
-package com.example.myapp.model;
-
-public class Item {{
-    private int id;
-    private String title;
-    private String description;
-    private String price;
-    private int imageResource;
-    
-    public Item(int id, String title, String description, String price, int imageResource) {{
-        this.id = id;
-        this.title = title;
-        this.description = description;
-        this.price = price;
-        this.imageResource = imageResource;
-    }}
-    
-    // Getters and Setters
-    public int getId() {{ return id; }}
-    public void setId(int id) {{ this.id = id; }}
-    
-    public String getTitle() {{ return title; }}
-    public void setTitle(String title) {{ this.title = title; }}
-    
-    public String getDescription() {{ return description; }}
-    public void setDescription(String description) {{ this.description = description; }}
-    
-    public String getPrice() {{ return price; }}
-    public void setPrice(String price) {{ this.price = price; }}
-    
-    public int getImageResource() {{ return imageResource; }}
-    public void setImageResource(int imageResource) {{ this.imageResource = imageResource; }}
-}}
-```
-
-## 🎨 **6. Renkler (colors.xml):**
-```xml
-<?xml version="1.0" encoding="utf-8"?>
-<resources>
-    <color name="primary_color">#2196F3</color>
-    <color name="primary_dark_color">#1976D2</color>
-    <color name="accent_color">#FF4081</color>
-    <color name="background_color">#F5F5F5</color>
-    <color name="text_primary">#212121</color>
-    <color name="text_secondary">#757575</color>
-    <color name="price_color">#4CAF50</color>
-</resources>
-```
-
-## 📱 **7. Strings (strings.xml):**
-```xml
-<resources>
-    <string name="app_name">My Android App</string>
-    <string name="search_hint">Ara...</string>
-    <string name="add_item">Yeni Ekle</string>
-    <string name="settings">Ayarlar</string>
-    <string name="about">Hakkında</string>
-</resources>
-```
-
-## 🚀 **Kurulum Adımları:**
-1. **Android Studio'da yeni proje oluşturun**
-2. **Tüm dosyaları ilgili klasörlere kopyalayın**
-3. **build.gradle'a gerekli dependencies'leri ekleyin:**
-```gradle
-implementation 'androidx.recyclerview:recyclerview:1.3.0'
-implementation 'androidx.cardview:cardview:1.0.0'
-implementation 'com.google.android.material:material:1.9.0'
-```
-4. **Projeyi sync edin ve çalıştırın**
-
-## ✨ **Özellikler:**
-- ✅ Modern Material Design
-- ✅ RecyclerView ile performanslı liste
-- ✅ Arama özelliği
-- ✅ Floating Action Button
-- ✅ Detay sayfasına geçiş
-- ✅ Responsive tasarım
-- ✅ Error handling
-
-Bu proje tam olarak çalışır durumda ve production-ready! 🎉"""
+        return _load_solution('android_project').replace('{query}', user_query[:50])
 
     def _create_detailed_web_frontend_project(self, user_query: str, complexity_level: str) -> str:
         """Create detailed web frontend project solution"""
-        return f"""**🌐 Detaylı Web Frontend Projesi - "{user_query[:50]}..."**
-
-## 📁 **Proje Yapısı:**
-```
-my-web-app/
-├── public/
-│   ├── index.html
-│   ├── favicon.ico
-│   └── manifest.json
-├── src/
-│   ├── components/
-│   │   ├── Header/
-│   │   │   ├── Header.jsx
-│   │   │   └── Header.css
-│   │   ├── ProductList/
-│   │   │   ├── ProductList.jsx
-│   │   │   └── ProductList.css
-│   │   └── ProductCard/
-│   │       ├── ProductCard.jsx
-│   │       └── ProductCard.css
-│   ├── pages/
-│   │   ├── Home/
-│   │   │   ├── Home.jsx
-│   │   │   └── Home.css
-│   │   └── ProductDetail/
-│   │       ├── ProductDetail.jsx
-│   │       └── ProductDetail.css
-│   ├── hooks/
-│   │   └── useProducts.js
-│   ├── services/
-│   │   └── api.js
-│   ├── utils/
-│   │   └── helpers.js
-│   ├── App.js
-│   ├── App.css
-│   └── index.js
-├── package.json
-└── README.md
-```
-
-## 🏠 **1. Ana HTML (public/index.html):**
-```html
-<!DOCTYPE html>
-<html lang="tr">
-<head>
-    <meta charset="utf-8" />
-    <link rel="icon" href="%PUBLIC_URL%/favicon.ico" />
-    <meta name="viewport" content="width=device-width, initial-scale=1" />
-    <meta name="theme-color" content="#000000" />
-    <meta name="description" content="Modern Web Uygulaması" />
-    <title>My Web App</title>
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap" rel="stylesheet">
-</head>
-<body>
-    <noscript>Bu uygulamayı çalıştırmak için JavaScript gereklidir.</noscript>
-    <div id="root"></div>
-</body>
-</html>
-```
-
-## ⚛️ **2. Ana App Component (App.js):**
-```jsx
-import React from 'react';
-import {{ BrowserRouter as Router, Routes, Route }} from 'react-router-dom';
-import Header from './components/Header/Header';
-import Home from './pages/Home/Home';
-import ProductDetail from './pages/ProductDetail/ProductDetail';
-import './App.css';
-
-function App() {{
-  return (
-    <Router>
-      <div className="App">
-        <Header />
-        <main className="main-content">
-          <Routes>
-            <Route path="/" element={{<Home />}} />
-            <Route path="/product/:id" element={{<ProductDetail />}} />
-          </Routes>
-        </main>
-      </div>
-    </Router>
-  );
-}}
-
-export default App;
-```
-
-## 🎨 **3. Ana CSS (App.css):**
-```css
-* {{
-  margin: 0;
-  padding: 0;
-  box-sizing: border-box;
-}}
-
-body {{
-  font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
-  background-color: #f8fafc;
-  color: #1a202c;
-  line-height: 1.6;
-}}
-
-.App {{
-  min-height: 100vh;
-  display: flex;
-  flex-direction: column;
-}}
-
-.main-content {{
-  flex: 1;
-  padding: 2rem;
-  max-width: 1200px;
-  margin: 0 auto;
-  width: 100%;
-}}
-
-/* Responsive Design */
-@media (max-width: 768px) {{
-  .main-content {{
-    padding: 1rem;
-  }}
-}}
-
-/* Loading Animation */
-.loading {{
-  display: flex;
-  justify-content: center;
-  align-items: center;
-  height: 200px;
-}}
-
-.spinner {{
-  width: 40px;
-  height: 40px;
-  border: 4px solid #e2e8f0;
-  border-top: 4px solid #3182ce;
-  border-radius: 50%;
-  animation: spin 1s linear infinite;
-}}
-
-@keyframes spin {{
-  0% {{ transform: rotate(0deg); }}
-  100% {{ transform: rotate(360deg); }}
-}}
-```
-
-## 🏠 **4. Home Page (pages/Home/Home.jsx):**
-```jsx
-import React, {{ useState, useEffect }} from 'react';
-import ProductList from '../../components/ProductList/ProductList';
-import {{ useProducts }} from '../../hooks/useProducts';
-import './Home.css';
-
-const Home = () => {{
-  const {{ products, loading, error }} = useProducts();
-  const [searchTerm, setSearchTerm] = useState('');
-  const [filteredProducts, setFilteredProducts] = useState([]);
-
-  useEffect(() => {{
-    if (products) {{
-      const filtered = products.filter(product =>
-        product.name.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        product.description.toLowerCase().includes(searchTerm.toLowerCase())
-      );
-      setFilteredProducts(filtered);
-    }}
-  }}, [products, searchTerm]);
-
-  if (loading) {{
-    return (
-      <div className="loading">
-        <div className="spinner"></div>
-      </div>
-    );
-  }}
-
-  if (error) {{
-    return (
-      <div className="error-message">
-        <h2>Bir hata oluştu</h2>
-        <p>{{error}}</p>
-      </div>
-    );
-  }}
-
-  return (
-    <div className="home">
-      <div className="hero-section">
-        <h1>Hoş Geldiniz</h1>
-        <p>En iyi ürünleri keşfedin</p>
-      </div>
-
-      <div className="search-section">
-        <input
-          type="text"
-          placeholder="Ürün ara..."
-          value={{searchTerm}}
-          onChange={{(e) => setSearchTerm(e.target.value)}}
-          className="search-input"
-        />
-      </div>
-
-      <ProductList products={{filteredProducts}} />
-    </div>
-  );
-}};
-
-export default Home;
-```
-
-## 📦 **5. Product List Component (components/ProductList/ProductList.jsx):**
-```jsx
-import React from 'react';
-import ProductCard from '../ProductCard/ProductCard';
-import './ProductList.css';
-
-const ProductList = ({{ products }}) => {{
-  if (!products || products.length === 0) {{
-    return (
-      <div className="no-products">
-        <h3>Ürün bulunamadı</h3>
-        <p>Arama kriterlerinizi değiştirmeyi deneyin.</p>
-      </div>
-    );
-  }}
-
-  return (
-    <div className="product-list">
-      <h2 className="section-title">Ürünler</h2>
-      <div className="products-grid">
-        {{products.map(product => (
-          <ProductCard key={{product.id}} product={{product}} />
-        ))}}
-      </div>
-    </div>
-  );
-}};
-
-export default ProductList;
-```
-
-## 🎴 **6. Product Card Component (components/ProductCard/ProductCard.jsx):**
-```jsx
-import React from 'react';
-import {{ useNavigate }} from 'react-router-dom';
-import './ProductCard.css';
-
-const ProductCard = ({{ product }}) => {{
-  const navigate = useNavigate();
-
-  const handleClick = () => {{
-    navigate(`/product/${{product.id}}`);
-  }};
-
-  return (
-    <div className="product-card" onClick={{handleClick}}>
-      <div className="product-image">
-        <img src={{product.image}} alt={{product.name}} />
-        <div className="product-badge">
-          {{product.isNew && <span className="badge new">Yeni</span>}}
-          {{product.discount && <span className="badge discount">-%{{product.discount}}</span>}}
-        </div>
-      </div>
-      
-      <div className="product-info">
-        <h3 className="product-name">{{product.name}}</h3>
-        <p className="product-description">{{product.description}}</p>
-        
-        <div className="product-price">
-          {{product.originalPrice && (
-            <span className="original-price">₺{{product.originalPrice}}</span>
-          )}}
-          <span className="current-price">₺{{product.price}}</span>
-        </div>
-        
-        <div className="product-rating">
-          <div className="stars">
-            {{[...Array(5)].map((_, i) => (
-              <span 
-                key={{i}} 
-                className={{`star ${{i < product.rating ? 'filled' : ''}}`}}
-              >
-                ★
-              </span>
-            ))}}
-          </div>
-          <span className="rating-count">({{product.reviewCount}})</span>
-        </div>
-      </div>
-    </div>
-  );
-}};
-
-export default ProductCard;
-```
-
-## 🎨 **7. Product Card CSS (components/ProductCard/ProductCard.css):**
-```css
-.product-card {{
-  background: white;
-  border-radius: 12px;
-  box-shadow: 0 2px 8px rgba(0, 0, 0, 0.1);
-  transition: all 0.3s ease;
-  cursor: pointer;
-  overflow: hidden;
-}}
-
-.product-card:hover {{
-  transform: translateY(-4px);
-  box-shadow: 0 8px 25px rgba(0, 0, 0, 0.15);
-}}
-
-.product-image {{
-  position: relative;
-  width: 100%;
-  height: 200px;
-  overflow: hidden;
-}}
-
-.product-image img {{
-  width: 100%;
-  height: 100%;
-  object-fit: cover;
-  transition: transform 0.3s ease;
-}}
-
-.product-card:hover .product-image img {{
-  transform: scale(1.05);
-}}
-
-.product-badge {{
-  position: absolute;
-  top: 12px;
-  left: 12px;
-  display: flex;
-  gap: 8px;
-}}
-
-.badge {{
-  padding: 4px 8px;
-  border-radius: 4px;
-  font-size: 12px;
-  font-weight: 600;
-  text-transform: uppercase;
-}}
-
-.badge.new {{
-  background: #48bb78;
-  color: white;
-}}
-
-.badge.discount {{
-  background: #f56565;
-  color: white;
-}}
-
-.product-info {{
-  padding: 16px;
-}}
-
-.product-name {{
-  font-size: 18px;
-  font-weight: 600;
-  margin-bottom: 8px;
-  color: #2d3748;
-}}
-
-.product-description {{
-  font-size: 14px;
-  color: #718096;
-  margin-bottom: 12px;
-  display: -webkit-box;
-  -webkit-line-clamp: 2;
-  -webkit-box-orient: vertical;
-  overflow: hidden;
-}}
-
-.product-price {{
-  display: flex;
-  align-items: center;
-  gap: 8px;
-  margin-bottom: 12px;
-}}
-
-.original-price {{
-  font-size: 14px;
-  color: #a0aec0;
-  text-decoration: line-through;
-}}
-
-.current-price {{
-  font-size: 20px;
-  font-weight: 700;
-  color: #2b6cb0;
-}}
-
-.product-rating {{
-  display: flex;
-  align-items: center;
-  gap: 8px;
-}}
-
-.stars {{
-  display: flex;
-  gap: 2px;
-}}
-
-.star {{
-  color: #e2e8f0;
-  font-size: 16px;
-}}
-
-.star.filled {{
-  color: #fbbf24;
-}}
-
-.rating-count {{
-  font-size: 12px;
-  color: #718096;
-}}
-```
-
-## 🔧 **8. Custom Hook (hooks/useProducts.js):**
-```javascript
-import {{ useState, useEffect }} from 'react';
-import {{ fetchProducts }} from '../services/api';
-
-export const useProducts = () => {{
-  const [products, setProducts] = useState([]);
-  const [loading, setLoading] = useState(true);
-  const [error, setError] = useState(null);
-
-  useEffect(() => {{
-    const loadProducts = async () => {{
-      try {{
-        setLoading(true);
-        const data = await fetchProducts();
-        setProducts(data);
-      }} catch (err) {{
-        setError(err.message);
-      }} finally {{
-        setLoading(false);
-      }}
-    }};
-
-    loadProducts();
-  }}, []);
-
-  return {{ products, loading, error }};
-}};
-```
-
-## 🌐 **9. API Service (services/api.js):**
-```javascript
-const API_BASE_URL = 'https://api.example.com';
-
-// Mock data for development
-const mockProducts = [
-  {{
-    id: 1,
-    name: 'Premium Laptop',
-    description: 'Yüksek performanslı gaming laptop',
-    price: 15999,
-    originalPrice: 17999,
-    image: 'https://via.placeholder.com/300x200',
-    rating: 4,
-    reviewCount: 128,
-    isNew: true,
-    discount: 11
-  }},
-  {{
-    id: 2,
-    name: 'Akıllı Telefon',
-    description: 'Son teknoloji akıllı telefon',
-    price: 8999,
-    image: 'https://via.placeholder.com/300x200',
-    rating: 5,
-    reviewCount: 89,
-    isNew: false
-  }},
-  // Daha fazla ürün...
-];
-
-export const fetchProducts = async () => {{
-  // Gerçek API çağrısı için:
-  // const response = await fetch(`${{API_BASE_URL}}/products`);
-  // return response.json();
-  
-  // Mock data için:
-  return new Promise((resolve) => {{
-    setTimeout(() => resolve(mockProducts), 1000);
-  }});
-}};
-
-export const fetchProductById = async (id) => {{
-  // Gerçek API çağrısı için:
-  // const response = await fetch(`${{API_BASE_URL}}/products/${{id}}`);
-  // return response.json();
-  
-  // Mock data için:
-  return new Promise((resolve) => {{
-    setTimeout(() => {{
-      const product = mockProducts.find(p => p.id === parseInt(id));
-      resolve(product);
-    }}, 500);
-  }});
-}};
-```
-
-## 📦 **10. Package.json:**
-```json
-{{
-  "name": "my-web-app",
-  "version": "1.0.0",
-  "private": true,
-  "dependencies": {{
-    "react": "^18.2.0",
-    "react-dom": "^18.2.0",
-    "react-router-dom": "^6.8.0",
-    "react-scripts": "5.0.1"
-  }},
-  "scripts": {{
-    "start": "react-scripts start",
-    "build": "react-scripts build",
-    "test": "react-scripts test",
-    "eject": "react-scripts eject"
-  }},
-  "eslintConfig": {{
-    "extends": [
-      "react-app",
-      "react-app/jest"
-    ]
-  }},
-  "browserslist": {{
-    "production": [
-      ">0.2%",
-      "not dead",
-      "not op_mini all"
-    ],
-    "development": [
-      "last 1 chrome version",
-      "last 1 firefox version",
-      "last 1 safari version"
-    ]
-  }}
-}}
-```
-
-## 🚀 **Kurulum ve Çalıştırma:**
-```bash
-# Proje oluştur
-npx create-react-app my-web-app
-cd my-web-app
-
-# Gerekli paketleri yükle
-npm install react-router-dom
-
-# Dosyaları kopyala ve düzenle
-# Uygulamayı başlat
-npm start
-```
-
-## ✨ **Özellikler:**
-- ✅ Modern React Hooks kullanımı
-- ✅ Responsive tasarım
-- ✅ Component-based architecture
-- ✅ Custom hooks
-- ✅ API integration ready
-- ✅ Loading states
-- ✅ Error handling
-- ✅ Search functionality
-- ✅ Routing
-- ✅ Modern CSS animations
-
-Bu proje production-ready ve modern web development best practices'lerini içeriyor! 🎉"""
+        return _load_solution('web_frontend_project').replace('{query}', user_query[:50])
 
     def _create_detailed_backend_project(self, user_query: str, complexity_level: str) -> str:
         """Create detailed backend project solution"""
-        return f"""**🔧 Detaylı Backend Projesi - "{user_query[:50]}..."**
-
-## 📁 **Flask Proje Yapısı:**
-```
-my-flask-app/
-├── app/
-│   ├── __init__.py
-│   ├── models/
-│   │   ├── __init__.py
-│   │   ├── user.py
-│   │   └── post.py
-│   ├── routes/
-│   │   ├── __init__.py
-│   │   ├── auth.py
-│   │   ├── main.py
-│   │   └── api.py
-│   ├── templates/
-│   │   ├── base.html
-│   │   ├── index.html
-│   │   ├── login.html
-│   │   └── post.html
-│   ├── static/
-│   │   ├── css/
-│   │   │   └── style.css
-│   │   └── js/
-│   │       └── main.js
-│   └── utils/
-│       ├── __init__.py
-│       └── helpers.py
-├── migrations/
-├── config.py
-├── requirements.txt
-├── run.py
-└── README.md
-```
-
-## 🚀 **1. Ana Uygulama (run.py):**
-```python
-from app import create_app
-from flask_migrate import upgrade
-
-app = create_app()
-
-if __name__ == '__main__':
-    with app.app_context():
-        # Database migration
-        upgrade()
-    
-    app.run(debug=True, host='0.0.0.0', port=5000)
-```
-
-## ⚙️ **2. Konfigürasyon (config.py):**
-```python
-import os
-from datetime import timedelta
-
-class Config:
-    SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key-change-in-production'
-    SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or 'sqlite:///app.db'
-    SQLALCHEMY_TRACK_MODIFICATIONS = False
-    JWT_SECRET_KEY = os.environ.get('JWT_SECRET_KEY') or 'jwt-secret-string'
-    JWT_ACCESS_TOKEN_EXPIRES = timedelta(hours=1)
-    
-    # Mail settings
-    MAIL_SERVER = os.environ.get('MAIL_SERVER')
-    MAIL_PORT = int(os.environ.get('MAIL_PORT') or 587)
-    MAIL_USE_TLS = os.environ.get('MAIL_USE_TLS', 'true').lower() in ['true', 'on', '1']
-    MAIL_USERNAME = os.environ.get('MAIL_USERNAME')
-    MAIL_PASSWORD = os.environ.get('MAIL_PASSWORD')
-    
-    # Pagination
-    POSTS_PER_PAGE = 10
-    
-class DevelopmentConfig(Config):
-    DEBUG = True
-
-class ProductionConfig(Config):
-    DEBUG = False
-
-config = {{
-    'development': DevelopmentConfig,
-    'production': ProductionConfig,
-    'default': DevelopmentConfig
-}}
-```
-
-## 🏗️ **3. App Factory (app/__init__.py):**
-```python
-from flask import Flask
-from flask_sqlalchemy import SQLAlchemy
-from flask_migrate import Migrate
-from flask_login import LoginManager
-from flask_mail import Mail
-from flask_jwt_extended import JWTManager
-from config import config
-
-db = SQLAlchemy()
-migrate = Migrate()
-login_manager = LoginManager()
-mail = Mail()
-jwt = JWTManager()
-
-def create_app(config_name='default'):
-    app = Flask(__name__)
-    app.config.from_object(config[config_name])
-    
-    # Initialize extensions
-    db.init_app(app)
-    migrate.init_app(app, db)
-    login_manager.init_app(app)
-    mail.init_app(app)
-    jwt.init_app(app)
-    
-    # Login manager settings
-    login_manager.login_view = 'auth.login'
-    login_manager.login_message = 'Lütfen giriş yapın.'
-    login_manager.login_message_category = 'info'
-    
-    # Register blueprints
-    from app.routes.main import main_bp
-    from app.routes.auth import auth_bp
-    from app.routes.api import api_bp
-    
-    app.register_blueprint(main_bp)
-    app.register_blueprint(auth_bp, url_prefix='/auth')
-    app.register_blueprint(api_bp, url_prefix='/api')
-    
-    return app
-```
-
-## 👤 **4. User Model (app/models/user.py):**
-```python
-from app import db, login_manager
-from flask_login import UserMixin
-from werkzeug.security import generate_password_hash, check_password_hash
-from datetime import datetime
-
-@login_manager.user_loader
-def load_user(user_id):
-    return User.query.get(int(user_id))
-
-class User(UserMixin, db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    username = db.Column(db.String(80), unique=True, nullable=False)
-    email = db.Column(db.String(120), unique=True, nullable=False)
-    password_hash = db.Column(db.String(128))
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    is_active = db.Column(db.Boolean, default=True)
-    
-    # Relationships
-    posts = db.relationship('Post', backref='author', lazy='dynamic')
-    
-    def set_password(self, password):
-        self.password_hash = generate_password_hash(password)
-    
-    def check_password(self, password):
-        return check_password_hash(self.password_hash, password)
-    
-    def to_dict(self):
-        return {{
-            'id': self.id,
-            'username': self.username,
-            'email': self.email,
-            'created_at': self.created_at.isoformat(),
-            'is_active': self.is_active
-        }}
-    
-    def __repr__(self):
-        return f'<User {{self.username}}>'
-```
-
-## 📝 **5. Post Model (app/models/post.py):**
-```python
-from app import db
-from datetime import datetime
-
-class Post(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    title = db.Column(db.String(200), nullable=False)
-    content = db.Column(db.Text, nullable=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    is_published = db.Column(db.Boolean, default=False)
-    
-    # Foreign key
-    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
-    
-    def to_dict(self):
-        return {{
-            'id': self.id,
-            'title': self.title,
-            'content': self.content,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat(),
-            'is_published': self.is_published,
-            'author': self.author.username
-        }}
-    
-    def __repr__(self):
-        return f'<Post {{self.title}}>'
-```
-
-## 🌐 **6. Ana Routes (app/routes/main.py):**
-```python
-from flask import Blueprint, render_template, request, flash, redirect, url_for
-from flask_login import login_required, current_user
-from app import db
-from app.models.post import Post
-
-main_bp = Blueprint('main', __name__)
-
-@main_bp.route('/')
-def index():
-    page = request.args.get('page', 1, type=int)
-    posts = Post.query.filter_by(is_published=True).order_by(
-        Post.created_at.desc()
-    ).paginate(
-        page=page, 
-        per_page=10, 
-        error_out=False
-    )
-    
-    return render_template('index.html', posts=posts)
-
-@main_bp.route('/post/<int:id>')
-def post_detail(id):
-    post = Post.query.get_or_404(id)
-    if not post.is_published and post.author != current_user:
-        flash('Bu yazıya erişim yetkiniz yok.', 'error')
-        return redirect(url_for('main.index'))
-    
-    return render_template('post.html', post=post)
-
-@main_bp.route('/create_post', methods=['GET', 'POST'])
-@login_required
-def create_post():
-    if request.method == 'POST':
-        title = request.form.get('title')
-        content = request.form.get('content')
-        is_published = request.form.get('is_published') == 'on'
-        
-        if not title or not content:
-            flash('Başlık ve içerik gereklidir.', 'error')
-            return render_template('create_post.html')
-        
-        post = Post(
-            title=title,
-            content=content,
-            is_published=is_published,
-            user_id=current_user.id
-        )
-        
-        db.session.add(post)
-        db.session.commit()
-        
-        flash('Yazı başarıyla oluşturuldu!', 'success')
-        return redirect(url_for('main.post_detail', id=post.id))
-    
-    return render_template('create_post.html')
-
-@main_bp.route('/my_posts')
-@login_required
-def my_posts():
-    page = request.args.get('page', 1, type=int)
-    posts = current_user.posts.order_by(Post.created_at.desc()).paginate(
-        page=page, 
-        per_page=10, 
-        error_out=False
-    )
-    
-    return render_template('my_posts.html', posts=posts)
-```
-
-## 🔐 **7. Auth Routes (app/routes/auth.py):**
-```python
-from flask import Blueprint, render_template, request, flash, redirect, url_for
-from flask_login import login_user, logout_user, login_required, current_user
-from app import db
-from app.models.user import User
-
-auth_bp = Blueprint('auth', __name__)
-
-@auth_bp.route('/login', methods=['GET', 'POST'])
-def login():
-    if current_user.is_authenticated:
-        return redirect(url_for('main.index'))
-    
-    if request.method == 'POST':
-        username = request.form.get('username')
-        password = request.form.get('password')
-        remember = request.form.get('remember') == 'on'
-        
-        user = User.query.filter_by(username=username).first()
-        
-        if user and user.check_password(password):
-            login_user(user, remember=remember)
-            next_page = request.args.get('next')
-            flash(f'Hoş geldiniz, {{user.username}}!', 'success')
-            return redirect(next_page) if next_page else redirect(url_for('main.index'))
-        else:
-            flash('Geçersiz kullanıcı adı veya şifre.', 'error')
-    
-    return render_template('login.html')
-
-@auth_bp.route('/register', methods=['GET', 'POST'])
-def register():
-    if current_user.is_authenticated:
-        return redirect(url_for('main.index'))
-    
-    if request.method == 'POST':
-        username = request.form.get('username')
-        email = request.form.get('email')
-        password = request.form.get('password')
-        password2 = request.form.get('password2')
-        
-        # Validation
-        if not all([username, email, password, password2]):
-            flash('Tüm alanları doldurun.', 'error')
-            return render_template('register.html')
-        
-        if password != password2:
-            flash('Şifreler eşleşmiyor.', 'error')
-            return render_template('register.html')
-        
-        if User.query.filter_by(username=username).first():
-            flash('Bu kullanıcı adı zaten kullanılıyor.', 'error')
-            return render_template('register.html')
-        
-        if User.query.filter_by(email=email).first():
-            flash('Bu e-posta adresi zaten kullanılıyor.', 'error')
-            return render_template('register.html')
-        
-        # Create user
-        user = User(username=username, email=email)
-        user.set_password(password)
-        
-        db.session.add(user)
-        db.session.commit()
-        
-        flash('Kayıt başarılı! Şimdi giriş yapabilirsiniz.', 'success')
-        return redirect(url_for('auth.login'))
-    
-    return render_template('register.html')
-
-@auth_bp.route('/logout')
-@login_required
-def logout():
-    logout_user()
-    flash('Başarıyla çıkış yaptınız.', 'info')
-    return redirect(url_for('main.index'))
-```
-
-## 🔌 **8. API Routes (app/routes/api.py):**
-```python
-from flask import Blueprint, request, jsonify
-from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity
-from app import db
-from app.models.user import User
-from app.models.post import Post
-
-api_bp = Blueprint('api', __name__)
-
-@api_bp.route('/auth/login', methods=['POST'])
-def api_login():
-    data = request.get_json()
-    
-    if not data or not data.get('username') or not data.get('password'):
-        return jsonify({{'message': 'Username and password required'}}), 400
-    
-    user = User.query.filter_by(username=data['username']).first()
-    
-    if user and user.check_password(data['password']):
-        access_token = create_access_token(identity=user.id)
-        return jsonify({{
-            'access_token': access_token,
-            'user': user.to_dict()
-        }})
-    
-    return jsonify({{'message': 'Invalid credentials'}}), 401
-
-@api_bp.route('/posts', methods=['GET'])
-def api_get_posts():
-    page = request.args.get('page', 1, type=int)
-    per_page = request.args.get('per_page', 10, type=int)
-    
-    posts = Post.query.filter_by(is_published=True).order_by(
-        Post.created_at.desc()
-    ).paginate(
-        page=page, 
-        per_page=per_page, 
-        error_out=False
-    )
-    
-    return jsonify({{
-        'posts': [post.to_dict() for post in posts.items],
-        'total': posts.total,
-        'pages': posts.pages,
-        'current_page': posts.page
-    }})
-
-@api_bp.route('/posts', methods=['POST'])
-@jwt_required()
-def api_create_post():
-    current_user_id = get_jwt_identity()
-    data = request.get_json()
-    
-    if not data or not data.get('title') or not data.get('content'):
-        return jsonify({{'message': 'Title and content required'}}), 400
-    
-    post = Post(
-        title=data['title'],
-        content=data['content'],
-        is_published=data.get('is_published', False),
-        user_id=current_user_id
-    )
-    
-    db.session.add(post)
-    db.session.commit()
-    
-    return jsonify(post.to_dict()), 201
-
-@api_bp.route('/posts/<int:id>', methods=['GET'])
-def api_get_post(id):
-    post = Post.query.get_or_404(id)
-    
-    if not post.is_published:
-        return jsonify({{'message': 'Post not found'}}), 404
-    
-    return jsonify(post.to_dict())
-
-@api_bp.route('/user/posts', methods=['GET'])
-@jwt_required()
-def api_get_user_posts():
-    current_user_id = get_jwt_identity()
-    page = request.args.get('page', 1, type=int)
-    per_page = request.args.get('per_page', 10, type=int)
-    
-    posts = Post.query.filter_by(user_id=current_user_id).order_by(
-        Post.created_at.desc()
-    ).paginate(
-        page=page, 
-        per_page=per_page, 
-        error_out=False
-    )
-    
-    return jsonify({{
-        'posts': [post.to_dict() for post in posts.items],
-        'total': posts.total,
-        'pages': posts.pages,
-        'current_page': posts.page
-    }})
-```
-
-## 📦 **9. Requirements (requirements.txt):**
-```
-Flask==2.3.3
-Flask-SQLAlchemy==3.0.5
-Flask-Migrate==4.0.5
-Flask-Login==0.6.3
-Flask-Mail==0.9.1
-Flask-JWT-Extended==4.5.3
-Werkzeug==2.3.7
-python-dotenv==1.0.0
-```
-
-## 🚀 **Kurulum ve Çalıştırma:**
-```bash
-# Virtual environment oluştur
-python -m venv venv
-source venv/bin/activate  # Linux/Mac
-# venv\\Scripts\\activate  # Windows
-
-# Paketleri yükle
-pip install -r requirements.txt
-
-# Environment variables
-export FLASK_APP=run.py
-export FLASK_ENV=development
-
-# Database migration
-flask db init
-flask db migrate -m "Initial migration"
-flask db upgrade
-
-# Uygulamayı çalıştır
-python run.py
-```
-
-## ✨ **API Endpoints:**
-- `POST /api/auth/login` - Giriş yap
-- `GET /api/posts` - Tüm yazıları listele
-- `POST /api/posts` - Yeni yazı oluştur (Auth gerekli)
-- `GET /api/posts/<id>` - Yazı detayı
-- `GET /api/user/posts` - Kullanıcının yazıları (Auth gerekli)
-
-## 🔧 **Özellikler:**
-- ✅ JWT Authentication
-- ✅ Database migrations
-- ✅ User management
-- ✅ CRUD operations
-- ✅ Pagination
-- ✅ Input validation
-- ✅ Error handling
-- ✅ RESTful API
-- ✅ Production ready
-
-Bu backend projesi tam olarak çalışır durumda ve scalable! 🎉"""
+        return _load_solution('backend_project').replace('{query}', user_query[:50])
 
     def _create_component_solution(self, user_query: str, web_content: str, project_type: str) -> str:
         """Create component-specific solution"""
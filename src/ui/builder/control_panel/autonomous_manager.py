@@ -418,6 +418,18 @@ class AutonomousLearningManager:
             if hasattr(self._scraper_instance, 'cleanup'):
                 await self._scraper_instance.cleanup()
 
+            # Loop'a bağlı paylaşılan HTTP oturumları, asyncio.run loop'u kapatmadan kapatılır
+            try:
+                from src.research.simple_web_search import close_default_search_system
+                await close_default_search_system()
+            except ImportError:
+                pass
+            try:
+                from src.research.web_scraper import close_shared_session
+                await close_shared_session()
+            except ImportError:
+                pass
+
             logger.info("✅ Async cleanup completed")
 
         except Exception as e:
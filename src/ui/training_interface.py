@@ -127,285 +127,6 @@ class ModelTrainingApp:
         }
 
 
-class TrainingInterface:
-    """
-    Training arayüzü sınıfı
-    RTX 3060 sistemi için optimize edilmiş training UI
-    """
-
-    def __init__(self, page: ft.Page):
-        """
-        Training interface başlatıcısı
-
-        Args:
-            page: Flet page objesi
-        """
-        self.page = page
-
-        # UI state
-        self.training_active = False
-        self.current_model = "bigcode/starcoder2-3b"
-
-        # UI bileşenleri
-        self.init_ui_components()
-
-        logger.info("🎯 Training interface hazırlandı")
-
-    def init_ui_components(self):
-        """UI bileşenlerini başlat"""
-
-        # Header bileşenleri
-        self.app_icon = ft.Icon(ft.Icons.SMART_TOY, size=40, color=ft.Colors.BLUE_400)
-        self.app_title = ft.Text("SeydappAI ModelTrainer", size=24, weight=ft.FontWeight.BOLD)
-
-        # Status bileşenleri
-        self.status_text = ft.Text("🤖 RTX 3060 + Python 3.12.10 Ready", size=16, color=ft.Colors.GREEN_400)
-        self.model_info = ft.Text(f"📦 Model: {self.current_model}", size=12, color=ft.Colors.BLUE_300)
-
-        # Progress bileşenleri
-        self.progress_bar = ft.ProgressBar(width=800, visible=False)
-        self.progress_text = ft.Text("", size=12, visible=False)
-
-        # Control buttons
-        self.start_btn = ft.ElevatedButton(
-            "🚀 Start Training",
-            on_click=self.start_training,
-            bgcolor=ft.Colors.GREEN_600,
-            width=150
-        )
-
-        self.stop_btn = ft.ElevatedButton(
-            "⏹️ Stop Training",
-            on_click=self.stop_training,
-            bgcolor=ft.Colors.RED_600,
-            width=150,
-            disabled=True
-        )
-
-        self.settings_btn = ft.ElevatedButton(
-            "⚙️ Settings",
-            on_click=self.open_settings,
-            bgcolor=ft.Colors.BLUE_600,
-            width=150
-        )
-
-        # Log area
-        self.log_area = ft.ListView(
-            height=300,
-            width=800,
-            spacing=2
-        )
-
-        # Initial log message
-        self.add_log("🎉 SeydappAI ModelTrainer başlatıldı")
-        self.add_log(f"🖥️ GPU: RTX 3060 (11.6GB VRAM)")
-        self.add_log(f"⚡ CUDA: 12.9 + PyTorch 2.8.0+cu128")
-
-    def build_ui(self) -> ft.Container:
-        """
-        Ana UI layout'unu oluştur
-
-        Returns:
-            ft.Container: Tam UI container
-        """
-        return ft.Container(
-            content=ft.Column([
-                # Header Section
-                ft.Container(
-                    content=ft.Row([
-                        self.app_icon,
-                        ft.Column([
-                            self.app_title,
-                            ft.Text("StarCoder2 Conversation Training Toolkit", size=12, color=ft.Colors.GREY_400)
-                        ], spacing=5)
-                    ]),
-                    padding=ft.padding.all(20),
-                    bgcolor=ft.Colors.GREY_900,
-                    border_radius=10
-                ),
-
-                # Status Section
-                ft.Container(
-                    content=ft.Column([
-                        self.status_text,
-                        self.model_info,
-                        ft.Divider()
-                    ]),
-                    padding=10
-                ),
-
-                # Progress Section
-                ft.Container(
-                    content=ft.Column([
-                        self.progress_bar,
-                        self.progress_text
-                    ]),
-                    padding=10
-                ),
-
-                # Control Buttons
-                ft.Container(
-                    content=ft.Row([
-                        self.start_btn,
-                        self.stop_btn,
-                        self.settings_btn
-                    ], spacing=20),
-                    padding=10
-                ),
-
-                # Log Section
-                ft.Container(
-                    content=ft.Column([
-                        ft.Text("📝 Training Logs", size=16, weight=ft.FontWeight.BOLD),
-                        ft.Container(
-                            content=self.log_area,
-                            border=ft.border.all(1, ft.Colors.GREY_600),
-                            border_radius=5,
-                            padding=10
-                        )
-                    ]),
-                    padding=10
-                )
-            ], spacing=10),
-            padding=20
-        )
-
-    def start_training(self, e):
-        """Training başlat"""
-        if not self.training_active:
-            self.training_active = True
-            self.start_btn.disabled = True
-            self.stop_btn.disabled = False
-            self.progress_bar.visible = True
-            self.progress_text.visible = True
-
-            self.update_status("🔄 Training başlatılıyor...")
-            self.add_log("🚀 StarCoder2-3b training başlatıldı")
-            self.add_log("🎯 RTX 3060 optimized settings aktif")
-
-            # UI güncelle
-            self.page.update()
-
-            logger.info("🚀 Training başlatıldı")
-
-    def stop_training(self, e):
-        """Training durdur"""
-        if self.training_active:
-            self.training_active = False
-            self.start_btn.disabled = False
-            self.stop_btn.disabled = True
-            self.progress_bar.visible = False
-            self.progress_text.visible = False
-
-            self.update_status("⏹️ Training durduruldu")
-            self.add_log("⏹️ Training işlemi kullanıcı tarafından durduruldu")
-
-            # UI güncelle
-            self.page.update()
-
-            logger.info("⏹️ Training durduruldu")
-
-    def open_settings(self, e):
-        """Ayarlar penceresini aç"""
-        self.add_log("⚙️ Ayarlar menüsü açılıyor...")
-        logger.info("⚙️ Settings penceresi açıldı")
-
-    def update_status(self, message: str):
-        """Status mesajını güncelle"""
-        self.status_text.value = message
-        self.status_text.Color = ft.Colors.YELLOW_400 if "🔄" in message else ft.Colors.GREEN_400
-        self.page.update()
-
-    def add_log(self, message: str):
-        """Log mesajı ekle"""
-        from datetime import datetime
-        timestamp = datetime.now().strftime("%H:%M:%S")
-
-        log_entry = ft.Text(
-            f"[{timestamp}] {message}",
-            size=11,
-            color=ft.Colors.WHITE70
-        )
-
-        self.log_area.controls.append(log_entry)
-
-        # Maksimum 100 log mesajı tut (performance için)
-        if len(self.log_area.controls) > 100:
-            self.log_area.controls.pop(0)
-
-        # Auto-scroll en alta
-        if hasattr(self.log_area, 'scroll_to'):
-            self.log_area.scroll_to(offset=-1)
-
-
-# ===============================================================================
-# 🏁 EXPORT FUNCTIONS (main.py uyumluluğu için)
-# ===============================================================================
-
-def create_training_interface(page: ft.Page) -> TrainingInterface:
-    """
-    Training interface factory function
-
-    Args:
-        page: Flet page objesi
-
-    Returns:
-        TrainingInterface: Hazırlanmış training interface
-    """
-    return TrainingInterface(page)
-
-
-def create_model_training_app() -> ModelTrainingApp:
-    """
-    Model training app factory function
-    main.py tarafından kullanılır
-
-    Returns:
-        ModelTrainingApp: Hazırlanmış training app
-    """
-    return ModelTrainingApp()
-
-
-# Ana çalıştırma fonksiyonu (standalone test için)
-def main(page: ft.Page):
-    """
-    Standalone Flet uygulaması (test için)
-    """
-    try:
-        app = ModelTrainingApp()
-        app.initialize_ui(page)
-        logger.info("🎉 Standalone training interface başlatıldı")
-    except Exception as e:
-        logger.error(f"❌ Training interface hatası: {e}")
-
-
-# ===============================================================================
-# 🔧 MODULE EXPORTS (main.py için gerekli)
-# ===============================================================================
-
-# main.py'nin import edebilmesi için sınıfları export et
-__all__ = [
-    'ModelTrainingApp',
-    'TrainingInterface',
-    'create_training_interface',
-    'create_model_training_app',
-    'main'
-]
-
-if __name__ == "__main__":
-    """
-    Development test için - dosyayı direkt çalıştırabilirsiniz
-    """
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
-
-    logger.info("🔍 Training interface standalone test...")
-
-    # Flet uygulamasını başlat
-    ft.app(target=main)
-
 class TrainingInterface:
     """
     Ana training arayüzü sınıfı
@@ -528,6 +249,10 @@ class TrainingInterface:
             self.log_area.controls.pop(0)
 
 
+# ===============================================================================
+# 🏁 EXPORT FUNCTIONS (main.py uyumluluğu için)
+# ===============================================================================
+
 def create_training_interface(page: ft.Page) -> TrainingInterface:
     """
     Training interface factory function
@@ -547,6 +272,17 @@ def create_training_interface(page: ft.Page) -> TrainingInterface:
     return interface
 
 
+def create_model_training_app() -> ModelTrainingApp:
+    """
+    Model training app factory function
+    main.py tarafından kullanılır
+
+    Returns:
+        ModelTrainingApp: Hazırlanmış training app
+    """
+    return ModelTrainingApp()
+
+
 # Ana çalıştırma fonksiyonu
 def main(page: ft.Page):
     """
@@ -559,12 +295,30 @@ def main(page: ft.Page):
         logger.error(f"❌ Training interface hatası: {e}")
 
 
+# ===============================================================================
+# 🔧 MODULE EXPORTS (main.py için gerekli)
+# ===============================================================================
+
+# main.py'nin import edebilmesi için sınıfları export et
+__all__ = [
+    'ModelTrainingApp',
+    'TrainingInterface',
+    'create_training_interface',
+    'create_model_training_app',
+    'main'
+]
+
+
 if __name__ == "__main__":
     """
-    Development test için
+    Development test için - dosyayı direkt çalıştırabilirsiniz
     """
-    logging.basicConfig(level=logging.INFO)
-    logger.info("🔍 Training interface test başlatılıyor...")
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    logger.info("🔍 Training interface standalone test...")
 
     # Flet uygulamasını başlat
     ft.app(target=main)
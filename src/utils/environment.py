@@ -12,6 +12,7 @@ Bu modül aşağıdaki işlevleri sağlar:
 - Otomatik bağımlılık kurulum desteği
 """
 
+import os
 import sys
 import subprocess
 import platform
@@ -671,6 +672,24 @@ def validate_environment_on_startup() -> bool:
         logger.error(f"❌ Environment validation error: {e}")
         return False
 
+# ===============================================================================
+# ⚙️ TRAINING ANAHTARLARI
+# ===============================================================================
+
+# CUDA caching allocator ayarı: tüm giriş noktaları aynı değeri setdefault ile verir,
+# böylece sonuç import sırasına bağlı olmaz. expandable_segments segmentleri ihtiyaç
+# oldukça büyütür; max_split_size_mb bilerek verilmez (parçalı ayırmaya yol açar)
+CUDA_ALLOC_CONF = 'expandable_segments:True,garbage_collection_threshold:0.8'
+
+def lora_compile_requested() -> bool:
+    """
+    LoRA training'de torch.compile isteniyor mu (COMPILE_LORA=1 ile opt-in)
+
+    bnb 4-bit katmanlar graph break üretir; kısa koşularda derleme ısınması
+    nadiren geri kazanılır, bu yüzden varsayılan kapalıdır.
+    """
+    return os.getenv('COMPILE_LORA', '0') == '1'
+
 # ===============================================================================
 # 🏁 MAIN EXECUTION (Test için)
 # ===============================================================================